@@ -15,11 +15,14 @@
 #   python3 -m manim 03_corresponding_angles.py CorrespondingAngles01 --resolution 360,640 -pl
 #   python3 -m manim 03_corresponding_angles.py CorrespondingAngles01 --resolution 360,640 -i --high_quality
 # -i as gif
+# Updater profile (time per updater; MANIM_PROFILE_UPDATERS=alloc also measures allocations)
+#   MANIM_PROFILE_UPDATERS=1 python3 -m manim 03_corresponding_angles.py CorrespondingAngles01 --resolution 360,640 -pl
 
 
 from manimlib.imports import *
 import os, copy
 import pyclbr
+import myutil
 
 
 class Glue_obj_side_updater(object):
@@ -99,8 +102,8 @@ class Intersection_point_e_updater_by_line_position(object):
 
     This follows the ab's position change.
 
-    Currently, assume m_ab is constant and = 0 (horizontal line)
-    (TODO: m_ab is constant but can be non-zero)
+    The line AB's slope is the line's angle, the line CD's slope is the
+    value tracker's angle. (myutil.get_angle_line_intersection)
 
     Where
       * the line AB: y = m_ab x + o_ab
@@ -154,12 +157,11 @@ class Intersection_point_e_updater_by_line_position(object):
         # theta = self.__cd_slope_value_tracker[0].get_value()
         theta = self.__cd_slope_value_tracker.get_value()
         # print(theta)
-        e_pos_x = 0.0
-        e_pos_y = self.__line_ab.get_center()[1]
-        if (math.fabs(theta - (math.pi/2.0)) > 0.001):
-            e_pos_x = (self.__line_ab.get_center()[1] - self.__line_cd.get_center()[1]) / math.tan(theta)
-
-        e_pos = np.array((e_pos_x, e_pos_y, 0.0))
+        e_pos = myutil.get_angle_line_intersection(self.__line_ab.get_center(), self.__line_ab.get_angle(),
+                                                   self.__line_cd.get_center(), theta)
+        if (e_pos is None):
+            # parallel: no intersection, stay
+            return
         follower_obj.move_to(e_pos)
 
 
@@ -183,12 +185,9 @@ class Intersection_point_e_updater_by_line_ab_2_rotation(object):
       * m_cd: slope of line CD
       * O_cd: origin, the center point, of the line segment CD (O_cd_x, O_cd_y, 0.0)
 
-    O_ab, O_cd: y intersepts
-    E_x = (O_ab - O_cd)/(m_cd - m_ab)
-    E_y = (m_cd O_ab - m_ab O_cd)/(m_cd - m_ab)
-    Where m_cd != m_ab
-    m_cd = tan(theta_cd)
-    m_ab = tan(theta_ab)
+    E is the homogeneous intersection of the line through O_ab with angle
+    theta_ab and the line through O_cd with angle theta_cd
+    (myutil.get_angle_line_intersection.) E stays when they are parallel.
 
 
                    + D
@@ -230,17 +229,12 @@ class Intersection_point_e_updater_by_line_ab_2_rotation(object):
         theta_cd = self.__cd_slope_value_tracker.get_value()
         # print(theta_ab)
 
-        O_ab = self.__line_ab.get_center()[1]
-        O_cd = self.__line_cd.get_center()[1]
-
-        # No check for thera_ab, theta_cd: not +-pi/2 && thera_ab != theta_cd
-        m_ab = math.tan(theta_ab)
-        m_cd = math.tan(theta_cd)
-
-        e_x = (O_ab - O_cd)/(m_cd - m_ab)
-        e_y = (m_cd * O_ab - m_ab * O_cd)/(m_cd - m_ab)
-
-        e_pos = np.array((e_x, e_y, 0.0))
+        # homogeneous intersection: no tan(), vertical lines are fine
+        e_pos = myutil.get_angle_line_intersection(self.__line_ab.get_center(), theta_ab,
+                                                   self.__line_cd.get_center(), theta_cd)
+        if (e_pos is None):
+            # parallel: no intersection, stay
+            return
         follower_obj.move_to(e_pos)
 
 
@@ -303,28 +297,20 @@ class Intersection_arc_updater_all_calc(object):
         function with this method.  (Note: A closure will work, too.)
         See Effective python: Item 15, Item 23.
 
-        param[in] arc_obj arc object which location is the intersection
+        param[in] arc_obj angle marker (myutil.Angle_marker) which location is the intersection
                           point of line_ab and line_cd
 
         """
         # theta = self.__cd_slope_value_tracker[0].get_value()
         theta = self.__cd_slope_value_tracker.get_value()
         # print(theta)
-        e_pos_x = 0.0
-        e_pos_y = self.__O_ab[1]
-        if (math.fabs(theta - (math.pi/2.0)) > 0.001):
-            e_pos_x = (self.__O_ab[1] - self.__O_cd[1]) / math.tan(theta)
-
-        e_pos = np.array((e_pos_x, e_pos_y, 0.0))
+        e_pos = myutil.get_angle_line_intersection(self.__O_ab, 0.0, self.__O_cd, theta)
         # print("dot_e: {0}, e_pos: {1}".format(self.__dot_e.get_center(), e_pos))
-        arc_obj.become(
-            Arc(
-                start_angle = 0.0,
-                angle       = theta,
-                radius      = 0.7,
-                color       = WHITE,
-                arc_center  = self.__dot_e.get_center()
-            )
+        arc_obj.set_angle(
+            vertex      = self.__dot_e.get_center(),
+            start_angle = 0.0,
+            angle       = theta,
+            radius      = 0.7
         )
         # follower_obj.move_to(e_pos)
 
@@ -350,6 +336,7 @@ class Intersection_arc_updater_follow_dot(object):
         self.__start_angle            = start_angle
         self.__radius                 = radius
         self.__color                  = color
+        self.__is_color_set           = False
         # print("init: dot_e: {0}".format(dot_e.get_arc_center()))
 
     def __call__(self, arc_obj):
@@ -357,21 +344,21 @@ class Intersection_arc_updater_follow_dot(object):
         function with this method.  (Note: A closure will work, too.)
         See Effective python: Item 15, Item 23.
 
-        param[in] arc_obj arc object which location is the intersection
+        param[in] arc_obj angle marker (myutil.Angle_marker) which location is the intersection
                           point of line_ab and line_cd
 
         """
         # theta = self.__cd_slope_value_tracker[0].get_value()
         theta = self.__cd_slope_value_tracker.get_value()
         # print("dot_e: {0}".format(self.__dot_e.get_center())) # get_arc_center() has a problem. warning
-        arc_obj.become(
-            Arc(
-                start_angle = self.__start_angle,
-                angle       = theta,
-                radius      = self.__radius,
-                color       = self.__color,
-                arc_center  = self.__dot_e.get_center()
-            )
+        if (not self.__is_color_set):
+            arc_obj.set_stroke(color=self.__color)
+            self.__is_color_set = True
+        arc_obj.set_angle(
+            vertex      = self.__dot_e.get_center(),
+            start_angle = self.__start_angle,
+            angle       = theta,
+            radius      = self.__radius
         )
 
 
@@ -398,6 +385,7 @@ class Intersection_arc_updater_follow_dot_angle(object):
         self.__dot_e                  = dot_e
         self.__radius                 = radius
         self.__color                  = color
+        self.__is_color_set           = False
         # print("init: dot_e: {0}".format(dot_e.get_arc_center()))
 
     def __call__(self, arc_obj):
@@ -405,7 +393,7 @@ class Intersection_arc_updater_follow_dot_angle(object):
         function with this method.  (Note: A closure will work, too.)
         See Effective python: Item 15, Item 23.
 
-        param[in] arc_obj arc object which location is the intersection
+        param[in] arc_obj angle marker (myutil.Angle_marker) which location is the intersection
                           point of line_ab and line_cd
 
         """
@@ -414,14 +402,14 @@ class Intersection_arc_updater_follow_dot_angle(object):
         slope_cd = self.__cd_slope_value_tracker.get_value()
         # print("dot_e: {0}".format(self.__dot_e.get_center())) # get_arc_center() has a problem. warning
         # print("slope_ab: {0}, slope_cd: {1}".format(slope_ab, slope_cd))
-        arc_obj.become(
-            Arc(
-                start_angle =  slope_ab,
-                angle       = -slope_ab + slope_cd,
-                radius      = self.__radius,
-                color       = self.__color,
-                arc_center  = self.__dot_e.get_center()
-            )
+        if (not self.__is_color_set):
+            arc_obj.set_stroke(color=self.__color)
+            self.__is_color_set = True
+        arc_obj.set_angle(
+            vertex      = self.__dot_e.get_center(),
+            start_angle =  slope_ab,
+            angle       = -slope_ab + slope_cd,
+            radius      = self.__radius
         )
 
 
@@ -444,6 +432,7 @@ def play_create_and_fade_in(self_obj, mobj_dict):
     self_obj.play(*play_list)
 
 
+@myutil.profile_updaters
 class CorrespondingAngles01(Scene):
     """03. What is corresponding angles
     """
@@ -535,12 +524,12 @@ class CorrespondingAngles01(Scene):
         dot_e_1       = Dot(point=ORIGIN + DOWN, color=GREEN)
         tex_e_1       = TexMobject(r"E",      color=GREEN).next_to(dot_e_1, DOWN, buff=MED_SMALL_BUFF)
         tex_alpha_1   = TexMobject(r"\alpha", color=WHITE).next_to(dot_e_1, LEFT, buff=MED_SMALL_BUFF)
-        arc_alpha_1 = Arc(
-            start_angle = line_ab_1.get_angle(),
-            angle       = PI,
+        arc_alpha_1 = myutil.Angle_marker(
+            self.arc_center_1,
+            line_ab_1.get_angle(),
+            PI,
             radius      = self.radius,
-            color       = self.radius_color_1,
-            arc_center  = self.arc_center_1
+            color       = self.radius_color_1
         )
 
         # point e updater setup
@@ -590,12 +579,12 @@ class CorrespondingAngles01(Scene):
         dot_e_2       = Dot(point=ORIGIN + DOWN, color=GREEN)
         tex_e_2       = TexMobject(r"E'",      color=GREEN).next_to(dot_e_2, DOWN, buff=MED_SMALL_BUFF)
         tex_alpha_2   = TexMobject(r"\alpha'", color=WHITE).next_to(dot_e_2, LEFT, buff=MED_SMALL_BUFF)
-        arc_alpha_2 = Arc(
-            start_angle = line_ab_2.get_angle(),
-            angle       = PI,
+        arc_alpha_2 = myutil.Angle_marker(
+            self.arc_center_1,                 # same to alpha 1
+            line_ab_2.get_angle(),
+            PI,
             radius      = self.radius,
-            color       = self.radius_color_1, # same to alpha 1
-            arc_center  = self.arc_center_1    # same to alpha 1
+            color       = self.radius_color_1  # same to alpha 1
         )
 
         dot_e_2.add_updater(Intersection_point_e_updater_by_line_position(line_ab_2, theta, line_cd))
@@ -20,6 +20,7 @@
 from manimlib.imports import *
 import os, copy
 import pyclbr
+import myutil
 
 
 def get_fadeout_mobject_list(group_mobj, fadeout_key_list, is_print=False):
@@ -35,75 +36,6 @@ def get_fadeout_mobject_list(group_mobj, fadeout_key_list, is_print=False):
 
 
 
-class NoLineIntersection(Exception):
-    """No line intersection case exception"""
-
-    def __init__(self, reason):
-        """No intersection reason: expecting {"parallel", "co-linear"}
-        """
-        self.reason = reason
-
-    def __str__(self):
-        return repr(self.reason)
-
-
-def intersect_point_of_lines(line_1, line_2):
-    """Get line intersection point of line_1 and line_2
-
-    The line's angle is normalized in [-PI/2, PI/2]
-    @param[in] line_1 a Line MObject 1
-    @param[in] line_2 a Line MObject 2
-    @return The intersection point of line_1 and line_2. None when no intersection point
-    """
-    eps = 0.001
-
-    def is_perpendicular(theta):
-        assert((-math.pi <= theta) and (theta <= math.pi))
-        if (math.fabs(theta - (math.pi / 2.0)) < eps):
-            print('1: theta: {0}'.format(theta))
-            return True
-        if (math.fabs(theta + (math.pi / 2.0)) < eps):
-            print('2: theta: {0}'.format(theta))
-            return True
-        return False
-
-    theta_1 = line_1.get_angle()
-    theta_2 = line_2.get_angle()
-
-    # check parallel (no unique intersection point when co-linear, treat it as parallel)
-    if (math.fabs(theta_1 - theta_2) < eps):
-        return None
-
-    # check vertical line: assume 0 <= thera <= 2pi
-    if (is_perpendicular(theta_1)):
-        # print("line_1: perpendicular")
-        x_1 = line_1.get_center()[0]
-        y_2 = line_2.get_center()[1]
-        return np.array((x_1, y_2, 0.0))
-
-    if (is_perpendicular(theta_2)):
-        # print("line_2: perpendicular")
-        x_2 = line_2.get_center()[0]
-        y_1 = line_1.get_center()[1]
-        return np.array((x_2, y_1, 0.0))
-
-    # Now, lines are not parallel, none of the slopes is vertical
-
-    # slopes and y-intercepts
-    m_1 = math.tan(theta_1)
-    m_2 = math.tan(theta_2)
-
-    b_1 = line_1.get_center()[1] - m_1 * line_1.get_center()[0]
-    b_2 = line_2.get_center()[1] - m_2 * line_2.get_center()[0]
-
-    # intersection point
-    x_int = -(b_1 - b_2)/(m_1 - m_2)
-    y_int = (m_1 * b_2 - m_2 * b_1)/(m_1 - m_2)
-
-    p_int = np.array((x_int, y_int, 0.0))
-    return p_int
-
-
 def play_create_and_fade_in(self_obj, mobj_dict):
     """
     Create MObject with ShowCreation and TexMobject/TextObject with FadeIn (FadeInFromDown is also an candidate)
@@ -227,7 +159,7 @@ class AlternateAngles01(Scene):
             line_1 = line_paires[i][0]
             line_2 = line_paires[i][1]
             # print(line_1.get_center(), line_2.get_center())
-            p_int = intersect_point_of_lines(line_1, line_2)
+            p_int = myutil.intersect_line_mobjects(line_1, line_2)
             if (p_int is not None):
                 # print(p_int)
                 # There is an intersection point
@@ -310,7 +242,7 @@ class AlternateAngles01(Scene):
         line_gh        = Line(line_gh_start, line_gh_end, color=self.line_gh_color).move_to(line_gh_origin)
         line_gh.rotate(PI/4.0)
 
-        pos_vert_int    = intersect_point_of_lines(line_ef, line_gh)
+        pos_vert_int    = myutil.intersect_line_mobjects(line_ef, line_gh)
         dot_vert_int    = Dot(point=pos_vert_int, color=GREEN)
         arc_vert_beta_1 = Arc(
             start_angle = line_ef.get_angle(),
@@ -682,8 +614,8 @@ class AlternateAngles01(Scene):
         line_ab_1 = group_corresponding_angles["line_ab_1"]
         line_ab_2 = group_corresponding_angles["line_ab_2"]
         line_cd   = group_corresponding_angles["line_cd"]
-        p_1 = intersect_point_of_lines(line_ab_1, line_cd)
-        p_2 = intersect_point_of_lines(line_ab_2, line_cd)
+        p_1 = myutil.intersect_line_mobjects(line_ab_1, line_cd)
+        p_2 = myutil.intersect_line_mobjects(line_ab_2, line_cd)
 
         another_angle_color = ORANGE # MAROON_A, PURPLE_A, TEAL_A
         another_arc_radius  = self.arc_corr_1_radius - 0.2
@@ -15,12 +15,16 @@
 #   python3 -m manim 06_corner_cube_proof.py CornerReflection01 --resolution 360,640 -pl
 #   python3 -m manim 06_corner_cube_proof.py CornerReflection01 --resolution 360,640 -i --high_quality
 # -i as gif
+# Preview from a section (the former sections are fast-forwarded)
+#   MANIM_START_SECTION=animate_show_lower_2_theta python3 -m manim 06_corner_cube_proof.py CornerReflection01 --resolution 360,640 -pl
 
 
 from manimlib.imports import *
 import os, copy
 import pyclbr
+import myutil
 
+@myutil.time_phases
 class CornerReflection01(Scene):
     """06. corner cube reflection 01
     """
@@ -31,6 +35,8 @@ class CornerReflection01(Scene):
         "wait_time":         1,
         #   Each animation skip to the end state of the part of animation
         "is_skip_to_end":    False,
+        #   Fast-forward (no rendering) until this animate_* section (or env MANIM_START_SECTION)
+        "start_section":     None,
 
         #-- shared MObjects
 
@@ -89,7 +95,6 @@ class CornerReflection01(Scene):
         #   arc_2_theta[2]
         #   tex_2_theta[2]
         "arc_theta":                 None,
-        "arc_theta_pos_offset":      None,
         "arc_theta_radius":          1.0,
         "arc_theta_color":           YELLOW,
         "tex_theta":                 None,
@@ -103,7 +108,6 @@ class CornerReflection01(Scene):
         "tex_angle_x":               None,
         "tex_angle_y":               None,
         "arc_2_theta":               None,
-        "arc_2_theta_pos_offset":    None,
         "arc_2_theta_radius":        1.0,
         "arc_2_theta_color":         WHITE,
         "tex_2_theta":               None,
@@ -461,38 +465,18 @@ class CornerReflection01(Scene):
         #----- theta-s
         theta = self.ray_1_theta
         self.arc_theta            = []
-        self.arc_theta_pos_offset = []
         self.tex_theta            = []
         # reflection points array
         arc_origin_ary = [self.get_r1, self.get_r1, self.get_r2, self.get_r2, self.get_r2]
         for i in range(0,5):
-            # arc
+            # arc: angle marker at the reflection point (arc's circle center)
             (arc_start, arc_angle) = self.get_arc_theta_n(i, theta)
             self.arc_theta.append(
-                Arc(
-                    start_angle = arc_start,
-                    angle       = arc_angle,
+                myutil.Angle_marker(
+                    arc_origin_ary[i](), arc_start, arc_angle,
                     radius      = self.arc_theta_radius,
-                    color       = self.arc_theta_color,
-                    arc_center  = ORIGIN # initial center of the arc is at ORIGIN
+                    color       = self.arc_theta_color
                 ))
-            # Initialize self.arc_theta_pos_offset
-            #
-            # Arc's center is the arc object center, not the arc (circle)'s center
-            # Now the arc_center of all arcs are at the ORIGIN, thus,
-            # get_center() gives an offset from the center.
-            #          ___
-            #             \_
-            #               \
-            #                | arc
-            #  ORIGIN *   +   \
-            #             arc.get_center()
-            #         |<->|
-            #           offset
-            #
-            self.arc_theta_pos_offset.append(self.arc_theta[i].get_center())
-            arc_center = arc_origin_ary[i]() + self.arc_theta_pos_offset[i]
-            self.arc_theta[i].move_to(arc_center)
 
             # tex (\theta), when visualize which one, use the next line
             #     tex_str = r"\theta_{0}".format(i)
@@ -512,24 +496,17 @@ class CornerReflection01(Scene):
 
         #----- 2 theta-s
         self.arc_2_theta            = []
-        self.arc_2_theta_pos_offset = []
         self.tex_2_theta            = []
         arc_2_theta_origin_ary = [self.get_r1, self.get_r2]
         for i in range(0,2):
             # arc
             (arc_start, arc_angle) = self.get_arc_2_theta_n(i, theta)
             self.arc_2_theta.append(
-                Arc(
-                    start_angle = arc_start,
-                    angle       = arc_angle,
+                myutil.Angle_marker(
+                    arc_2_theta_origin_ary[i](), arc_start, arc_angle,
                     radius      = self.arc_2_theta_radius,
-                    color       = self.arc_2_theta_color,
-                    arc_center  = ORIGIN
+                    color       = self.arc_2_theta_color
                 ))
-            # Arc's center is the arc object center, not the arc (circle)'s center
-            self.arc_2_theta_pos_offset.append(self.arc_2_theta[i].get_center())
-            arc_2_theta_center = arc_2_theta_origin_ary[i]() + self.arc_2_theta_pos_offset[i]
-            self.arc_2_theta[i].move_to(arc_2_theta_center)
 
             # tex (\theta), when visualize which one, use the next line
             # tex_str = r"2\theta_{0}".format(i)
@@ -609,6 +586,7 @@ class CornerReflection01(Scene):
 
 
 
+    @myutil.animate_section
     def animate_setup(self):
         """Start the setup: the corner reflector: T1
         """
@@ -629,6 +607,7 @@ class CornerReflection01(Scene):
         self.wait(self.wait_time)
 
 
+    @myutil.animate_section
     def animate_incident_ray(self):
         """
         Incident ray: T2
@@ -682,6 +661,7 @@ class CornerReflection01(Scene):
 
 
 
+    @myutil.animate_section
     def animate_reflection_1_ray(self):
         """
         Incident ray 1: T7
@@ -709,6 +689,7 @@ class CornerReflection01(Scene):
         self.wait(self.wait_time)
 
 
+    @myutil.animate_section
     def animate_reflection_2_ray(self):
         """
         Reflection ray 1, ray 2, Show the angle x and l1||l2 again: T9
@@ -792,6 +773,7 @@ class CornerReflection01(Scene):
         self.wait(self.wait_time)
 
 
+    @myutil.animate_section
     def animate_2nd_reflection_y_theta(self):
         """
         T15-1: show angle y
@@ -811,6 +793,7 @@ class CornerReflection01(Scene):
         self.wait(self.wait_time)
 
 
+    @myutil.animate_section
     def animate_show_upper_2_theta(self):
         """
         Show upper (2*theta)
@@ -914,6 +897,7 @@ class CornerReflection01(Scene):
         self.wait(self.wait_time)
 
 
+    @myutil.animate_section
     def animate_show_lower_2_theta(self):
         """
         Show lower (2*theta)
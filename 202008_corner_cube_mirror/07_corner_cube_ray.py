@@ -16,33 +16,66 @@
 #   python3 -m manim 07_corner_cube_ray.py CornerCubeRay01 --resolution 360,640 -pl
 #   python3 -m manim 07_corner_cube_ray.py CornerCubeRay01 --resolution 360,640 -i --high_quality
 # -i as gif
+# Updater profile (time per updater; MANIM_PROFILE_UPDATERS=alloc also measures allocations)
+#   MANIM_PROFILE_UPDATERS=1 python3 -m manim 07_corner_cube_ray.py CornerCubeRay01 --resolution 360,640 -pl
+# Per phase timing per section (JSON)
+#   MANIM_PHASE_TIMING=timing.json python3 -m manim 07_corner_cube_ray.py CornerCubeRay01 --resolution 360,640 -pl
 
 
 from manimlib.imports import *
 import os, copy
 import pyclbr
+import myutil
 
 class ElbowRotate(VMobject):
     """manim's this version's Elbow cannot set an angle. This is an extension,
+
+    The elbow is parametric: (position, angle, width). The points are
+    written directly from them (myutil.get_elbow_points()), thus an angle
+    update is O(1) and no rotation error accumulates.
+
+    position is the bounding box center (same to move_to()). None: the
+    corner is at the ORIGIN (manim's Elbow.)
     """
     CONFIG = {
-        "width": 0.2,
-        "angle": 0,
+        "width":    0.2,
+        "angle":    0,
+        "position": None,
     }
 
     def __init__(self, **kwargs):
         VMobject.__init__(self, **kwargs)
-        self.set_points_as_corners([UP, UP + RIGHT, RIGHT])
-        self.set_width(self.width, about_point=ORIGIN)
-        self.rotate(self.angle, about_point=ORIGIN)
+
+
+    def generate_points(self):
+        self.set_points(np.zeros((8, self.dim)))
+        self.set_elbow()
+
+
+    def set_elbow(self, position=None, angle=None, width=None):
+        """set the elbow parameters and write the points. None: keep the current value
+        """
+        if (position is not None):
+            self.position = position
+        if (angle is not None):
+            self.angle = angle
+        if (width is not None):
+            self.width = width
+
+        self.set_elbow_points(myutil.get_elbow_points(self.position, self.angle, self.width)[0])
+        return self
+
+
+    def set_elbow_points(self, points):
+        """write (8, 3) points (e.g., computed by a batch update)
+        """
+        if (self.points.shape != points.shape):
+            self.points = np.zeros(points.shape)
+        self.points[:] = points
 
 
     def set_angle(self, angle):
-        self.rotate(
-            angle - self.get_angle(),
-            about_point=ORIGIN,
-        )
-        self.angle = angle
+        self.set_elbow(angle=angle)
 
     def get_angle(self):
         return self.angle
@@ -68,6 +101,60 @@ class Ray_1_position_gen(object):
         self.__init_end_pos      = np.array((self.__mirror_corner_pos[0], 0.0, 0.0))
         self.__init_theta        = init_theta
 
+        # sample table (see build_sample_table())
+        self.__sample_dt         = None
+        self.__sample_spos_ary   = None
+        self.__sample_theta_ary  = None
+        self.__sample_hit_ary    = None
+
+
+    def build_sample_table(self, frame_rate, nb_sample_per_frame = 1):
+        """
+        sample t in [0, 3] once and serve the get_ray_1_* queries from the table.
+
+        Start position and theta are piecewise linear with breaks at t = 1, 2,
+        thus the interpolation is exact when the breaks are on the samples.
+        The end position is not linear in t: it is the intersection of the
+        interpolated ray and the mirror line, which the table tells when the
+        both neighbor samples hit the same mirror.
+
+        param[in] frame_rate          scene frame rate
+        param[in] nb_sample_per_frame number of samples per frame
+        """
+        nb_sample = int(round(3.0 * frame_rate * nb_sample_per_frame)) + 1
+        assert(nb_sample >= 2)
+        t_ary = np.linspace(0.0, 3.0, nb_sample)
+
+        # build with the computing (non-table) path
+        self.__sample_dt = None
+        spos_ary  = np.array([self.get_ray_1_start_pos(t) for t in t_ary])
+        theta_ary = np.array([self.get_ray_1_thera(t)     for t in t_ary])
+        (hit_pos_ary, hit_mirror_ary, exit_vec_ary) = trace_corner_rays(self.__mirror_corner_pos,
+                                                                        spos_ary, theta_ary, nb_bounce = 1)
+        self.__sample_spos_ary  = spos_ary
+        self.__sample_theta_ary = theta_ary
+        self.__sample_hit_ary   = hit_mirror_ary[:, 0]
+        self.__sample_dt        = 3.0 / (nb_sample - 1)
+
+
+    def is_sample_table_mode(self):
+        """
+        return True when build_sample_table() has been called
+        """
+        return (self.__sample_dt is not None)
+
+
+    def get_sample_index(self, time_t):
+        """
+        get sample table index and interpolation ratio
+
+        param[in] time_t time parameter [0, 3]
+        return (idx, ratio), time_t is between sample idx and idx + 1
+        """
+        f_idx = time_t / self.__sample_dt
+        idx   = min(int(f_idx), self.__sample_spos_ary.shape[0] - 2)
+        return (idx, f_idx - idx)
+
 
     def get_ray_1_start_pos(self, time_t):
         """
@@ -78,6 +165,10 @@ class Ray_1_position_gen(object):
         # animation assumption: t in [0, 3]
         assert((time_t >= 0.0) and (time_t <= 3.0))
 
+        if (self.is_sample_table_mode()):
+            (idx, ratio) = self.get_sample_index(time_t)
+            return interpolate(self.__sample_spos_ary[idx], self.__sample_spos_ary[idx + 1], ratio)
+
         # only x changes: piecewise linear
         coef_1 =  1.5
         coef_2 = -2.0
@@ -109,6 +200,10 @@ class Ray_1_position_gen(object):
         # animation assumption: t in [0, 3]
         assert((time_t >= 0.0) and (time_t <= 3.0))
 
+        if (self.is_sample_table_mode()):
+            (idx, ratio) = self.get_sample_index(time_t)
+            return interpolate(self.__sample_theta_ary[idx], self.__sample_theta_ary[idx + 1], ratio)
+
         theta_start_1 = self.__init_theta
         theta_end_1   = PI/2 + np.arctan(2.5/5)
 
@@ -150,6 +245,16 @@ class Ray_1_position_gen(object):
         # ray direction vector
         rvec = np.array((np.cos(theta), np.sin(theta), 0.0))
 
+        if (self.is_sample_table_mode()):
+            (idx, ratio) = self.get_sample_index(time_t)
+            hit_mirror = self.__sample_hit_ary[idx]
+            if (hit_mirror == self.__sample_hit_ary[idx + 1]):
+                # both samples hit the same mirror: intersect only with its line
+                if (hit_mirror == MIRROR_HIT_LEFT):
+                    return spos + ((self.__mirror_corner_pos[0] - spos[0]) / rvec[0]) * rvec
+                if (hit_mirror == MIRROR_HIT_TOP):
+                    return spos + ((self.__mirror_corner_pos[1] - spos[1]) / rvec[1]) * rvec
+
         # compute vector length when the ray hits to the left mirror
         m_x    = self.__mirror_corner_pos[0]
         k_left = (m_x - spos[0]) / rvec[0]
@@ -336,6 +441,105 @@ class Ray_3_position_gen(object):
             return r3_epos
 
 
+# hit mirror id of trace_corner_rays()
+MIRROR_HIT_NONE   = -1
+MIRROR_HIT_LEFT   =  0
+MIRROR_HIT_TOP    =  1
+MIRROR_HIT_CORNER =  2
+
+def trace_corner_rays(mirror_corner_pos, start_pos_ary, theta_ary, nb_bounce = 2, eps = 0.001):
+    """Batch version of Ray_{1,2}_position_gen: trace N rays at once.
+
+             mirror_corner_pos (cx, cy)
+             +------------------- top mirror  (y = cy)
+             |
+             |  ray (start_pos, theta)
+             |
+             left mirror (x = cx)
+
+    Both mirrors are considered as infinite lines, the same as
+    Ray_1_position_gen.get_ray_1_end_pos(). No Python loop per ray.
+
+    param[in] mirror_corner_pos the corner point of the mirror
+    param[in] start_pos_ary     (N, 3) ray start positions
+    param[in] theta_ary         (N,)   ray angles from x axis
+    param[in] nb_bounce         number of reflections to trace (a corner cube: 2)
+    param[in] eps               hit tolerance (the same as hit_info())
+    return (hit_pos_ary, hit_mirror_ary, exit_vec_ary)
+        hit_pos_ary    (N, nb_bounce, 3) hit positions. When no hit, the last position.
+        hit_mirror_ary (N, nb_bounce)    MIRROR_HIT_{NONE,LEFT,TOP,CORNER}
+        exit_vec_ary   (N, nb_bounce, 3) unit direction vector after each hit
+    """
+    spos_ary  = np.array(start_pos_ary, dtype=np.float64).reshape(-1, 3)
+    theta_ary = np.array(theta_ary,     dtype=np.float64).reshape(-1)
+    assert(spos_ary.shape[0] == theta_ary.shape[0])
+
+    nb_ray = spos_ary.shape[0]
+    (m_x, m_y) = (mirror_corner_pos[0], mirror_corner_pos[1])
+
+    hit_pos_ary    = np.zeros((nb_ray, nb_bounce, 3))
+    hit_mirror_ary = np.full((nb_ray, nb_bounce), MIRROR_HIT_NONE, dtype=np.int32)
+    exit_vec_ary   = np.zeros((nb_ray, nb_bounce, 3))
+
+    pos_ary = spos_ary.copy()
+    vec_ary = np.stack((np.cos(theta_ary), np.sin(theta_ary), np.zeros(nb_ray)), axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for b in range(nb_bounce):
+            # ray length to each mirror. Only in front of the ray counts
+            k_left = np.where(vec_ary[:, 0] < 0.0, (m_x - pos_ary[:, 0]) / vec_ary[:, 0], np.inf)
+            k_top  = np.where(vec_ary[:, 1] > 0.0, (m_y - pos_ary[:, 1]) / vec_ary[:, 1], np.inf)
+            k_left = np.where(k_left > eps, k_left, np.inf)
+            k_top  = np.where(k_top  > eps, k_top,  np.inf)
+
+            is_hit    = np.isfinite(k_left) | np.isfinite(k_top)
+            is_corner = is_hit & (np.abs(k_left - k_top) < eps)
+            is_left   = is_hit & ~is_corner & (k_left < k_top)
+            is_top    = is_hit & ~is_corner & ~is_left
+
+            k_ary = np.where(is_hit, np.minimum(k_left, k_top), 0.0)
+            pos_ary = pos_ary + k_ary[:, np.newaxis] * vec_ary
+
+            # reflect: left mirror flips x, top mirror flips y, corner flips both
+            vec_ary[is_left | is_corner, 0] *= -1.0
+            vec_ary[is_top  | is_corner, 1] *= -1.0
+
+            hit_mirror_ary[is_left,   b] = MIRROR_HIT_LEFT
+            hit_mirror_ary[is_top,    b] = MIRROR_HIT_TOP
+            hit_mirror_ary[is_corner, b] = MIRROR_HIT_CORNER
+            hit_pos_ary[:, b]  = pos_ary
+            exit_vec_ary[:, b] = vec_ary
+
+    return (hit_pos_ary, hit_mirror_ary, exit_vec_ary)
+
+
+def get_corner_ray_chain_points(start_pos_ary, hit_pos_ary, exit_vec_ary, exit_ray_len, y_min):
+    """Get ray chain corner points from the trace_corner_rays() result.
+
+    The exit ray is limited by y_min, the same as
+    Ray_3_position_gen.get_ray_end_with_limit_y().
+
+    param[in] start_pos_ary (N, 3)            ray start positions
+    param[in] hit_pos_ary   (N, nb_bounce, 3) hit positions
+    param[in] exit_vec_ary  (N, nb_bounce, 3) exit vectors
+    param[in] exit_ray_len  the last ray length
+    param[in] y_min         y minimum limit value of the last ray
+    return (N, nb_bounce + 2, 3) corner points: start, hits..., exit ray end
+    """
+    last_pos = hit_pos_ary[:, -1]
+    last_vec = exit_vec_ary[:, -1]
+    epos_ary = last_pos + exit_ray_len * last_vec
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        is_limit   = epos_ary[:, 1] < y_min
+        # a ray which starts below y_min has no length
+        limit_rlen = np.maximum((y_min - last_pos[:, 1]) / last_vec[:, 1], 0.0)
+    epos_ary[is_limit] = last_pos[is_limit] + limit_rlen[is_limit, np.newaxis] * last_vec[is_limit]
+
+    return np.concatenate((np.array(start_pos_ary).reshape(-1, 1, 3),
+                           hit_pos_ary,
+                           epos_ary[:, np.newaxis]), axis=1)
+
 
 class Ray_1_updater(object):
     """
@@ -379,6 +583,75 @@ class Ray_2_3_updater(object):
         follower.put_start_and_end_on(spos, epos)
 
 
+class Ray_fan_source(object):
+    """
+    parallel ray fan generator. The rays are parallel to ray_1.
+
+                  /  /  /  /
+                 /  /  /  /  fan_width (perpendicular to the ray)
+                *--*--*--*
+                   ^
+                   ray_1 start
+    """
+    def __init__(self, ray_1_pos_gen, vtarcker, nb_fan_rays, fan_width):
+        """
+        param[in] ray_1_pos_gen     ray_1 position generator
+        param[in] vtarcker          time parameter value tracker
+        param[in] nb_fan_rays       number of rays in the fan
+        param[in] fan_width         fan width perpendicular to the rays
+        """
+        self.__ray_1_pos_gen = ray_1_pos_gen
+        self.__vtarcker      = vtarcker
+        self.__fan_offset    = np.linspace(-0.5 * fan_width, 0.5 * fan_width, nb_fan_rays)
+
+    def get_fan_start_theta(self):
+        """
+        return (start_pos_ary (N, 3), theta_ary (N,)) at the current time
+        """
+        time_t = self.__vtarcker.get_value()
+        spos   = self.__ray_1_pos_gen.get_ray_1_start_pos(time_t)
+        theta  = self.__ray_1_pos_gen.get_ray_1_thera(time_t)
+
+        perp_vec  = np.array((np.sin(theta), -np.cos(theta), 0.0))
+        spos_ary  = spos + self.__fan_offset[:, np.newaxis] * perp_vec
+        theta_ary = np.full(self.__fan_offset.shape, theta)
+        return (spos_ary, theta_ary)
+
+    def __call__(self):
+        """
+        ray source for myutil.Mirror_ray_updater
+        return (start_pos_ary (N, 3), dir_ary (N, 3)) at the current time
+        """
+        (spos_ary, theta_ary) = self.get_fan_start_theta()
+        dir_ary = np.stack((np.cos(theta_ary), np.sin(theta_ary), np.zeros(theta_ary.shape)), axis=1)
+        return (spos_ary, dir_ary)
+
+
+class Ray_fan_updater(object):
+    """
+    parallel ray fan update functor. All the rays are traced in one batch.
+    """
+    def __init__(self, ray_fan_source, mirror_corner_pos, ray_3_len):
+        """
+        param[in] ray_fan_source    Ray_fan_source
+        param[in] mirror_corner_pos the corner point of the mirror
+        param[in] ray_3_len         exit ray length
+        """
+        self.__ray_fan_source    = ray_fan_source
+        self.__mirror_corner_pos = mirror_corner_pos
+        self.__ray_3_len         = ray_3_len
+
+    def __call__(self, follower):
+        """
+        update functor.
+        Assumed the follower is a VMobject, each ray becomes one subpath.
+        """
+        (spos_ary, theta_ary) = self.__ray_fan_source.get_fan_start_theta()
+        (hit_pos_ary, hit_mirror_ary, exit_vec_ary) = trace_corner_rays(self.__mirror_corner_pos, spos_ary, theta_ary)
+        corner_ary = get_corner_ray_chain_points(spos_ary, hit_pos_ary, exit_vec_ary, self.__ray_3_len, -3)
+        follower.set_points(myutil.get_polyline_bezier_points(corner_ary))
+
+
 class Elbow_position_angle_gen(object):
     """
     Elbow positions/angle generator
@@ -451,11 +724,144 @@ class Elbow_ray_updater(object):
         update functor.
         Assumed the follower is an elbow
         """
-        follower.set_angle( self.__elbow_position_angle_gen.get_elbow_angle(self.__elbow_idx))
-        follower.move_to(self.__elbow_position_angle_gen.get_elbow_position(self.__elbow_idx))
+        follower.set_elbow(position=self.__elbow_position_angle_gen.get_elbow_position(self.__elbow_idx),
+                           angle   =self.__elbow_position_angle_gen.get_elbow_angle(self.__elbow_idx))
+
+
+class Elbow_batch_updater(object):
+    """
+    Update functor of several elbows (ElbowRotate) in one vectorized call
+    """
+    def __init__(self, elbow_position_angle_gen, elbow_idx_list):
+        """
+        param[in] elbow_position_angle_gen elbow's position and angle generator
+        param[in] elbow_idx_list           elbow indices, in the follower group's order
+        """
+        self.__elbow_position_angle_gen = elbow_position_angle_gen
+        self.__elbow_idx_list           = elbow_idx_list
+
+    def __call__(self, follower):
+        """
+        update functor.
+        Assumed the follower is a group of elbows (same order to elbow_idx_list)
+        """
+        gen = self.__elbow_position_angle_gen
+        position_ary = np.array([gen.get_elbow_position(idx) for idx in self.__elbow_idx_list])
+        angle_ary    = np.array([gen.get_elbow_angle(idx)    for idx in self.__elbow_idx_list])
+        width_ary    = np.array([elbow.width for elbow in follower.submobjects])
+        points_ary   = myutil.get_elbow_points(position_ary, angle_ary, width_ary)
+        for (elbow, position, angle, points) in zip(follower.submobjects, position_ary, angle_ary, points_ary):
+            elbow.position = position
+            elbow.angle    = angle
+            elbow.set_elbow_points(points)
+
+
+class Updater_graph(object):
+    """
+    updater dependency graph
+
+    Each node is (follower, updater, input mobject list). A node depends on
+    the nodes whose follower is one of its inputs.
+
+      vtarcker_time_t -> line_ray_1 -> line_ray_2 -> line_ray_3 -> elbow 3
+                                   \-> elbow 2    /
+                                    \------------/
+
+    The nodes are topologically sorted once, then evaluated in that order
+    every frame, independent of the mobject order in the scene. A node is
+    evaluated only when one of its inputs has changed since its last
+    evaluation. (A node without inputs is evaluated every frame.)
+
+    Usage: the graph itself is an updater. Add it to a point-less driver
+    mobject (get_driver_mobject()) and add the driver to the scene before
+    the followers, so that the followers are redrawn every frame.
+    """
+    def __init__(self):
+        self.__node_list        = []
+        self.__node_order       = None
+        self.__node_input_state = []
+
+
+    def add_node(self, follower, updater, input_list):
+        """
+        param[in] follower   the mobject the updater updates
+        param[in] updater    update functor, updater(follower)
+        param[in] input_list mobjects (value trackers, other followers) the updater reads
+        """
+        assert(all([follower is not node[0] for node in self.__node_list]))
+        self.__node_list.append((follower, updater, list(input_list)))
+        self.__node_input_state.append(None)
+        self.__node_order = None
+
+
+    def sort(self):
+        """
+        topological sort of the nodes (Kahn's algorithm)
+        Keeps the add_node() order among independent nodes.
+        """
+        nb_node      = len(self.__node_list)
+        follower_idx = {id(node[0]): i for (i, node) in enumerate(self.__node_list)}
+        succ_list    = [[] for i in range(nb_node)]
+        dep_count    = [0] * nb_node
+        for (i, (follower, updater, input_list)) in enumerate(self.__node_list):
+            for mobj in input_list:
+                j = follower_idx.get(id(mobj))
+                if (j is not None):
+                    succ_list[j].append(i)
+                    dep_count[i] += 1
+
+        ready_list = [i for i in range(nb_node) if (dep_count[i] == 0)]
+        node_order = []
+        while (len(ready_list) > 0):
+            i = ready_list.pop(0)
+            node_order.append(i)
+            for k in succ_list[i]:
+                dep_count[k] -= 1
+                if (dep_count[k] == 0):
+                    ready_list.append(k)
+
+        if (len(node_order) != nb_node):
+            raise ValueError("Updater_graph has a cyclic dependency.")
+
+        self.__node_order = node_order
+
+
+    def get_driver_mobject(self):
+        """
+        get a point-less mobject which runs this graph as its updater
+        """
+        driver = Mobject()
+        driver.add_updater(self)
+        return driver
+
+
+    def __call__(self, follower):
+        """
+        update functor. Evaluate the changed nodes.
+        The follower is the driver mobject, not used.
+        """
+        if (self.__node_order is None):
+            self.sort()
+
+        for i in self.__node_order:
+            (node_follower, updater, input_list) = self.__node_list[i]
+            # copy: a mobject without submobjects returns its own points
+            input_state = [np.array(mobj.get_all_points()) for mobj in input_list]
+            last_state  = self.__node_input_state[i]
+
+            is_changed = ((last_state is None) or (len(input_list) == 0) or
+                          any([not np.array_equal(cur, last) for (cur, last) in zip(input_state, last_state)]))
+            if (is_changed):
+                if (myutil.Updater_profiler.active is not None):
+                    myutil.Updater_profiler.active.call(updater, node_follower)
+                else:
+                    updater(node_follower)
+                self.__node_input_state[i] = input_state
 
 
 
+@myutil.profile_updaters
+@myutil.time_phases
 class CornerCubeRay01(Scene):
     """Example value tracker that control a ray
     """
@@ -492,6 +898,24 @@ class CornerCubeRay01(Scene):
         "ray_3_stroke_width":  4,
         "ray_1_spos":          -1.0 * RIGHT + -3.0 * UP,
         "ray_3_length":        5,
+        # sample ray_1 trajectory at the frame rate (Ray_1_position_gen.build_sample_table())
+        "is_ray_1_sample_table":  True,
+        "ray_1_sample_per_frame": 1,
+        # evaluate the ray/elbow updaters through Updater_graph
+        "is_use_updater_graph":   True,
+        "updater_graph":          None,
+
+        # dense parallel ray fan (batch traced, one VMobject)
+        "is_show_ray_fan":       False,
+        "ray_fan":               None,
+        "nb_fan_rays":           200,
+        "fan_width":             1.0,
+        "ray_fan_color":         YELLOW,
+        "ray_fan_stroke_width":  1,
+        "ray_fan_opacity":       0.5,
+        # trace the fan with myutil.Mirror_set instead of the two infinite mirror lines
+        "is_ray_fan_mirror_set": False,
+        "ray_fan_max_bounce":    3,
 
         # annotations
         #    line_normal
@@ -511,7 +935,6 @@ class CornerCubeRay01(Scene):
         "arc_theta":                   None,
         "arc_theta_radius":            0.7,
         "arc_theta_color":             YELLOW,
-        "arc_theta_pos_offset":        None,
         "elbow_theta":                 None,
         "elbow_length":                0.4,
         "elbow_color":                 YELLOW,
@@ -560,6 +983,8 @@ class CornerCubeRay01(Scene):
 
         init_ray_1_theta = PI - (21/100) * PI
         self.ray_1_pos_gen = Ray_1_position_gen(self.line_ray_1, self.mirror_corner_pos, self.ray_1_spos, init_ray_1_theta)
+        if (self.is_ray_1_sample_table):
+            self.ray_1_pos_gen.build_sample_table(self.camera.frame_rate, self.ray_1_sample_per_frame)
         init_ray_1_start = self.ray_1_pos_gen.get_ray_1_start_pos(0.0)
         init_ray_1_end   = self.ray_1_pos_gen.get_ray_1_end_pos(0.0)
         self.line_ray_1.put_start_and_end_on(init_ray_1_start, init_ray_1_end)
@@ -602,14 +1027,6 @@ class CornerCubeRay01(Scene):
         return ORIGIN
 
 
-    def get_arc_position(self, idx):
-        """get arc position
-         Assume self.arc_theta_pos_offset has been initialized at the arc creation.
-        """
-        assert((0 <= idx) and (idx < 4))
-        return self.get_arc_center(idx) + self.arc_theta_pos_offset[idx]
-
-
     def get_arc_measure(self, idx):
         """get ith arc measure value
         return (start_angle, angle)
@@ -685,33 +1102,14 @@ class CornerCubeRay01(Scene):
 
 
         self.arc_theta            = []
-        self.arc_theta_pos_offset = []
         for i in range(0,4):
             (arc_start, arc_angle) = self.get_arc_measure(i)
             self.arc_theta.append(
-                Arc(
-                    start_angle = arc_start,
-                    angle       = arc_angle,
+                myutil.Angle_marker(
+                    self.get_arc_center(i), arc_start, arc_angle,
                     radius      = self.arc_theta_radius,
-                    color       = self.arc_theta_color,
-                    arc_center  = ORIGIN  # initial center of the arc is at ORIGIN
+                    color       = self.arc_theta_color
                 ))
-            # Initialize self.arc_theta_pos_offset
-            #
-            # Arc's center is the arc object center, not the arc (circle)'s center
-            # Now the arc_center of all arcs are at the ORIGIN, thus,
-            # get_center() gives an offset from the center.
-            #          ___
-            #             \_
-            #               \
-            #                | arc
-            #  ORIGIN *   +   \
-            #             arc.get_center()
-            #         |<->|
-            #           offset
-            #
-            self.arc_theta_pos_offset.append(self.arc_theta[i].get_center())
-            self.arc_theta[i].move_to(self.get_arc_position(i))
 
 
         self.elbow_position_angle_gen = Elbow_position_angle_gen(self.mirror_corner_pos,
@@ -720,10 +1118,10 @@ class CornerCubeRay01(Scene):
 
         self.elbow_parallel = []
         for i in range(0,4):
-            self.elbow_parallel.append(ElbowRotate(width = self.elbow_length, angle=-PI/2,
-                                                   color = self.elbow_color, about_point = ORIGIN))
-            self.elbow_parallel[i].set_angle(self.elbow_position_angle_gen.get_elbow_angle(i))
-            self.elbow_parallel[i].move_to(self.elbow_position_angle_gen.get_elbow_position(i))
+            self.elbow_parallel.append(ElbowRotate(width    = self.elbow_length,
+                                                   angle    = self.elbow_position_angle_gen.get_elbow_angle(i),
+                                                   position = self.elbow_position_angle_gen.get_elbow_position(i),
+                                                   color    = self.elbow_color))
 
 
         if (self.is_show_annotation_creation):
@@ -740,17 +1138,47 @@ class CornerCubeRay01(Scene):
         Depends on the value tracker's parameter t, animate the arrow
         """
 
-        self.line_ray_1.add_updater(Ray_1_updater(self.ray_1_pos_gen, self.vtarcker_time_t))
-        self.line_ray_2.add_updater(Ray_2_3_updater(self.ray_2_pos_gen))
-        self.line_ray_3.add_updater(Ray_2_3_updater(self.ray_3_pos_gen))
-
-        self.elbow_parallel[2].add_updater(Elbow_ray_updater(self.elbow_position_angle_gen, 2))
-        self.elbow_parallel[3].add_updater(Elbow_ray_updater(self.elbow_position_angle_gen, 3))
-
+        # elbows on ray 1 and ray 3 are updated together
+        self.elbow_ray_group = VGroup(self.elbow_parallel[2], self.elbow_parallel[3])
+
+        # (follower, updater, inputs)
+        node_list = [
+            (self.line_ray_1,        Ray_1_updater(self.ray_1_pos_gen, self.vtarcker_time_t), [self.vtarcker_time_t]),
+            (self.line_ray_2,        Ray_2_3_updater(self.ray_2_pos_gen),                    [self.line_ray_1]),
+            (self.line_ray_3,        Ray_2_3_updater(self.ray_3_pos_gen),                    [self.line_ray_1, self.line_ray_2]),
+            (self.elbow_ray_group,   Elbow_batch_updater(self.elbow_position_angle_gen, [2, 3]),
+                                                                                     [self.line_ray_1, self.line_ray_3]),
+        ]
+
+        if (self.is_show_ray_fan):
+            self.ray_fan = VMobject(stroke_color=self.ray_fan_color, stroke_width=self.ray_fan_stroke_width,
+                                    stroke_opacity=self.ray_fan_opacity)
+            ray_fan_source = Ray_fan_source(self.ray_1_pos_gen, self.vtarcker_time_t, self.nb_fan_rays, self.fan_width)
+            if (self.is_ray_fan_mirror_set):
+                # general N-bounce tracer over the (finite) mirror lines
+                mirror_list = [self.line_mirror_up_l1, self.line_mirror_left_n1]
+                mirror_set  = myutil.Mirror_set([mirror.get_start() for mirror in mirror_list],
+                                                [mirror.get_end()   for mirror in mirror_list])
+                ray_fan_updater = myutil.Mirror_ray_updater(mirror_set, ray_fan_source,
+                                                            self.ray_fan_max_bounce, self.ray_3_length)
+            else:
+                ray_fan_updater = Ray_fan_updater(ray_fan_source, self.mirror_corner_pos, self.ray_3_length)
+            node_list.append((self.ray_fan, ray_fan_updater, [self.vtarcker_time_t]))
+
+        if (self.is_use_updater_graph):
+            self.updater_graph = Updater_graph()
+            for (follower, updater, input_list) in node_list:
+                self.updater_graph.add_node(follower, updater, input_list)
+            # the driver should be before the followers to redraw them every frame
+            self.add(self.updater_graph.get_driver_mobject())
+        else:
+            for (follower, updater, input_list) in node_list:
+                follower.add_updater(updater)
 
+        if (self.is_show_ray_fan):
+            self.add(self.ray_fan)
 
-        self.add(self.line_ray_1, self.line_ray_2, self.line_ray_3,
-                 self.elbow_parallel[2], self.elbow_parallel[3])
+        self.add(self.line_ray_1, self.line_ray_2, self.line_ray_3, self.elbow_ray_group)
 
         self.play(ApplyMethod(self.vtarcker_time_t.increment_value, 1.0))
         self.play(ApplyMethod(self.vtarcker_time_t.increment_value, 1.0))
@@ -0,0 +1,1129 @@
+# -*- coding: utf-8; -*-
+#
+# corner cube mirror
+#
+# my utility
+#
+#    (C) 2020 Hitoshi Yamauchi
+#
+# New BSD License
+#
+#
+
+from manimlib.imports import *
+import manimlib.mobject.svg.tex_mobject as tex_mobject_module
+import collections, functools, json, os, sys, time, tracemalloc
+
+
+def get_polyline_bezier_points(corner_ary):
+    """Convert (N, M, 3) polyline corners to VMobject's cubic bezier points.
+
+    Each polyline becomes one subpath of (M - 1) line curves, thus one
+    VMobject can show all the N polylines.
+
+    @param[in] corner_ary (N, M, 3) corner points of N polylines
+    @return ((N * (M - 1) * 4), 3) bezier control points
+    """
+    seg_start = corner_ary[:, :-1, np.newaxis, :]
+    seg_vec   = corner_ary[:, 1:,  np.newaxis, :] - seg_start
+    alpha     = np.linspace(0, 1, 4)[:, np.newaxis]
+    return (seg_start + alpha * seg_vec).reshape(-1, 3)
+
+
+
+# right angle sign (elbow) corners at angle 0, width 1: UP -> UP + RIGHT -> RIGHT
+_ELBOW_UNIT_CORNER = np.array([[0.0, 1.0], [1.0, 1.0], [1.0, 0.0]])
+
+def get_elbow_points(position_ary, angle_ary, width):
+    """Bezier points of N right angle signs (elbows) from their parameters.
+
+    An elbow is the corners UP, UP + RIGHT, RIGHT scaled by width,
+    rotated by angle (about the corner ORIGIN), and moved to position (the
+    bounding box center, same to move_to().) The points are computed
+    directly from the parameters each time, no accumulated rotation.
+
+    @param[in] position_ary (N, 3) bounding box centers. None: not moved (corner at the ORIGIN)
+    @param[in] angle_ary    (N,)   rotation angles
+    @param[in] width        scalar or (N,) elbow widths
+    @return (N, 8, 3) bezier control points (two line curves per elbow)
+    """
+    angle_ary    = np.asarray(angle_ary,    dtype=float).reshape(-1)
+    width_ary    = np.broadcast_to(np.asarray(width, dtype=float), angle_ary.shape)
+    nb_elbow     = angle_ary.shape[0]
+
+    cos_ary = np.cos(angle_ary)[:, np.newaxis] * width_ary[:, np.newaxis]
+    sin_ary = np.sin(angle_ary)[:, np.newaxis] * width_ary[:, np.newaxis]
+    corner_ary = np.zeros((nb_elbow, 3, 3))
+    corner_ary[:, :, 0] = cos_ary * _ELBOW_UNIT_CORNER[:, 0] - sin_ary * _ELBOW_UNIT_CORNER[:, 1]
+    corner_ary[:, :, 1] = sin_ary * _ELBOW_UNIT_CORNER[:, 0] + cos_ary * _ELBOW_UNIT_CORNER[:, 1]
+    if (position_ary is not None):
+        # move the bounding box center to the position
+        position_ary = np.asarray(position_ary, dtype=float).reshape(-1, 3)
+        bb_center    = 0.5 * (corner_ary.min(axis=1) + corner_ary.max(axis=1))
+        corner_ary  += (position_ary - bb_center)[:, np.newaxis, :]
+    return get_polyline_bezier_points(corner_ary).reshape(nb_elbow, 8, 3)
+
+
+def intersect_lines(p1_ary, d1_ary, p2_ary, d2_ary, eps=1e-6):
+    """Intersection points of line pairs (xy-plane) in homogeneous coordinates.
+
+    Line i passes p1_ary[i] with direction d1_ary[i] (the other line:
+    p2_ary[i], d2_ary[i].) In homogeneous coordinates, a line through
+    (x, y) with direction (dx, dy) is l = (-dy, dx, x dy - y dx), and the
+    intersection of l1 and l2 is l1 x l2. Its w component is
+    cross(d1, d2), thus vertical lines need no special case.
+
+    No exception: parallel (and co-linear) pairs are flagged by the masks
+    and their positions are NaN.
+
+    @param[in] p1_ary (N, 3) or (3,) a point on the line 1
+    @param[in] d1_ary (N, 3) or (3,) direction of the line 1
+    @param[in] p2_ary (N, 3) or (3,) a point on the line 2
+    @param[in] d2_ary (N, 3) or (3,) direction of the line 2
+    @param[in] eps    parallel threshold of |sin(angle)| (and the co-linear distance / |d|)
+    @return (pos_ary (N, 3), is_parallel (N,), is_colinear (N,))
+    """
+    (p1_ary, d1_ary, p2_ary, d2_ary) = np.broadcast_arrays(*[np.atleast_2d(np.asarray(ary, dtype=float))
+                                                              for ary in (p1_ary, d1_ary, p2_ary, d2_ary)])
+    line_1 = np.stack([-d1_ary[:, 1], d1_ary[:, 0],
+                       p1_ary[:, 0] * d1_ary[:, 1] - p1_ary[:, 1] * d1_ary[:, 0]], axis=1)
+    line_2 = np.stack([-d2_ary[:, 1], d2_ary[:, 0],
+                       p2_ary[:, 0] * d2_ary[:, 1] - p2_ary[:, 1] * d2_ary[:, 0]], axis=1)
+    hpos = np.cross(line_1, line_2)
+
+    d1_len = np.hypot(d1_ary[:, 0], d1_ary[:, 1])
+    d2_len = np.hypot(d2_ary[:, 0], d2_ary[:, 1])
+    is_parallel = np.abs(hpos[:, 2]) <= eps * d1_len * d2_len
+    # co-linear: parallel and p2 is on the line 1
+    p12 = p2_ary - p1_ary
+    is_colinear = is_parallel & (np.abs(d1_ary[:, 0] * p12[:, 1] - d1_ary[:, 1] * p12[:, 0]) <= eps * d1_len)
+
+    pos_ary = np.full(p1_ary.shape, np.nan)
+    w = hpos[~is_parallel, 2]
+    pos_ary[~is_parallel, 0] = hpos[~is_parallel, 0] / w
+    pos_ary[~is_parallel, 1] = hpos[~is_parallel, 1] / w
+    pos_ary[~is_parallel, 2] = 0.0
+    return (pos_ary, is_parallel, is_colinear)
+
+
+def get_angle_line_intersection(p1, theta_1, p2, theta_2, eps=1e-6):
+    """Intersection point of two lines given by a point and a slope angle
+
+    @param[in] p1      a point on the line 1
+    @param[in] theta_1 slope angle of the line 1
+    @param[in] p2      a point on the line 2
+    @param[in] theta_2 slope angle of the line 2
+    @param[in] eps     parallel threshold (see intersect_lines())
+    @return the intersection point, None when parallel or co-linear
+    """
+    (pos_ary, is_parallel, is_colinear) = intersect_lines(p1, (math.cos(theta_1), math.sin(theta_1), 0.0),
+                                                          p2, (math.cos(theta_2), math.sin(theta_2), 0.0), eps)
+    if (is_parallel[0]):
+        return None
+    return pos_ary[0]
+
+
+def intersect_line_mobjects(line_1, line_2, eps=1e-6):
+    """Intersection point of (the extended lines of) two Line mobjects
+
+    @param[in] line_1 a Line mobject 1
+    @param[in] line_2 a Line mobject 2
+    @param[in] eps    parallel threshold (see intersect_lines())
+    @return the intersection point, None when parallel or co-linear
+    """
+    (pos_ary, is_parallel, is_colinear) = intersect_lines(line_1.get_start(), line_1.get_end() - line_1.get_start(),
+                                                          line_2.get_start(), line_2.get_end() - line_2.get_start(), eps)
+    if (is_parallel[0]):
+        return None
+    return pos_ary[0]
+
+
+# unit arc bezier points cache: (num_components, sweep angle bucket index) -> points
+_unit_arc_points_cache = {}
+
+def get_unit_arc_points(angle, num_components=9, angle_bucket=0.05 * DEGREES):
+    """Cached bezier control points of a unit arc [0, angle] at the origin.
+
+    The sweep angle is rounded to a multiple of angle_bucket. With the
+    default bucket (0.05 degree), the end point error of a radius 1 arc
+    is < 0.001 (less than a pixel at 1080p.) The result is shared, do
+    not modify it.
+
+    @param[in] angle          sweep angle
+    @param[in] num_components number of anchors (same to Arc)
+    @param[in] angle_bucket   sweep angle quantization
+    @return ((num_components - 1) * 4, 3) bezier control points
+    """
+    key = (num_components, int(round(angle / angle_bucket)))
+    points = _unit_arc_points_cache.get(key)
+    if (points is None):
+        sweep   = key[1] * angle_bucket
+        theta   = np.linspace(0, sweep, num_components)
+        anchors = np.stack([np.cos(theta), np.sin(theta), np.zeros(num_components)], axis=1)
+        tangent = np.stack([-anchors[:, 1], anchors[:, 0], np.zeros(num_components)], axis=1)
+        d_theta = sweep / (num_components - 1.0)
+        points  = np.zeros((4 * (num_components - 1), 3))
+        points[0::4] = anchors[:-1]
+        points[1::4] = anchors[:-1] + (d_theta / 3.0) * tangent[:-1]
+        points[2::4] = anchors[1:]  - (d_theta / 3.0) * tangent[1:]
+        points[3::4] = anchors[1:]
+        points.setflags(write=False)
+        _unit_arc_points_cache[key] = points
+    return points
+
+
+class Angle_marker(VGroup):
+    """An angle annotation: arc (or right angle elbow) and an optional label.
+
+    The arc is a cached unit arc (get_unit_arc_points()) transformed by
+    rotation (start angle), scale (radius) and translation (vertex),
+    written in place into the arc's points. Thus set_angle() per frame
+    (e.g., an intersection arc updater) allocates no mobject.
+
+                label
+             _
+       angle  \
+    vertex +---+----> start_angle
+
+    Example:
+        marker = myutil.Angle_marker(r1_pos, 0, -theta, label_tex=r"\theta")
+        marker.add_updater(lambda mobj: mobj.set_angle(vertex=ray.get_end(), angle=-tracker.get_value()))
+    """
+    CONFIG = {
+        "radius":             0.7,
+        "color":              YELLOW,
+        "stroke_width":       DEFAULT_STROKE_WIDTH,
+        "num_components":     9,
+        "angle_bucket":       0.05 * DEGREES,
+        # right angle sign instead of the arc
+        "is_right_angle":     False,
+        "elbow_width":        0.3,
+        # label: None, or a tex string (TexMobject) placed on the bisector
+        "label_tex":          None,
+        "label_color":        WHITE,
+        "label_radius_ratio": 1.6,
+    }
+
+    def __init__(self, vertex, start_angle, angle, **kwargs):
+        """
+        param[in] vertex      angle vertex position
+        param[in] start_angle start direction angle
+        param[in] angle       sweep angle (negative: clockwise)
+        """
+        VGroup.__init__(self, **kwargs)
+        self.vertex      = np.array(vertex, dtype=float)
+        self.start_angle = start_angle
+        self.angle       = angle
+
+        # the points are allocated by set_angle()
+        self.arc = VMobject(color=self.color, stroke_width=self.stroke_width)
+        self.add(self.arc)
+
+        self.label = None
+        if (self.label_tex is not None):
+            self.label = TexMobject(self.label_tex, color=self.label_color)
+            self.add(self.label)
+
+        self.__rot = np.zeros((2, 2))
+        self.set_angle()
+
+
+    def set_angle(self, vertex=None, start_angle=None, angle=None, radius=None):
+        """update the marker in place. None: keep the current value
+
+        param[in] vertex      angle vertex position
+        param[in] start_angle start direction angle
+        param[in] angle       sweep angle
+        param[in] radius      arc radius
+        return self
+        """
+        if (vertex is not None):
+            self.vertex[:] = vertex
+        if (start_angle is not None):
+            self.start_angle = start_angle
+        if (angle is not None):
+            self.angle = angle
+        if (radius is not None):
+            self.radius = radius
+
+        nb_point = 8 if self.is_right_angle else (4 * (self.num_components - 1))
+        if (self.arc.points.shape != (nb_point, 3)):
+            # points were replaced (e.g., by an animation): allocate once
+            self.arc.points = np.zeros((nb_point, 3))
+
+        points = self.arc.points
+        if (self.is_right_angle):
+            # elbow: vertex + w u1 -> vertex + w (u1 + u2) -> vertex + w u2
+            u1 = np.array((math.cos(self.start_angle), math.sin(self.start_angle), 0.0))
+            u2 = np.array((math.cos(self.start_angle + self.angle), math.sin(self.start_angle + self.angle), 0.0))
+            corner_ary = self.vertex + self.elbow_width * np.array([[u1, u1 + u2, u2]])
+            points[:] = get_polyline_bezier_points(corner_ary)
+        else:
+            unit_points = get_unit_arc_points(self.angle, self.num_components, self.angle_bucket)
+            # rotate (row vector: p R^T), scale, translate
+            (c, s) = (math.cos(self.start_angle) * self.radius, math.sin(self.start_angle) * self.radius)
+            self.__rot[0, 0] = c
+            self.__rot[0, 1] = s
+            self.__rot[1, 0] = -s
+            self.__rot[1, 1] = c
+            np.matmul(unit_points[:, :2], self.__rot, out=points[:, :2])
+            points[:, 0] += self.vertex[0]
+            points[:, 1] += self.vertex[1]
+            points[:, 2]  = self.vertex[2]
+
+        if (self.label is not None):
+            bisector = self.start_angle + 0.5 * self.angle
+            label_radius = self.label_radius_ratio * (self.elbow_width if self.is_right_angle else self.radius)
+            self.label.move_to(self.vertex + label_radius * np.array((math.cos(bisector), math.sin(bisector), 0.0)))
+        return self
+
+
+class Mirror_set(object):
+    """A set of mirror segments (xy plane) and an N-bounce ray tracer.
+
+    The segments are registered to a uniform grid once. A ray walks the
+    grid cells along its direction (DDA) and only tests the segments in
+    the visited cells, thus the cost per ray depends on the number of
+    visited cells and the segments in them, not on the total number of
+    mirrors. All the rays are traced together, one NumPy step per cell.
+
+        grid_origin
+        +----+----+----+
+        |    |  / |    |   cell_seg_table[cell] = segment indices
+        +----+-/--+----+   (-1 padded)
+        |    |/   |    |
+        +----+----+----+
+    """
+
+    def __init__(self, seg_start_ary, seg_end_ary, cell_size=None):
+        """
+        @param[in] seg_start_ary (M, 3) mirror segment start positions
+        @param[in] seg_end_ary   (M, 3) mirror segment end positions
+        @param[in] cell_size     grid cell size. None: the average segment length
+        """
+        self.__seg_start_ary = np.array(seg_start_ary, dtype=np.float64).reshape(-1, 3)
+        self.__seg_end_ary   = np.array(seg_end_ary,   dtype=np.float64).reshape(-1, 3)
+        assert(self.__seg_start_ary.shape == self.__seg_end_ary.shape)
+        assert(self.__seg_start_ary.shape[0] > 0)
+
+        seg_vec = self.__seg_end_ary - self.__seg_start_ary
+        seg_len = np.linalg.norm(seg_vec[:, 0:2], axis=1)
+        assert(np.all(seg_len > 0.0))
+
+        # unit normal of each segment (xy plane)
+        self.__seg_vec_ary    = seg_vec
+        self.__seg_normal_ary = np.stack((-seg_vec[:, 1], seg_vec[:, 0], np.zeros(seg_len.shape)), axis=1) / seg_len[:, np.newaxis]
+
+        if (cell_size is None):
+            cell_size = np.mean(seg_len)
+        self.build_grid(cell_size)
+
+
+    def build_grid(self, cell_size):
+        """register the segments to a uniform grid.
+
+        A segment is registered to all the cells its bounding box overlaps.
+
+        @param[in] cell_size grid cell size
+        """
+        assert(cell_size > 0.0)
+        all_pos  = np.concatenate((self.__seg_start_ary, self.__seg_end_ary))[:, 0:2]
+        pad      = 0.5 * cell_size
+        bb_min   = all_pos.min(axis=0) - pad
+        bb_max   = all_pos.max(axis=0) + pad
+        nb_cell  = np.maximum(np.ceil((bb_max - bb_min) / cell_size).astype(np.int64), 1)
+
+        self.__cell_size   = cell_size
+        self.__grid_origin = bb_min
+        self.__grid_max    = bb_min + nb_cell * cell_size
+        self.__nb_cell     = nb_cell
+
+        seg_min = np.minimum(self.__seg_start_ary, self.__seg_end_ary)[:, 0:2]
+        seg_max = np.maximum(self.__seg_start_ary, self.__seg_end_ary)[:, 0:2]
+        cell_min = np.clip(np.floor((seg_min - bb_min) / cell_size).astype(np.int64), 0, nb_cell - 1)
+        cell_max = np.clip(np.floor((seg_max - bb_min) / cell_size).astype(np.int64), 0, nb_cell - 1)
+
+        cell_seg_list = [[] for i in range(nb_cell[0] * nb_cell[1])]
+        for seg_idx in range(self.__seg_start_ary.shape[0]):
+            for iy in range(cell_min[seg_idx, 1], cell_max[seg_idx, 1] + 1):
+                for ix in range(cell_min[seg_idx, 0], cell_max[seg_idx, 0] + 1):
+                    cell_seg_list[iy * nb_cell[0] + ix].append(seg_idx)
+
+        max_per_cell = max([len(seg_list) for seg_list in cell_seg_list])
+        self.__cell_seg_table = np.full((len(cell_seg_list), max(max_per_cell, 1)), -1, dtype=np.int64)
+        for (cell_idx, seg_list) in enumerate(cell_seg_list):
+            self.__cell_seg_table[cell_idx, 0:len(seg_list)] = seg_list
+
+
+    def get_nb_mirror(self):
+        """number of mirror segments"""
+        return self.__seg_start_ary.shape[0]
+
+
+    def get_nearest_hit(self, pos_ary, dir_ary, exclude_seg_ary, eps = 1e-9):
+        """get the nearest mirror hit of each ray.
+
+        @param[in] pos_ary         (N, 3) ray start positions
+        @param[in] dir_ary         (N, 3) ray directions (need not be unit)
+        @param[in] exclude_seg_ary (N,) a segment index not to hit (the last hit), or -1
+        @param[in] eps             minimal ray parameter to hit
+        @return (hit_seg_ary, hit_t_ary)
+            hit_seg_ary (N,) hit segment index, -1 when no hit
+            hit_t_ary   (N,) ray parameter of the hit, pos + t dir. inf when no hit
+        """
+        nb_ray      = pos_ary.shape[0]
+        hit_seg_ary = np.full(nb_ray, -1, dtype=np.int64)
+        hit_t_ary   = np.full(nb_ray, np.inf)
+
+        org = pos_ary[:, 0:2]
+        vec = dir_ary[:, 0:2]
+        nb_cell   = self.__nb_cell
+        cell_size = self.__cell_size
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # clip the rays by the grid bounding box (slab method)
+            inv_vec = 1.0 / vec
+            t_0 = (self.__grid_origin - org) * inv_vec
+            t_1 = (self.__grid_max    - org) * inv_vec
+            t_0 = np.where(np.isnan(t_0), -np.inf, t_0)
+            t_1 = np.where(np.isnan(t_1),  np.inf, t_1)
+            t_enter = np.maximum(np.max(np.minimum(t_0, t_1), axis=1), 0.0)
+            t_exit  = np.min(np.maximum(t_0, t_1), axis=1)
+            active  = t_enter <= t_exit
+
+            # DDA init
+            enter_pos = org + t_enter[:, np.newaxis] * vec
+            cell      = np.clip(np.floor((enter_pos - self.__grid_origin) / cell_size).astype(np.int64), 0, nb_cell - 1)
+            step      = np.where(vec > 0.0, 1, -1)
+            next_wall = self.__grid_origin + (cell + (step > 0)) * cell_size
+            t_max     = np.where(vec != 0.0, (next_wall - org) * inv_vec, np.inf)
+            t_delta   = np.where(vec != 0.0, cell_size * np.abs(inv_vec), np.inf)
+
+            while (np.any(active)):
+                ray_idx = np.nonzero(active)[0]
+                cand    = self.__cell_seg_table[cell[ray_idx, 1] * nb_cell[0] + cell[ray_idx, 0]]
+                valid   = (cand >= 0) & (cand != exclude_seg_ary[ray_idx, np.newaxis])
+                cand    = np.where(valid, cand, 0)
+
+                # ray: o + t d, segment: p + s e
+                o  = org[ray_idx, np.newaxis]
+                d  = vec[ray_idx, np.newaxis]
+                p  = self.__seg_start_ary[cand][..., 0:2]
+                e  = self.__seg_vec_ary[cand][..., 0:2]
+                po = p - o
+                denom = d[..., 0] * e[..., 1] - d[..., 1] * e[..., 0]
+                t     = (po[..., 0] * e[..., 1] - po[..., 1] * e[..., 0]) / denom
+                s     = (po[..., 0] * d[..., 1] - po[..., 1] * d[..., 0]) / denom
+
+                # a hit counts only inside the current cell, later cells may have a nearer one otherwise
+                t_cell_exit = np.min(t_max[ray_idx], axis=1)
+                valid &= (denom != 0.0) & (t > eps) & (s >= 0.0) & (s <= 1.0) & (t <= t_cell_exit[:, np.newaxis])
+                t      = np.where(valid, t, np.inf)
+
+                near_k   = np.argmin(t, axis=1)
+                near_t   = t[np.arange(ray_idx.shape[0]), near_k]
+                is_hit   = np.isfinite(near_t)
+                hit_ray  = ray_idx[is_hit]
+                hit_seg_ary[hit_ray] = cand[is_hit, near_k[is_hit]]
+                hit_t_ary[hit_ray]   = near_t[is_hit]
+                active[hit_ray]      = False
+
+                # advance to the next cell
+                miss_ray = ray_idx[~is_hit]
+                axis     = np.argmin(t_max[miss_ray], axis=1)
+                cell[miss_ray, axis]  += step[miss_ray, axis]
+                t_max[miss_ray, axis] += t_delta[miss_ray, axis]
+                is_out = np.any((cell[miss_ray] < 0) | (cell[miss_ray] >= nb_cell), axis=1)
+                active[miss_ray[is_out]] = False
+
+        return (hit_seg_ary, hit_t_ary)
+
+
+    def trace(self, start_pos_ary, dir_ary, max_bounce):
+        """trace N rays with up to max_bounce reflections.
+
+        @param[in] start_pos_ary (N, 3) ray start positions
+        @param[in] dir_ary       (N, 3) ray directions
+        @param[in] max_bounce    maximal number of reflections
+        @return (hit_pos_ary, hit_mirror_ary, exit_vec_ary)
+            hit_pos_ary    (N, max_bounce, 3) hit positions. After the last hit, the last hit position.
+            hit_mirror_ary (N, max_bounce)    hit segment index, -1 when no hit
+            exit_vec_ary   (N, max_bounce, 3) unit direction vector after each bounce
+        """
+        pos_ary = np.array(start_pos_ary, dtype=np.float64).reshape(-1, 3)
+        vec_ary = np.array(dir_ary,       dtype=np.float64).reshape(-1, 3)
+        assert(pos_ary.shape == vec_ary.shape)
+        vec_ary = vec_ary / np.linalg.norm(vec_ary, axis=1)[:, np.newaxis]
+
+        nb_ray         = pos_ary.shape[0]
+        hit_pos_ary    = np.zeros((nb_ray, max_bounce, 3))
+        hit_mirror_ary = np.full((nb_ray, max_bounce), -1, dtype=np.int64)
+        exit_vec_ary   = np.zeros((nb_ray, max_bounce, 3))
+
+        last_seg = np.full(nb_ray, -1, dtype=np.int64)
+        active   = np.ones(nb_ray, dtype=bool)
+        for b in range(max_bounce):
+            ray_idx = np.nonzero(active)[0]
+            (hit_seg, hit_t) = self.get_nearest_hit(pos_ary[ray_idx], vec_ary[ray_idx], last_seg[ray_idx])
+            is_hit  = hit_seg >= 0
+            hit_ray = ray_idx[is_hit]
+            seg     = hit_seg[is_hit]
+
+            pos_ary[hit_ray] += hit_t[is_hit, np.newaxis] * vec_ary[hit_ray]
+            # reflection: v' = v - 2 (v . n) n
+            normal = self.__seg_normal_ary[seg]
+            vec_ary[hit_ray] -= 2.0 * np.sum(vec_ary[hit_ray] * normal, axis=1)[:, np.newaxis] * normal
+
+            hit_mirror_ary[hit_ray, b] = seg
+            last_seg[hit_ray]          = seg
+            active[ray_idx[~is_hit]]   = False
+            hit_pos_ary[:, b]  = pos_ary
+            exit_vec_ary[:, b] = vec_ary
+
+        return (hit_pos_ary, hit_mirror_ary, exit_vec_ary)
+
+
+    def get_ray_path_points(self, start_pos_ary, dir_ary, max_bounce, exit_ray_len):
+        """get ray path polylines.
+
+        @param[in] start_pos_ary (N, 3) ray start positions
+        @param[in] dir_ary       (N, 3) ray directions
+        @param[in] max_bounce    maximal number of reflections
+        @param[in] exit_ray_len  length of the ray after the last reflection
+        @return (N, max_bounce + 2, 3) corner points: start, hits..., exit ray end
+        """
+        start_pos_ary = np.array(start_pos_ary, dtype=np.float64).reshape(-1, 3)
+        (hit_pos_ary, hit_mirror_ary, exit_vec_ary) = self.trace(start_pos_ary, dir_ary, max_bounce)
+        epos_ary = hit_pos_ary[:, -1] + exit_ray_len * exit_vec_ary[:, -1]
+        return np.concatenate((start_pos_ary[:, np.newaxis], hit_pos_ary, epos_ary[:, np.newaxis]), axis=1)
+
+
+
+class Mirror_ray_updater(object):
+    """
+    mirror set ray paths update functor. All the rays are in one VMobject.
+    """
+    def __init__(self, mirror_set, ray_source, max_bounce, exit_ray_len):
+        """
+        @param[in] mirror_set   Mirror_set
+        @param[in] ray_source   callable, ray_source() returns (start_pos_ary, dir_ary)
+        @param[in] max_bounce   maximal number of reflections
+        @param[in] exit_ray_len length of the ray after the last reflection
+        """
+        self.__mirror_set   = mirror_set
+        self.__ray_source   = ray_source
+        self.__max_bounce   = max_bounce
+        self.__exit_ray_len = exit_ray_len
+
+    def __call__(self, follower):
+        """
+        update functor.
+        Assumed the follower is a VMobject, each ray becomes one subpath.
+        """
+        (start_pos_ary, dir_ary) = self.__ray_source()
+        corner_ary = self.__mirror_set.get_ray_path_points(start_pos_ary, dir_ary, self.__max_bounce, self.__exit_ray_len)
+        follower.set_points(get_polyline_bezier_points(corner_ary))
+
+
+def get_start_section(scene):
+    """name of the section where the rendering starts
+
+    The environment variable MANIM_START_SECTION overrides the scene's
+    CONFIG "start_section". None: render all.
+
+    @param[in] scene scene
+    @return    section (animate_* method) name or None
+    """
+    return os.environ.get("MANIM_START_SECTION") or getattr(scene, "start_section", None)
+
+
+def animate_section(method):
+    """Decorator of an animate_* method: a section that can be fast-forwarded.
+
+    When a start section is given (see get_start_section()), the sections
+    called before it run with skip_animations: each play() jumps to the
+    end state of its animations without interpolating or rendering frames,
+    and wait() does nothing. Rendering starts at the start section.
+
+    Example:
+        @myutil.animate_section
+        def animate_reflection_1_ray(self):
+            ...
+
+        MANIM_START_SECTION=animate_show_lower_2_theta python3 -m manim 06_corner_cube_proof.py CornerReflection01 -pl
+    """
+    @functools.wraps(method)
+    def wrapper(scene, *args, **kwargs):
+        start_section = get_start_section(scene)
+        if ((start_section is None) or getattr(scene, "is_start_section_reached", False)):
+            return method(scene, *args, **kwargs)
+
+        if (not hasattr(scene, "section_skipping_status")):
+            if (not getattr(getattr(scene.__class__, start_section, None), "is_animate_section", False)):
+                raise AttributeError("No section {0} in {1} (an @animate_section method)".format(
+                    start_section, scene.__class__.__name__))
+            scene.section_skipping_status = scene.skip_animations
+
+        if (method.__name__ == start_section):
+            scene.is_start_section_reached = True
+            scene.skip_animations = scene.section_skipping_status
+        else:
+            scene.skip_animations = True
+        return method(scene, *args, **kwargs)
+
+    # a start section must be a decorated method
+    wrapper.is_animate_section = True
+    return wrapper
+
+
+def get_updater_name(updater):
+    """Updater's name: the class name of a callable object, or the function name.
+    """
+    if (hasattr(updater, "__name__")):
+        return updater.__name__
+    return updater.__class__.__name__
+
+
+class Updater_profiler(object):
+    """Cumulative time, call count, and net allocation per updater.
+
+    install() replaces Mobject.update, thus every updater registered by
+    add_updater() is measured without wrapping it (remove_updater() still
+    works, the dt parameter is passed as manim does.) Updater_graph
+    measures its nodes via Updater_profiler.active. The time of an
+    Updater_graph includes its nodes' time.
+
+    Usage: see profile_updaters().
+    """
+    # the installed profiler or None
+    active = None
+
+    def __init__(self, is_trace_alloc=False):
+        """
+        @param[in] is_trace_alloc when True, also measure the net allocated bytes (tracemalloc, slow)
+        """
+        self.is_trace_alloc   = is_trace_alloc
+        self.__stat_dict      = {}              # (updater name, mobject name) -> [time, count, alloc]
+        self.__mobject_update = None
+
+
+    def call(self, updater, mobj, dt=None):
+        """Call updater(mobj[, dt]) and accumulate its statistics.
+
+        @param[in] updater update function or callable object
+        @param[in] mobj    the mobject to update
+        @param[in] dt      time step. None: call without dt
+        """
+        alloc_start = tracemalloc.get_traced_memory()[0] if self.is_trace_alloc else 0
+        start_time  = time.perf_counter()
+        if (dt is None):
+            updater(mobj)
+        else:
+            updater(mobj, dt)
+        elapsed_time = time.perf_counter() - start_time
+        alloc        = (tracemalloc.get_traced_memory()[0] - alloc_start) if self.is_trace_alloc else 0
+
+        key  = (get_updater_name(updater), "{0}@{1:x}".format(mobj.__class__.__name__, id(mobj)))
+        stat = self.__stat_dict.setdefault(key, [0.0, 0, 0])
+        stat[0] += elapsed_time
+        stat[1] += 1
+        stat[2] += alloc
+
+
+    def install(self):
+        """Start profiling all the updaters.
+        """
+        assert(Updater_profiler.active is None)
+        profiler = self
+        self.__mobject_update = Mobject.update
+
+        def update(mobj, dt=0, recursive=True):
+            # same as Mobject.update, but via profiler.call()
+            if mobj.updating_suspended:
+                return mobj
+            for updater in mobj.updaters:
+                if ("dt" in get_parameters(updater)):
+                    profiler.call(updater, mobj, dt)
+                else:
+                    profiler.call(updater, mobj)
+            if recursive:
+                for submob in mobj.submobjects:
+                    submob.update(dt, recursive)
+            return mobj
+
+        Mobject.update = update
+        if (self.is_trace_alloc and (not tracemalloc.is_tracing())):
+            tracemalloc.start()
+        Updater_profiler.active = self
+
+
+    def uninstall(self):
+        """Stop profiling, restore Mobject.update.
+        """
+        if (self.__mobject_update is not None):
+            Mobject.update        = self.__mobject_update
+            self.__mobject_update = None
+        if (self.is_trace_alloc and tracemalloc.is_tracing()):
+            tracemalloc.stop()
+        if (Updater_profiler.active is self):
+            Updater_profiler.active = None
+
+
+    def get_report(self, nb_top=20):
+        """Ranked (by cumulative time) report per updater and per (updater, mobject).
+
+        @param[in] nb_top number of the listed (updater, mobject) entries
+        @return    report string
+        """
+        updater_stat = {}
+        for ((updater_name, mobj_name), stat) in self.__stat_dict.items():
+            acc = updater_stat.setdefault(updater_name, [0.0, 0, 0])
+            for i in range(3):
+                acc[i] += stat[i]
+
+        line_list = []
+        row_format = "{0:>10.4f} {1:>9} {2:>10.2f} {3:>12} {4}"
+        for (title, stat_dict, nb_row) in [("updater", updater_stat, None),
+                                           ("updater, mobject", self.__stat_dict, nb_top)]:
+            line_list.append("--- {0} ranking".format(title))
+            line_list.append("{0:>10} {1:>9} {2:>10} {3:>12} {4}".format(
+                "time[s]", "calls", "us/call", "alloc[B]", title))
+            ranked_list = sorted(stat_dict.items(), key=lambda item: item[1][0], reverse=True)
+            for (key, (elapsed_time, count, alloc)) in ranked_list[:nb_row]:
+                name = key if isinstance(key, str) else "{0} {1}".format(*key)
+                line_list.append(row_format.format(elapsed_time, count, 1e6 * elapsed_time / max(count, 1),
+                                                   alloc if self.is_trace_alloc else "-", name))
+        return "\n".join(line_list)
+
+
+def profile_updaters(scene_class):
+    """Scene class decorator: opt-in updater profiling.
+
+    When the environment variable MANIM_PROFILE_UPDATERS is set (or the
+    scene's profile_updaters attribute), all the updaters are profiled
+    (Updater_profiler) while the scene runs, and the ranked report is
+    printed at the end of the render. The value "alloc" also measures the
+    net allocated bytes.
+
+    Example:
+        @myutil.profile_updaters
+        class CornerCubeRay01(Scene):
+            ...
+
+        MANIM_PROFILE_UPDATERS=1 python3 -m manim 07_corner_cube_ray.py CornerCubeRay01 -pl
+    """
+    orig_setup     = scene_class.setup
+    orig_tear_down = scene_class.tear_down
+
+    @functools.wraps(orig_setup)
+    def setup(scene):
+        mode = os.environ.get("MANIM_PROFILE_UPDATERS") or getattr(scene, "profile_updaters", None)
+        if (mode):
+            scene.updater_profiler = Updater_profiler(is_trace_alloc=(mode == "alloc"))
+            scene.updater_profiler.install()
+        orig_setup(scene)
+
+    @functools.wraps(orig_tear_down)
+    def tear_down(scene):
+        orig_tear_down(scene)
+        profiler = getattr(scene, "updater_profiler", None)
+        if (profiler is not None):
+            profiler.uninstall()
+            print("updater profile of {0}".format(scene.__class__.__name__))
+            print(profiler.get_report())
+
+    scene_class.setup     = setup
+    scene_class.tear_down = tear_down
+    return scene_class
+
+
+class Phase_timer(object):
+    """Break a scene's wall time into phases per animate_* (or @animate_section) section.
+
+    The phase functions (see get_phase_target_list()) are wrapped while
+    installed. The time is charged to the innermost running phase
+    (e.g., TeX compilation inside a create_* method is "tex_svg"), the
+    time outside of any phase is "other". The section is the running
+    animate_* method, "(setup)" or "(construct)" otherwise.
+
+    Usage: see time_phases().
+    """
+    PHASE_LIST = ["create", "tex_svg", "updater", "rasterize", "encode", "other"]
+
+    def __init__(self, target_list):
+        """
+        @param[in] target_list [(owner (class or module), attribute name, phase name)]. A phase name
+                               "section" makes the function a section.
+        """
+        self.__target_list   = target_list
+        self.__backup_list   = []
+        self.__phase_stack   = []
+        self.__section       = "(setup)"
+        self.__section_dict  = collections.OrderedDict()    # section -> {phase: seconds}
+        self.__last_time     = None
+
+
+    def charge(self):
+        """Charge the time since the last event to the current (section, phase).
+        """
+        cur_time = time.perf_counter()
+        if (self.__last_time is not None):
+            phase      = self.__phase_stack[-1] if (len(self.__phase_stack) > 0) else "other"
+            phase_dict = self.__section_dict.setdefault(self.__section, dict.fromkeys(self.PHASE_LIST, 0.0))
+            phase_dict[phase] += cur_time - self.__last_time
+        self.__last_time = cur_time
+
+
+    def set_section(self, section):
+        self.charge()
+        self.__section = section
+
+
+    def wrap(self, func, phase):
+        """Timed function of func as the phase.
+        """
+        timer = self
+
+        @functools.wraps(func)
+        def phase_wrapper(*args, **kwargs):
+            if (phase == "section"):
+                last_section = timer.__section
+                timer.set_section(func.__name__)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    timer.set_section(last_section)
+
+            timer.charge()
+            timer.__phase_stack.append(phase)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.charge()
+                timer.__phase_stack.pop()
+
+        return phase_wrapper
+
+
+    def install(self):
+        """Start timing: wrap the target functions.
+        """
+        for (owner, name, phase) in self.__target_list:
+            func = owner.__dict__[name] if (name in owner.__dict__) else getattr(owner, name)
+            self.__backup_list.append((owner, name, owner.__dict__.get(name)))
+            setattr(owner, name, self.wrap(func, phase))
+        self.__last_time = time.perf_counter()
+
+
+    def uninstall(self):
+        """Stop timing: restore the target functions.
+        """
+        self.charge()
+        for (owner, name, func) in reversed(self.__backup_list):
+            if (func is None):
+                delattr(owner, name)
+            else:
+                setattr(owner, name, func)
+        self.__backup_list = []
+
+
+    def get_report_dict(self):
+        """
+        @return {"sections": [{"section": name, "total": sec, "phase": {phase: sec}}], "phase": {phase: sec}, "total": sec}
+        """
+        total_phase  = dict.fromkeys(self.PHASE_LIST, 0.0)
+        section_list = []
+        for (section, phase_dict) in self.__section_dict.items():
+            section_list.append({"section": section, "total": sum(phase_dict.values()), "phase": dict(phase_dict)})
+            for (phase, sec) in phase_dict.items():
+                total_phase[phase] += sec
+        return {"sections": section_list, "phase": total_phase, "total": sum(total_phase.values())}
+
+
+def time_phases(scene_class):
+    """Scene class decorator: opt-in per phase timing report.
+
+    When the environment variable MANIM_PHASE_TIMING is set (or the
+    scene's phase_timing attribute), the scene's wall time is broken into
+    the phases of Phase_timer per animate_* section. The breakdown is
+    printed at the end of the render and written as JSON to the variable's
+    value as a file name ("1": <scene name>_phase_timing.json.)
+
+    Example:
+        @myutil.time_phases
+        class SomeScene(Scene):
+            ...
+
+        MANIM_PHASE_TIMING=timing.json python3 -m manim some_scene.py SomeScene
+    """
+    orig_setup     = scene_class.setup
+    orig_tear_down = scene_class.tear_down
+
+    @functools.wraps(orig_setup)
+    def setup(scene):
+        output_file = os.environ.get("MANIM_PHASE_TIMING") or getattr(scene, "phase_timing", None)
+        if (output_file):
+            if (output_file == "1"):
+                output_file = "{0}_phase_timing.json".format(scene.__class__.__name__)
+            scene.phase_timing_file = output_file
+            scene.phase_timer       = Phase_timer(get_phase_target_list(scene.__class__))
+            scene.phase_timer.install()
+        orig_setup(scene)
+        if (hasattr(scene, "phase_timer")):
+            scene.phase_timer.set_section("(construct)")
+
+    @functools.wraps(orig_tear_down)
+    def tear_down(scene):
+        orig_tear_down(scene)
+        timer = getattr(scene, "phase_timer", None)
+        if (timer is None):
+            return
+        timer.uninstall()
+        report = timer.get_report_dict()
+        report["scene"] = scene.__class__.__name__
+        with open(scene.phase_timing_file, "w") as f:
+            json.dump(report, f, indent=2)
+
+        print("phase timing of {0} [sec] (written to {1})".format(report["scene"], scene.phase_timing_file))
+        print("{0:<40}".format("section") + "".join(["{0:>10}".format(p) for p in Phase_timer.PHASE_LIST]))
+        for section in report["sections"] + [{"section": "total", "phase": report["phase"]}]:
+            print("{0:<40}".format(section["section"]) +
+                  "".join(["{0:>10.3f}".format(section["phase"][p]) for p in Phase_timer.PHASE_LIST]))
+
+    scene_class.setup     = setup
+    scene_class.tear_down = tear_down
+    return scene_class
+
+
+def get_phase_target_list(scene_class):
+    """Phase_timer's targets: the scene's create_* (create) and animate_* or
+    @animate_section (section) methods, and manim's functions of each phase.
+
+    @param[in] scene_class Scene subclass
+    @return    [(owner, attribute name, phase name)]
+    """
+    target_list = [(scene_class, name, ("create" if name.startswith("create_") else "section"))
+                   for name in dir(scene_class)
+                   if ((name.startswith(("create_", "animate_")) and callable(getattr(scene_class, name))) or
+                       getattr(getattr(scene_class, name), "is_animate_section", False))]
+    return target_list + [
+        (tex_mobject_module, "tex_to_svg_file", "tex_svg"),
+        (SVGMobject,         "__init__",        "tex_svg"),
+        (Mobject,            "update",          "updater"),
+        (Scene,              "update_frame",    "rasterize"),
+        (SceneFileWriter,    "write_frame",     "encode"),
+    ]
+
+
+class Tex_placeholder(VGroup):
+    """A TeX free stand-in of TexMobject/TextMobject for the headless run.
+
+    Each tex string becomes one box submobject (so tex[i] indexing
+    works), the box width is proportional to the string length.
+    """
+    CONFIG = {
+        "box_height":      0.35,
+        "box_char_width":  0.15,
+        "arg_separator":   0.05,
+    }
+    def __init__(self, *tex_strings, **kwargs):
+        digest_config(self, kwargs)
+        self.tex_strings = tex_strings
+        box_list = []
+        for tex_str in tex_strings:
+            box = VMobject()
+            box.set_points_as_corners([ORIGIN, UP, UP + RIGHT, RIGHT, ORIGIN])
+            box.stretch_to_fit_height(self.box_height)
+            box.stretch_to_fit_width(self.box_char_width * max(len(tex_str), 1))
+            box_list.append(box)
+        VGroup.__init__(self, *box_list, **kwargs)
+        self.arrange(RIGHT, buff=self.arg_separator)
+
+
+class Geometry_recorder(object):
+    """Record the points of the scene's mobjects every frame.
+
+    Without record_name_list, the recorded mobjects are the scene's top
+    level mobjects (scene.mobjects, each with its family's points),
+    named <class name>_<order>: the order is the count of the same class
+    mobjects added before it. Thus the names are stable over the frames
+    and the runs, and also scenes that keep the mobjects as local
+    variables are recorded. With record_name_list, a recorded mobject is
+    a scene attribute (a Mobject, or a list of Mobjects: name_0, name_1,
+    ...) that is in the scene at the frame.
+    A frame where the mobject is not in the scene has no points.
+    """
+    def __init__(self, scene, record_name_list=None):
+        """
+        @param[in] scene            scene to record
+        @param[in] record_name_list attribute names to record. None: the scene.mobjects family
+        """
+        self.__scene            = scene
+        self.__record_name_list = record_name_list
+        self.__frame_time_list  = []
+        self.__frame_points     = {}            # name -> [points of frame 0, frame 1, ...]
+        self.__mobject_name     = {}            # id(mobject) -> (mobject, name). Keeps the mobject, so the id is not reused
+        self.__class_count      = {}            # class name -> number of named mobjects
+
+    def get_mobject_name(self, mobj):
+        """Stable name of a top level scene mobject: <class name>_<order>.
+
+        @param[in] mobj mobject
+        @return    name
+        """
+        if (id(mobj) not in self.__mobject_name):
+            class_name = mobj.__class__.__name__
+            order      = self.__class_count.get(class_name, 0)
+            self.__class_count[class_name] = order + 1
+            self.__mobject_name[id(mobj)]  = (mobj, "{0}_{1}".format(class_name, order))
+        return self.__mobject_name[id(mobj)][1]
+
+    def get_named_mobject_list(self):
+        """(name, mobject) list of the recorded mobjects.
+        """
+        name_list = self.__record_name_list
+        if (name_list is None):
+            return [(self.get_mobject_name(mobj), mobj) for mobj in self.__scene.mobjects]
+
+        named_mobj_list = []
+        for name in name_list:
+            attr = getattr(self.__scene, name, None)
+            if (isinstance(attr, Mobject)):
+                named_mobj_list.append((name, attr))
+            elif (isinstance(attr, (list, tuple))):
+                named_mobj_list.extend([("{0}_{1}".format(name, i), mobj) for (i, mobj) in enumerate(attr)
+                                        if isinstance(mobj, Mobject)])
+        return named_mobj_list
+
+    def record(self):
+        """Record the current frame.
+        """
+        frame_idx    = len(self.__frame_time_list)
+        in_scene_set = set(map(id, self.__scene.get_mobject_family_members()))
+        for (name, mobj) in self.get_named_mobject_list():
+            if (id(mobj) not in in_scene_set):
+                continue
+            if (name not in self.__frame_points):
+                self.__frame_points[name] = [None] * frame_idx
+            self.__frame_points[name].append(mobj.get_all_points().copy())
+
+        self.__frame_time_list.append(self.__scene.get_time())
+        for points_list in self.__frame_points.values():
+            if (len(points_list) == frame_idx):
+                points_list.append(None)
+
+    def get_nb_frame(self):
+        return len(self.__frame_time_list)
+
+    def get_array_dict(self):
+        """Recorded frames as numpy arrays.
+
+        "frame_time": (F,) time of each frame. Each mobject name:
+        (F, P, 3) points when its point count is constant and it is in all
+        the frames, otherwise the (sum P_f, 3) points of the frames in order
+        and "<name>__offset": (F + 1,) the frame f's points are
+        points[offset[f]:offset[f + 1]].
+
+        @return name -> numpy array dict
+        """
+        array_dict = {"frame_time": np.array(self.__frame_time_list)}
+        for (name, points_list) in self.__frame_points.items():
+            points_list = [np.zeros((0, 3)) if (p is None) else p for p in points_list]
+            shape_set   = set(p.shape for p in points_list)
+            if ((len(shape_set) == 1) and (len(points_list[0]) > 0)):
+                array_dict[name] = np.stack(points_list)
+            else:
+                array_dict[name] = np.concatenate(points_list)
+                array_dict[name + "__offset"] = np.cumsum([0] + [len(p) for p in points_list])
+        return array_dict
+
+    def save(self, file_name):
+        """Save the recorded frames to a compressed npz (see get_array_dict().)
+
+        @param[in] file_name output .npz file name
+        """
+        np.savez_compressed(file_name, **self.get_array_dict())
+
+
+def get_headless_scene_class(scene_class):
+    """A subclass of scene_class that runs without rendering.
+
+    The animations and updaters run every frame as the usual rendering
+    (same frame_rate), but no frame is drawn or written. Instead, each
+    frame's geometry is recorded by a Geometry_recorder (scene.recorder.)
+
+    @param[in] scene_class Scene subclass
+    @return    headless scene class
+    """
+    class Headless_scene(scene_class):
+        CONFIG = {
+            "record_name_list": None,
+        }
+        def setup(self):
+            self.recorder = Geometry_recorder(self, self.record_name_list)
+            scene_class.setup(self)
+
+        def update_frame(self, *args, **kwargs):
+            pass
+
+        def get_frame(self):
+            return None
+
+        def add_frames(self, *frames):
+            dt = 1 / self.camera.frame_rate
+            for frame in frames:
+                self.increment_time(dt)
+                self.recorder.record()
+
+    Headless_scene.__name__ = "Headless" + scene_class.__name__
+    return Headless_scene
+
+
+def run_headless(scene_class, output_file=None, record_name_list=None, frame_rate=None):
+    """Run a scene's timeline geometry only: no rasterization, no TeX.
+
+    TexMobject/TextMobject are replaced with Tex_placeholder while the
+    scene runs, thus LaTeX is not needed. Useful for regression tests of
+    updaters (compare the npz) and for updater benchmarks.
+
+    Example:
+        cd 202008_corner_cube_mirror
+        python3 -c "import importlib, myutil; m = importlib.import_module('07_corner_cube_ray'); myutil.run_headless(m.CornerCubeRay01, 'ray.npz')"
+
+    @param[in] scene_class      Scene subclass
+    @param[in] output_file      .npz file name. None: not saved
+    @param[in] record_name_list attribute names to record. None: the scene.mobjects family
+    @param[in] frame_rate       frames per second. None: the camera's default
+    @return    Geometry_recorder of the run
+    """
+    camera_config = {"pixel_height": 9, "pixel_width": 16}
+    if (frame_rate is not None):
+        camera_config["frame_rate"] = frame_rate
+
+    module_dict_list = [sys.modules[scene_class.__module__].__dict__, globals()]
+    tex_class_backup = [{name: module_dict.get(name) for name in ["TexMobject", "TextMobject"]}
+                        for module_dict in module_dict_list]
+    for module_dict in module_dict_list:
+        module_dict["TexMobject"]  = Tex_placeholder
+        module_dict["TextMobject"] = Tex_placeholder
+
+    start_time = time.time()
+    try:
+        scene = get_headless_scene_class(scene_class)(camera_config=camera_config,
+                                                      record_name_list=record_name_list)
+    finally:
+        for (module_dict, backup) in zip(module_dict_list, tex_class_backup):
+            for (name, tex_class) in backup.items():
+                if (tex_class is None):
+                    module_dict.pop(name, None)
+                else:
+                    module_dict[name] = tex_class
+    elapsed_time = time.time() - start_time
+
+    recorder = scene.recorder
+    print("headless {0}: {1} frames in {2:.3f} sec ({3:.1f} frames/sec)".format(
+        scene_class.__name__, recorder.get_nb_frame(), elapsed_time,
+        recorder.get_nb_frame() / max(elapsed_time, 1e-9)))
+    if (output_file is not None):
+        recorder.save(output_file)
+    return recorder
@@ -58,6 +58,8 @@ class NoPerfectTest01(Scene):
         #-- shared variables
         "time_wait":            4,
         "is_show_only":         False,
+        # emphasize the table contents by myutil.TableResize (not in the published video)
+        "is_show_table_resize": False,
 
         #-- shared MObjects
         # time parameter t and its value tracker
@@ -109,8 +111,7 @@ class NoPerfectTest01(Scene):
         "height_tcol":        [1.0, 1.0, 1.0, 1.0],
 
 
-        "line_tab_hline": None,
-        "line_tab_vline": None,
+        "table":                None,
         "txt_tab_column_title": None,
         "txt_tab_test_title":   None,
         "txt_tab_ill_title":    None,
@@ -205,90 +206,23 @@ class NoPerfectTest01(Scene):
 
 
 
-    def get_tab_cell_anchor_pos(self, px, py, show=False):
-        """
-        Position * is the table cell anchor position
-        *-------------+
-        |tab_cell(x,y)|
-        +-------------+
-        """
-        is_show = show
-        cell_pos = myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                    self.width_trow, self.height_tcol,
-                                                    px, py, LEFT + UP, show=is_show)
-
-        return cell_pos
-
-
-
-    def get_tab_width(self):
-        """table total width
-        """
-        tab_width = 0.0
-        for w in self.width_trow:
-            tab_width += w
-        return tab_width
-
-
-    def get_tab_height(self):
-        """table total height
-        """
-        tab_height = 0.0
-        for h in self.height_tcol:
-            tab_height += h
-        return tab_height
-
-
     def create_table(self):
-        # horizontal lines
-        tab_width = self.get_tab_width()
-        self.line_tab_hline = []
-        for hidx in range(0, len(self.height_tcol)):
-            anchor_pos = self.get_tab_cell_anchor_pos(0, hidx)
-            self.line_tab_hline.append(
-                Line(anchor_pos, anchor_pos + tab_width * RIGHT,
-                     color=self.color_tab_line, stroke_width=self.stroke_width_tab_line))
-        # append the last hline
-        hsize = len(self.height_tcol)
-        print("hsize: {0}".format(hsize))
-        last_h_anchor_pos = self.get_tab_cell_anchor_pos(0, hsize - 1) + self.height_tcol[hsize - 1] * DOWN
-        self.line_tab_hline.append(
-            Line(last_h_anchor_pos, last_h_anchor_pos + tab_width * RIGHT,
-                 color=self.color_tab_line, stroke_width=self.stroke_width_tab_line))
-
-
-        # (0,2) vline is one level shorter
-        tab_height = self.get_tab_height()
-        self.line_tab_vline = []
-        self.line_tab_vline.append(
-            Line(self.get_tab_cell_anchor_pos(0, 0), self.get_tab_cell_anchor_pos(0, 0) + tab_height * DOWN,
-                 color=self.color_tab_line, stroke_width=self.stroke_width_tab_line))
-        self.line_tab_vline.append(
-            Line(self.get_tab_cell_anchor_pos(1, 0), self.get_tab_cell_anchor_pos(1, 0) + tab_height * DOWN,
-                 color=self.color_tab_line, stroke_width=self.stroke_width_tab_line))
-        # [2] vline is one level (self.height_tcol[0]) shorter
-        self.line_tab_vline.append(
-            Line(self.get_tab_cell_anchor_pos(2, 1),
-                 self.get_tab_cell_anchor_pos(2, 1) + (tab_height - self.height_tcol[0]) * DOWN,
-                 color=self.color_tab_line, stroke_width=self.stroke_width_tab_line))
-
-        # append the last vline
-        vsize = len(self.width_trow)
-        last_v_anchor_pos = self.get_tab_cell_anchor_pos(vsize - 1, 0) + self.width_trow[vsize - 1] * RIGHT
-        self.line_tab_vline.append(
-            Line(last_v_anchor_pos, last_v_anchor_pos + tab_height * DOWN,
-                 color=self.color_tab_line, stroke_width=self.stroke_width_tab_line))
+        # table rules: one mobject, the cell labels are attached to the table cells
+        # vline [2] is one level (self.height_tcol[0]) shorter
+        nb_col = len(self.width_trow)
+        nb_row = len(self.height_tcol)
+        self.table = myutil.TableMobject(self.pos_tab_origin, self.width_trow, self.height_tcol,
+                                         vline_list=[(0, 0, nb_row), (1, 0, nb_row), (2, 1, nb_row), (nb_col, 0, nb_row)],
+                                         color=self.color_tab_line, stroke_width=self.stroke_width_tab_line)
 
         debug_show_all_cell_position = False
         if (debug_show_all_cell_position):
             # Show cell positions
+            cell_pos_ary = self.table.layout.get_all_cell_critical_pos(ORIGIN)
             anchor_txt = []
             for x in range(0, len(self.width_trow)):
                 for y in range(0, len(self.height_tcol)):
-                    anchor_txt.append(Text("({0},{1})".format(x, y)).move_to(
-                        myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                         self.width_trow, self.height_tcol,
-                                                         x, y, ORIGIN, show=True)))
+                    anchor_txt.append(Text("({0},{1})".format(x, y)).move_to(cell_pos_ary[y, x]))
                     self.add(*anchor_txt)
 
 
@@ -299,16 +233,9 @@ class NoPerfectTest01(Scene):
             Text(r"実際"    ).scale(scale_col_title_txt)
         ]
 
-        myutil.critical_point_move_to(self.txt_tab_column_title[0], ORIGIN,
-                                      myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                                       self.width_trow, self.height_tcol,
-                                                                       0, 0, ORIGIN, show=False))
-        table_row_2_adjust = (self.width_trow[2] / 2)
-        myutil.critical_point_move_to(self.txt_tab_column_title[1], ORIGIN,
-                                      myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                                       self.width_trow, self.height_tcol,
-                                                                       1, 0, ORIGIN, show=False)
-                                      + table_row_2_adjust * RIGHT)
+        self.table.attach_cell_mobject(0, 0, self.txt_tab_column_title[0])
+        # '実際' is on the merged cells (1,0)-(2,0)
+        self.table.attach_cell_mobject(1, 0, self.txt_tab_column_title[1], nb_span_x=2)
 
 
 
@@ -320,15 +247,9 @@ class NoPerfectTest01(Scene):
         ]
 
         # '+' is localted at (0,2)
-        myutil.critical_point_move_to(self.txt_tab_test_title[0], ORIGIN,
-                                      myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                                       self.width_trow, self.height_tcol,
-                                                                       0, 2, ORIGIN, show=False))
+        self.table.attach_cell_mobject(0, 2, self.txt_tab_test_title[0])
         # '-' is localted at (0,3)
-        myutil.critical_point_move_to(self.txt_tab_test_title[1], ORIGIN,
-                                      myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                                       self.width_trow, self.height_tcol,
-                                                                       0, 3, ORIGIN, show=False))
+        self.table.attach_cell_mobject(0, 3, self.txt_tab_test_title[1])
 
 
         # ill, not ill title
@@ -342,14 +263,8 @@ class NoPerfectTest01(Scene):
             Text(r"病気").  scale(scale_col_title_txt),
             not_ill,
         ]
-        myutil.critical_point_move_to(self.txt_tab_ill_title[0], ORIGIN,
-                                      myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                                       self.width_trow, self.height_tcol,
-                                                                       1, 1, ORIGIN, show=False))
-        myutil.critical_point_move_to(self.txt_tab_ill_title[1], ORIGIN,
-                                      myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                                       self.width_trow, self.height_tcol,
-                                                                       2, 1, ORIGIN, show=False))
+        self.table.attach_cell_mobject(1, 1, self.txt_tab_ill_title[0])
+        self.table.attach_cell_mobject(2, 1, self.txt_tab_ill_title[1])
 
 
         # table contents
@@ -359,35 +274,22 @@ class NoPerfectTest01(Scene):
             Text(r"真−", font="sans-serif",
                  t2c = {"−": self.color_negative}), # t2w = {"−": ULTRABOLD} doesn't work
         ]
-        myutil.critical_point_move_to(self.txt_tab_true_pn[0], ORIGIN,
-                                      myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                                       self.width_trow, self.height_tcol,
-                                                                       1, 2, ORIGIN, show=False))
-        myutil.critical_point_move_to(self.txt_tab_true_pn[1], ORIGIN,
-                                      myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                                       self.width_trow, self.height_tcol,
-                                                                       2, 3, ORIGIN, show=False))
+        self.table.attach_cell_mobject(1, 2, self.txt_tab_true_pn[0])
+        self.table.attach_cell_mobject(2, 3, self.txt_tab_true_pn[1])
 
         self.txt_tab_false_pn = [
             Text(r"偽＋", font="sans-serif", t2c = {"＋": self.color_positive}),
             Text(r"偽−", font="sans-serif", t2c = {"−": self.color_negative}),
         ]
-        myutil.critical_point_move_to(self.txt_tab_false_pn[0], ORIGIN,
-                                      myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                                       self.width_trow, self.height_tcol,
-                                                                       2, 2, ORIGIN, show=False))
-        myutil.critical_point_move_to(self.txt_tab_false_pn[1], ORIGIN,
-                                      myutil.get_tab_cell_critical_pos(self.pos_tab_origin,
-                                                                       self.width_trow, self.height_tcol,
-                                                                       1, 3, ORIGIN, show=False))
+        self.table.attach_cell_mobject(2, 2, self.txt_tab_false_pn[0])
+        self.table.attach_cell_mobject(1, 3, self.txt_tab_false_pn[1])
 
 
 
 
     def animate_table(self):
         if (self.is_show_only):
-            self.add(*self.line_tab_hline)
-            self.add(*self.line_tab_vline)
+            self.add(self.table)
             self.add(*self.txt_tab_column_title)
             self.add(*self.txt_tab_test_title)
             self.add(*self.txt_tab_ill_title)
@@ -395,8 +297,7 @@ class NoPerfectTest01(Scene):
             self.add(*self.txt_tab_false_pn)
             return
 
-        self.play(*[ShowCreation(mobj) for mobj in self.line_tab_hline],
-                  *[ShowCreation(mobj) for mobj in self.line_tab_vline])
+        self.play(myutil.TableRuleCreation(self.table))
         self.wait(self.time_wait)
 
         self.play(FadeIn(self.txt_tab_column_title[0])) # Test: 検査結果
@@ -446,6 +347,14 @@ class NoPerfectTest01(Scene):
                   ApplyMethod(self.txt_tab_false_pn[1].scale, 1.0/emp_factor))
         self.wait(self.time_wait)
 
+        if (self.is_show_table_resize):
+            # widen the contents cells, the rules and the cells follow
+            self.play(myutil.TableResize(self.table,
+                                         width_ary =[self.width_trow[0]] + [emp_factor * w for w in self.width_trow[1:]],
+                                         height_ary=self.height_tcol[:2] + [emp_factor * h for h in self.height_tcol[2:]]))
+            self.play(myutil.TableResize(self.table, width_ary=self.width_trow, height_ary=self.height_tcol))
+            self.wait(self.time_wait)
+
 
 
     def construct(self):
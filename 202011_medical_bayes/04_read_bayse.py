@@ -297,7 +297,7 @@ class ReadBayesTheorem01(Scene):
             self.txt_prob_exp[i].next_to(self.tex_prob_eq[i], buff=0.2)
 
         # working memory (Transform(a, b): a = b, a is written
-        eq_work  = copy.deepcopy(self.tex_prob_eq[0])
+        eq_work  = myutil.snapshot(self.tex_prob_eq[0])
 
         # P()
         self.play(FadeIn(eq_work))
@@ -24,6 +24,7 @@ from manim import *
 import copy, numpy
 import myutil
 
+@myutil.time_phases
 class BayesEventExample01(Scene):
 # class BayesEventExample01(LinearTransformationScene):
     """Bayes theorem: event example 01: test positive/negative and really ill
@@ -170,16 +171,16 @@ class BayesEventExample01(Scene):
             self.mtex_bayes_simple[i][j].set_color(self.col_e)
 
         # full Bayes form                                 # indices for h,e color (MathTex removes white space))
-        self.mtex_bayes_full = MathTex(r"P(H|E)",          # [0] e [0,4], h [0,2]
-                                       r"={",              # [1]
-                                       r"{P(H)",           # [2]          h [2,2]
-                                       r"P(E|H)}",         # [3] e [3,2], h [3,4]
-                                       r"\over",           # [4]
-                                       r"{P(H)",           # [5]          h [5,2]
-                                       r"P(E|H)}",         # [6] e [6,2], h [6,4]
-                                       r"+",               # [7]
-                                       r"{P(\lnot H)",     # [8]          h [8,3], n [8,2]
-                                       r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5], n [9,4]
+        self.mtex_bayes_full = myutil.cached_tex(MathTex, r"P(H|E)",          # [0] e [0,4], h [0,2]
+                                                          r"={",              # [1]
+                                                          r"{P(H)",           # [2]          h [2,2]
+                                                          r"P(E|H)}",         # [3] e [3,2], h [3,4]
+                                                          r"\over",           # [4]
+                                                          r"{P(H)",           # [5]          h [5,2]
+                                                          r"P(E|H)}",         # [6] e [6,2], h [6,4]
+                                                          r"+",               # [7]
+                                                          r"{P(\lnot H)",     # [8]          h [8,3], n [8,2]
+                                                          r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5], n [9,4]
         ).scale(self.scale_eq_f)
         myutil.critical_point_move_to(self.mtex_bayes_full, LEFT + DOWN, ORIGIN + -5.0 * RIGHT + 1.4 * UP)
 
@@ -197,13 +198,13 @@ class BayesEventExample01(Scene):
         # --- Event examples
         # event example H
         var_buff = 0.2
-        self.mtex_event_h = MathTex(r"H").scale(self.scale_eq_f).set_color(self.col_h)
+        self.mtex_event_h = myutil.cached_tex(MathTex, r"H").scale(self.scale_eq_f).set_color(self.col_h)
         self.txt_event_h  = Text(r": 病気").scale(self.scale_txt_f)
         myutil.critical_point_move_to(self.mtex_event_h, RIGHT + DOWN, ORIGIN + -4.0 * RIGHT +  0.2 * UP)
         self.txt_event_h.next_to(self.mtex_event_h, buff=var_buff)
 
         # event example E
-        self.mtex_event_e = MathTex(r"E").scale(self.scale_eq_f).set_color(self.col_e)
+        self.mtex_event_e = myutil.cached_tex(MathTex, r"E").scale(self.scale_eq_f).set_color(self.col_e)
         self.txt_event_e  = Text(r": 検査＋", t2c={r"[3:4]": self.col_positive}).scale(self.scale_txt_f)
         myutil.critical_point_move_to(self.mtex_event_e, RIGHT + DOWN, ORIGIN + -4.0 * RIGHT + -0.6 * UP)
         self.txt_event_e.next_to(self.mtex_event_e, buff=var_buff)
@@ -262,6 +263,7 @@ class BayesEventExample01(Scene):
         self.txt_event_prob_e.next_to(self.mtex_event_prob_e, buff=var_buff)
 
 
+    @myutil.animate_section
     def show_title(self):
         """ベイズの定理
         """
@@ -273,6 +275,7 @@ class BayesEventExample01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_bayes_simple_full(self):
         """1st show
         """
@@ -296,6 +299,7 @@ class BayesEventExample01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_bayes_simple_lhs(self):
         """Read P(H|E)
         """
@@ -311,7 +315,7 @@ class BayesEventExample01(Scene):
             return
 
         # Move lhs P(H|E)
-        phe = copy.deepcopy(self.mtex_bayes_simple[0])   # animation temp phe
+        phe = myutil.snapshot(self.mtex_bayes_simple[0]) # animation temp phe
         self.add(phe)
 
         # move P(H|E), simple equation fade out
@@ -323,7 +327,7 @@ class BayesEventExample01(Scene):
         self.wait(self.time_wait)
 
         # extract H|E, move to start position at P(H|E)
-        h_b_e =  copy.deepcopy(self.mtex_event_h_b_e)    # animation temp h_b_e
+        h_b_e =  myutil.snapshot(self.mtex_event_h_b_e)  # animation temp h_b_e
         h_b_e.move_to(phe.get_center() + 0.29 * RIGHT)
         self.add(h_b_e)
         self.play(ApplyMethod(h_b_e.move_to, self.mtex_event_h_b_e.get_center()))
@@ -353,6 +357,7 @@ class BayesEventExample01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_bayes_simple_rhs(self):
         """P(H)P(E|H) \over P(E)
         """
@@ -407,6 +412,7 @@ class BayesEventExample01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_bayes_simple_to_full(self):
         """Transit Bayes simple forma to full form
         """
@@ -544,6 +550,7 @@ class BayesEventExample01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_event_annotation(self):
         """Save H: ill, and E: test positive to the upper right
         """
@@ -575,6 +582,14 @@ class BayesEventExample01(Scene):
 
 
 
+    def setup(self):
+        """compile the TeX fragments of this scene in parallel before construct(),
+        keep the partial movies of the unchanged animations
+        """
+        myutil.precompile_scene_tex(self)
+        myutil.use_partial_movie_cache(self)
+
+
     def construct(self):
         """Test and Bayes intro
         """
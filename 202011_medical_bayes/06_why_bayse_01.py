@@ -25,6 +25,7 @@ import copy, numpy
 import myutil
 
 
+@myutil.time_phases
 class WhyBayes01(Scene):
 # class WhyBayes01(LinearTransformationScene):
     """Bayes theorem: event example 01: test positive/negative and really ill
@@ -120,16 +121,16 @@ class WhyBayes01(Scene):
 
 
         # full Bayes form                                 # indices for h,e color (MathTex removes white space))
-        self.mtex_bayes_full = MathTex(r"P(H|E)",          # [0] e [0,4], h [0,2]
-                                       r"={",              # [1]
-                                       r"{P(H)",           # [2]          h [2,2]
-                                       r"P(E|H)}",         # [3] e [3,2], h [3,4]
-                                       r"\over",           # [4]
-                                       r"{P(H)",           # [5]          h [5,2]
-                                       r"P(E|H)}",         # [6] e [6,2], h [6,4]
-                                       r"+",               # [7]
-                                       r"{P(\lnot H)",     # [8]          h [8,3] n [8,2]
-                                       r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5] n [9,4]
+        self.mtex_bayes_full = myutil.cached_tex(MathTex, r"P(H|E)",          # [0] e [0,4], h [0,2]
+                                                          r"={",              # [1]
+                                                          r"{P(H)",           # [2]          h [2,2]
+                                                          r"P(E|H)}",         # [3] e [3,2], h [3,4]
+                                                          r"\over",           # [4]
+                                                          r"{P(H)",           # [5]          h [5,2]
+                                                          r"P(E|H)}",         # [6] e [6,2], h [6,4]
+                                                          r"+",               # [7]
+                                                          r"{P(\lnot H)",     # [8]          h [8,3] n [8,2]
+                                                          r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5] n [9,4]
         ).scale(self.scale_eq_f)
         myutil.critical_point_move_to(self.mtex_bayes_full, LEFT + DOWN, ORIGIN + -5.0 * RIGHT + 1.4 * UP)
 
@@ -146,14 +147,14 @@ class WhyBayes01(Scene):
         # --- Event examples
         # event example H
         var_buff = 0.2
-        self.mtex_event_h = MathTex(r"H").scale(self.scale_eq_f).set_color(self.col_h)
-        self.txt_event_h = Text(r": 病気").scale(self.scale_txt_f)
+        self.mtex_event_h = myutil.cached_tex(MathTex, r"H").scale(self.scale_eq_f).set_color(self.col_h)
+        self.txt_event_h = myutil.cached_tex(Text, r": 病気").scale(self.scale_txt_f)
         myutil.critical_point_move_to(self.mtex_event_h, RIGHT + DOWN, ORIGIN + -4.0 * RIGHT +  0.2 * UP)
         self.txt_event_h.next_to(self.mtex_event_h, buff=var_buff)
 
         # event example E
-        self.mtex_event_e = MathTex(r"E").scale(self.scale_eq_f).set_color(self.col_e)
-        self.txt_event_e = Text(r": 検査＋", t2c={r"[3:4]": self.col_positive}).scale(self.scale_txt_f)
+        self.mtex_event_e = myutil.cached_tex(MathTex, r"E").scale(self.scale_eq_f).set_color(self.col_e)
+        self.txt_event_e = myutil.cached_tex(Text, r": 検査＋", t2c={r"[3:4]": self.col_positive}).scale(self.scale_txt_f)
         myutil.critical_point_move_to(self.mtex_event_e, RIGHT + DOWN, ORIGIN + -4.0 * RIGHT + -0.6 * UP)
         self.txt_event_e.next_to(self.mtex_event_e, buff=var_buff)
 
@@ -231,6 +232,7 @@ class WhyBayes01(Scene):
         myutil.critical_point_move_to(self.txt_event_prob_e_b_not_h[2], LEFT + DOWN, 3.5 * RIGHT + -3.1 * UP)
 
 
+    @myutil.animate_section
     def show_title(self):
         """何故ベイズの定理?
         """
@@ -243,6 +245,7 @@ class WhyBayes01(Scene):
 
 
 
+    @myutil.animate_section
     def show_bayes(self):
         """ベイズの定理
         """
@@ -272,7 +275,7 @@ class WhyBayes01(Scene):
     def copy_move_term_explain(self, src_term_list, dst_term, dst_exp):
         """convenient function for unknown and known explanation
         """
-        work_list = copy.deepcopy(src_term_list)
+        work_list = [myutil.snapshot(mobj) for mobj in src_term_list]
         myutil.move_src_list_dst(self, work_list, dst_term)
         self.remove(*work_list)
         self.add(dst_term)
@@ -290,6 +293,7 @@ class WhyBayes01(Scene):
 
 
 
+    @myutil.animate_section
     def animate_why(self):
         """why bayes?
         """
@@ -361,6 +365,14 @@ class WhyBayes01(Scene):
         self.wait(self.time_wait)
 
 
+    def setup(self):
+        """compile the TeX fragments of this scene in parallel before construct(),
+        keep the partial movies of the unchanged animations
+        """
+        myutil.precompile_scene_tex(self)
+        myutil.use_partial_movie_cache(self)
+
+
     def construct(self):
         """Test and Bayes intro
         """
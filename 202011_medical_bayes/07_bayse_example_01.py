@@ -18,6 +18,10 @@
 #   python3 -m manim 07_bayse_example_01.py BayesExample01 --resolution 720,1280 -p --high_quality
 # Preview resolution
 #   python3 -m manim 07_bayse_example_01.py BayesExample01 --resolution 360,640 -p -ql
+# Preview from a section (the former sections are fast-forwarded)
+#   MANIM_START_SECTION=animate_check python3 -m manim 07_bayse_example_01.py BayesExample01 --resolution 360,640 -p -ql
+# Per phase timing per section (JSON)
+#   MANIM_PHASE_TIMING=timing.json python3 -m manim 07_bayse_example_01.py BayesExample01 --resolution 360,640 -p -ql
 #
 
 from manim import *
@@ -25,6 +29,7 @@ import copy, numpy
 import myutil
 
 
+@myutil.time_phases
 class BayesExample01(Scene):
 # class BayesExample01(LinearTransformationScene):
     """Bayes theorem: example 01: simple concrete example 1
@@ -124,16 +129,16 @@ class BayesExample01(Scene):
 
 
         # full Bayes form                                 # indices for h,e color (MathTex removes white space))
-        self.mtex_bayes_full = MathTex(r"P(H|E)",          # [0] e [0,4], h [0,2]
-                                       r"={",              # [1]
-                                       r"{P(H)",           # [2]          h [2,2]
-                                       r"P(E|H)}",         # [3] e [3,2], h [3,4]
-                                       r"\over",           # [4]
-                                       r"{P(H)",           # [5]          h [5,2]
-                                       r"P(E|H)}",         # [6] e [6,2], h [6,4]
-                                       r"+",               # [7]
-                                       r"{P(\lnot H)",     # [8]          h [8,3], n [8,2]
-                                       r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5], n [9,4]
+        self.mtex_bayes_full = myutil.cached_tex(MathTex, r"P(H|E)",          # [0] e [0,4], h [0,2]
+                                                          r"={",              # [1]
+                                                          r"{P(H)",           # [2]          h [2,2]
+                                                          r"P(E|H)}",         # [3] e [3,2], h [3,4]
+                                                          r"\over",           # [4]
+                                                          r"{P(H)",           # [5]          h [5,2]
+                                                          r"P(E|H)}",         # [6] e [6,2], h [6,4]
+                                                          r"+",               # [7]
+                                                          r"{P(\lnot H)",     # [8]          h [8,3], n [8,2]
+                                                          r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5], n [9,4]
         ).scale(self.scale_eq_f)
         myutil.critical_point_move_to(self.mtex_bayes_full, LEFT + DOWN, ORIGIN + -5.0 * RIGHT + 1.4 * UP)
 
@@ -149,15 +154,15 @@ class BayesExample01(Scene):
 
         # --- Event examples
         # event example H
-        self.mtex_event_h = MathTex(r"H").  scale(self.scale_event_eq_f).set_color(self.col_h).\
+        self.mtex_event_h = myutil.cached_tex(MathTex, r"H").  scale(self.scale_event_eq_f).set_color(self.col_h).\
                             move_to(0.2 * RIGHT + 3.4 * UP)
-        self.txt_event_h = Text(r": 病気").scale(self.scale_event_txt_f).\
+        self.txt_event_h = myutil.cached_tex(Text, r": 病気").scale(self.scale_event_txt_f).\
                            move_to(1.3 * RIGHT + 3.4 * UP)
 
         # event example E
-        self.mtex_event_e = MathTex(r"E").scale(self.scale_event_eq_f).set_color(self.col_e).\
+        self.mtex_event_e = myutil.cached_tex(MathTex, r"E").scale(self.scale_event_eq_f).set_color(self.col_e).\
                             move_to(2.7 * RIGHT + 3.37 * UP)
-        self.txt_event_e = Text(r": 検査＋", t2c={r"[3:4]": self.col_positive}).\
+        self.txt_event_e = myutil.cached_tex(Text, r": 検査＋", t2c={r"[3:4]": self.col_positive}).\
                                                   scale(self.scale_event_txt_f).move_to(4.0 * RIGHT + 3.37 * UP)
 
         # show ten people
@@ -248,6 +253,7 @@ class BayesExample01(Scene):
             self.text_annot[key].move_to(self.mtex_annot[key].get_center())
 
 
+    @myutil.animate_section
     def show_title(self):
         """架空の具体例 1
         """
@@ -268,6 +274,7 @@ class BayesExample01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_people(self):
         """10 people example
         """
@@ -309,6 +316,7 @@ class BayesExample01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_eq(self):
         """sibstitute right hand side
         """
@@ -575,6 +583,7 @@ class BayesExample01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_check(self):
         """check lhs and rhs
         """
@@ -620,6 +629,14 @@ class BayesExample01(Scene):
         self.wait(self.time_wait)
 
 
+    def setup(self):
+        """compile the TeX fragments of this scene in parallel before construct(),
+        keep the partial movies of the unchanged animations
+        """
+        myutil.precompile_scene_tex(self)
+        myutil.use_partial_movie_cache(self)
+
+
     def construct(self):
         """Test and Bayes intro
         """
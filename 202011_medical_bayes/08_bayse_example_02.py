@@ -25,6 +25,7 @@ import copy, numpy, random
 import myutil
 
 
+@myutil.time_phases
 class BayesExample02(Scene):
 # class BayesExample02(LinearTransformationScene):
     """Bayes theorem: example 02: more realistic concrete example (example 2)
@@ -141,16 +142,16 @@ class BayesExample02(Scene):
         myutil.critical_point_move_to(self.txt_title_bayes, LEFT + DOWN, ORIGIN + -6.3 * RIGHT + 3.0 * UP)
 
         # full Bayes form                                 # indices for h,e color (MathTex removes white space))
-        self.mtex_bayes_full = MathTex(r"P(H|E)",          # [0] e [0,4], h [0,2]
-                                       r"={",              # [1]
-                                       r"{P(H)",           # [2]          h [2,2]
-                                       r"P(E|H)}",         # [3] e [3,2], h [3,4]
-                                       r"\over",           # [4]
-                                       r"{P(H)",           # [5]          h [5,2]
-                                       r"P(E|H)}",         # [6] e [6,2], h [6,4]
-                                       r"+",               # [7]
-                                       r"{P(\lnot H)",     # [8]          h [8,3], n [8,2]
-                                       r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5], n [9,4]
+        self.mtex_bayes_full = myutil.cached_tex(MathTex, r"P(H|E)",          # [0] e [0,4], h [0,2]
+                                                          r"={",              # [1]
+                                                          r"{P(H)",           # [2]          h [2,2]
+                                                          r"P(E|H)}",         # [3] e [3,2], h [3,4]
+                                                          r"\over",           # [4]
+                                                          r"{P(H)",           # [5]          h [5,2]
+                                                          r"P(E|H)}",         # [6] e [6,2], h [6,4]
+                                                          r"+",               # [7]
+                                                          r"{P(\lnot H)",     # [8]          h [8,3], n [8,2]
+                                                          r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5], n [9,4]
         ).scale(self.scale_eq_f)
         myutil.critical_point_move_to(self.mtex_bayes_full, LEFT + DOWN, ORIGIN + -5.0 * RIGHT + 1.4 * UP)
 
@@ -166,14 +167,14 @@ class BayesExample02(Scene):
 
         # --- Event examples
         # event example H
-        self.mtex_event_h = MathTex(r"H").  scale(self.scale_event_eq_f).set_color(
+        self.mtex_event_h = myutil.cached_tex(MathTex, r"H").  scale(self.scale_event_eq_f).set_color(
             self.col_h).move_to(0.2 * RIGHT + 3.4 * UP)
-        self.txt_event_h = Text(r": 病気").scale(self.scale_event_txt_f).move_to(1.3 * RIGHT + 3.4 * UP)
+        self.txt_event_h = myutil.cached_tex(Text, r": 病気").scale(self.scale_event_txt_f).move_to(1.3 * RIGHT + 3.4 * UP)
 
         # event example E
-        self.mtex_event_e = MathTex(r"E").scale(self.scale_event_eq_f).set_color(
+        self.mtex_event_e = myutil.cached_tex(MathTex, r"E").scale(self.scale_event_eq_f).set_color(
             self.col_e).move_to(2.7 * RIGHT + 3.37 * UP)
-        self.txt_event_e = Text(r": 検査＋", t2c={r"[3:4]": self.col_positive}).scale(
+        self.txt_event_e = myutil.cached_tex(Text, r": 検査＋", t2c={r"[3:4]": self.col_positive}).scale(
             self.scale_event_txt_f).move_to(4.0 * RIGHT + 3.37 * UP)
 
         # --- another example (counter intuitive, but more realistic
@@ -226,6 +227,7 @@ class BayesExample02(Scene):
             myutil.critical_point_move_to(self.mtex_p_e_not_h[i], text_align[i], ORIGIN + mtex_ri[i] * RIGHT + text_up[3] * UP)
 
 
+    @myutil.animate_section
     def show_title(self):
         """より現実的な具体例
         """
@@ -248,6 +250,7 @@ class BayesExample02(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_description(self):
         """description
         """
@@ -304,6 +307,7 @@ class BayesExample02(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_substitute(self):
         """simplily fraction
         """
@@ -386,6 +390,7 @@ class BayesExample02(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_simplify(self):
         """simplily the rhs
         """
@@ -489,6 +494,14 @@ class BayesExample02(Scene):
         return
 
 
+    def setup(self):
+        """compile the TeX fragments of this scene in parallel before construct(),
+        keep the partial movies of the unchanged animations
+        """
+        myutil.precompile_scene_tex(self)
+        myutil.use_partial_movie_cache(self)
+
+
     def construct(self):
         """More realistic example (example 2)
         """
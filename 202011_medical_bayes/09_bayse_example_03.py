@@ -21,10 +21,11 @@
 #
 
 from manim import *
-import copy, numpy, random
+import copy, numpy
 import myutil
 
 
+@myutil.time_phases
 class BayesExample03(Scene):
 # class BayesExample03(LinearTransformationScene):
     """Bayes theorem: example 03: more realistic concrete example (example 2)
@@ -115,26 +116,35 @@ class BayesExample03(Scene):
         "pos_people_min": -6.2 * RIGHT + -3.5 * UP,
         "pos_people_max":  6.2 * RIGHT +  0.5 * UP,
 
-        # each delta
-        "people_dx": None,
-        "people_dy": None,
+        # people grid layout (myutil.GridLayout)
+        "people_grid": None,
 
         # True positive, False positive labels
         "scale_label_txt": 0.9,
 
+        #--- population simulation (myutil.simulate_population, exact expected counts)
+        #  P(H), P(E|H), P(E|not H) of the equation
+        "p_h":        0.001,
+        "p_e_h":      1.0,
+        "p_e_not_h":  0.01,
+        #  the first seed from this whose positive labels do not overlap
+        "population_seed": 0,
+        #  labels overlap when both |dx| and |dy| of pcoords are less than these
+        "label_clearance_pcoord": [5, 3],
+        #  labels of the people above this row reach the equation (mtex_bayes_full)
+        "label_max_row_pcoord": 16,
+
         #--- True positive
         #  only 1 person
         "label_true_positive": None,
-        # pcoord is person's array index coords
-        "true_positive_pcoords": [[22, 11],],
+        # pcoord is person's array index coords (simulated)
+        "true_positive_pcoords": None,
 
         # False positive [10]
         "label_false_positive": None,
 
-        # False positive random position by gen_false_positive() and adjusted
-        # pcoord is person's array index coords
-        "false_positive_pcoords": [[2, 8], [32, 15], [10, 1], [35, 11], [5, 16],
-                                   [32, 4], [18, 4], [48, 3], [39, 8],  [41, 15], ],
+        # pcoord is person's array index coords (simulated)
+        "false_positive_pcoords": None,
 
         # person animation scale factor
         "person_scale_factor": 10.0,
@@ -164,27 +174,29 @@ class BayesExample03(Scene):
     }
 
 
-    def get_person_position(self, pcoord):
-        """get the position of person of (x, y)"""
-        return self.pos_people_min + pcoord[0] * self.people_dx * RIGHT + pcoord[1] * self.people_dy * UP
+    def simulate_positive_pcoords(self):
+        """Sample the 1000 people and set the true/false positive pcoords.
 
-    def get_person_1d_idx(self, pcoord):
-        """get the 1D array index of person of index position coordinates
-        pcoord = [ix, iy]
-        """
-        return pcoord[0] + pcoord[1] * self.nb_people_x
-
-    def gen_false_positive(self):
-        """generate:
-        * 1  true positive index coords
-        * 10 false positive index coords
-            [[24, 13],
-             [2, 8], [32, 15], [25, 9], [30, 11], [37, 6],
-             [32, 4], [18, 4], [48, 3], [39, 8], [34, 19], ],
+        The seeds from population_seed are tried until no two positive
+        labels overlap and no positive person is above label_max_row_pcoord
+        (the label would overlap the equation.)
         """
-        random.seed(0)
-        for i in range(0, 11):
-            print("[{0}, {1}], ".format(random.randint(0,50), random.randint(0,20)))
+        nb_person = self.people_grid.get_nb_cell()
+        clearance = numpy.array(self.label_clearance_pcoord)
+        for seed in range(self.population_seed, self.population_seed + 10000):
+            population = myutil.simulate_population(nb_person, self.p_h, self.p_e_h, self.p_e_not_h,
+                                                    seed=seed, is_exact=True)
+            pcoords = self.people_grid.get_pcoord(population.get_positive_idx())
+            diff    = numpy.abs(pcoords[:, numpy.newaxis, :] - pcoords[numpy.newaxis, :, :])
+            is_overlap = numpy.all(diff < clearance, axis=2)
+            numpy.fill_diagonal(is_overlap, False)
+            if ((not is_overlap.any()) and (pcoords[:, 1].max() <= self.label_max_row_pcoord)):
+                break
+        else:
+            raise ValueError("No population without label overlap, reduce label_clearance_pcoord.")
+
+        self.true_positive_pcoords  = self.people_grid.get_pcoord(population.tp_idx).tolist()
+        self.false_positive_pcoords = self.people_grid.get_pcoord(population.fp_idx).tolist()
 
 
     def create_bayes_eq(self):
@@ -195,16 +207,16 @@ class BayesExample03(Scene):
         myutil.critical_point_move_to(self.txt_title_bayes, LEFT + DOWN, ORIGIN + -6.3 * RIGHT + 3.0 * UP)
 
         # full Bayes form                                  # indices for h,e color (MathTex removes white space))
-        self.mtex_bayes_full = MathTex(r"P(H|E)",          # [0] e [0,4], h [0,2]
-                                       r"={",              # [1]
-                                       r"{P(H)",           # [2]          h [2,2]
-                                       r"P(E|H)}",         # [3] e [3,2], h [3,4]
-                                       r"\over",           # [4]
-                                       r"{P(H)",           # [5]          h [5,2]
-                                       r"P(E|H)}",         # [6] e [6,2], h [6,4]
-                                       r"+",               # [7]
-                                       r"{P(\lnot H)",     # [8]          h [8,3], n [8,2]
-                                       r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5], n [9,4]
+        self.mtex_bayes_full = myutil.cached_tex(MathTex, r"P(H|E)",          # [0] e [0,4], h [0,2]
+                                                          r"={",              # [1]
+                                                          r"{P(H)",           # [2]          h [2,2]
+                                                          r"P(E|H)}",         # [3] e [3,2], h [3,4]
+                                                          r"\over",           # [4]
+                                                          r"{P(H)",           # [5]          h [5,2]
+                                                          r"P(E|H)}",         # [6] e [6,2], h [6,4]
+                                                          r"+",               # [7]
+                                                          r"{P(\lnot H)",     # [8]          h [8,3], n [8,2]
+                                                          r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5], n [9,4]
         ).scale(self.scale_eq_f)
         myutil.critical_point_move_to(self.mtex_bayes_full, LEFT + DOWN, ORIGIN + -5.0 * RIGHT + 1.4 * UP)
 
@@ -249,30 +261,28 @@ class BayesExample03(Scene):
 
         # --- Event examples
         # event example H
-        self.mtex_event_h = MathTex(r"H").  scale(self.scale_event_eq_f).set_color(
+        self.mtex_event_h = myutil.cached_tex(MathTex, r"H").  scale(self.scale_event_eq_f).set_color(
             self.col_h).move_to(0.2 * RIGHT + 3.2 * UP)
-        self.txt_event_h = Text(r": 病気").scale(self.scale_event_txt_f).move_to(1.3 * RIGHT + 3.2 * UP)
+        self.txt_event_h = myutil.cached_tex(Text, r": 病気").scale(self.scale_event_txt_f).move_to(1.3 * RIGHT + 3.2 * UP)
 
         # event example E
-        self.mtex_event_e = MathTex(r"E").scale(self.scale_event_eq_f).set_color(
+        self.mtex_event_e = myutil.cached_tex(MathTex, r"E").scale(self.scale_event_eq_f).set_color(
             self.col_e).move_to(2.7 * RIGHT + 3.17 * UP)
-        self.txt_event_e = Text(r": 検査＋", t2c={r"[3:4]": self.col_positive}).scale(
+        self.txt_event_e = myutil.cached_tex(Text, r": 検査＋", t2c={r"[3:4]": self.col_positive}).scale(
             self.scale_event_txt_f).move_to(4.0 * RIGHT + 3.17 * UP)
 
         # show 1000 people
-        self.people_dx      = (self.pos_people_max[0] - self.pos_people_min[0]) / (self.nb_people_x - 1)
-        self.people_dy      = (self.pos_people_max[1] - self.pos_people_min[1]) / (self.nb_people_y - 1)
-        self.svg_people = []
-        for iy in range(0, self.nb_people_y):
-            for ix in range(0, self.nb_people_x):
-                pos    = self.get_person_position([ix, iy])
-                person = SVGMobject("svg/person_silhouette", fill_opacity=1.0).scale(self.size_person_1000).\
-                         move_to(pos).set_color(self.color_people)
-                self.svg_people.append(person)
+        self.people_grid = myutil.GridLayout(self.nb_people_x, self.nb_people_y, self.pos_people_min, self.pos_people_max)
+        # true positive, false positive people from the simulated population
+        self.simulate_positive_pcoords()
+        # all people share one parsed svg
+        self.svg_people = myutil.SVGInstanceGroup("svg/person_silhouette", self.people_grid.pos_ary,
+                                                  scale_factor=self.size_person_1000,
+                                                  fill_opacity=1.0, color=self.color_people)
 
 
         # true positive label
-        pos = self.get_person_position(self.true_positive_pcoords[0])
+        pos = self.people_grid.get_position(self.true_positive_pcoords[0])
         self.label_true_positive = myutil.LabeledRectangle(Text(r"真＋",
                                                                 t2c={"[0:1]": WHITE,
                                                                      "[1:2]": WHITE}).scale(self.scale_label_txt),
@@ -280,21 +290,19 @@ class BayesExample03(Scene):
                                                            color=RED, fill_color=RED, fill_opacity=1.0)
         myutil.critical_point_move_to(self.label_true_positive, DOWN, pos).shift(self.size_person_1000 * 0.8 * UP)
 
-        # false positive label
-        idx = 0
-        self.label_false_positive = []
-        for pcoord in self.false_positive_pcoords:
-            lr = myutil.LabeledRectangle(Text(r"偽＋".format(idx),
-                                              t2c={"[0:1]": BLACK,
-                                                   "[1:2]": RED,
-                                                   "[2:]":  BLACK}).scale(self.scale_label_txt),
-                                         tip_direction=DOWN, color=WHITE, fill_color=WHITE, fill_opacity=1.0)
-            pos = self.get_person_position(pcoord)
-            myutil.critical_point_move_to(lr, DOWN, pos).shift(self.size_person_1000 * 0.8 * UP)
-            self.label_false_positive.append(lr)
-            idx += 1
+        # false positive label: one shared box outline, stamped at each person
+        label_list = [myutil.cached_tex(Text, r"偽＋",
+                                        t2c={"[0:1]": BLACK,
+                                             "[1:2]": RED,
+                                             "[2:]":  BLACK}).scale(self.scale_label_txt)
+                      for pcoord in self.false_positive_pcoords]
+        pos_ary = self.people_grid.get_position(self.false_positive_pcoords) + self.size_person_1000 * 0.8 * UP
+        self.label_false_positive = myutil.make_labeled_rectangle_list(
+            label_list, pos_ary, DOWN,
+            tip_direction=DOWN, color=WHITE, fill_color=WHITE, fill_opacity=1.0)
 
 
+    @myutil.animate_section
     def show_title(self):
         """より現実的な具体例
         """
@@ -319,6 +327,7 @@ class BayesExample03(Scene):
 
 
 
+    @myutil.animate_section
     def animate_people_populate(self):
         """1000 people example
         """
@@ -327,9 +336,7 @@ class BayesExample03(Scene):
             return
 
         # store the destination positions
-        pos_dst_people = []
-        for person in self.svg_people:
-            pos_dst_people.append(person.get_center())
+        pos_dst_people = self.people_grid.pos_ary
 
         # deep copy the first person
         first_person = copy.deepcopy(self.svg_people[0])
@@ -343,45 +350,41 @@ class BayesExample03(Scene):
 
         # add the bottom row
         first_person_pos = self.svg_people[0].get_center()
-        for ix in range(0, self.nb_people_x):
-            idx = self.get_person_1d_idx([ix, 0])
-            self.svg_people[idx].move_to(first_person_pos)
-            self.add(self.svg_people[idx])
+        bottom_row_idx   = self.people_grid.get_row_1d_idx(0)
+        self.svg_people.move_instances_to(first_person_pos, bottom_row_idx)
+        self.add(*[self.svg_people[idx] for idx in bottom_row_idx])
 
         # swap first_person with the people
         self.remove(first_person)
         self.add(self.svg_people[0])
 
         # First bottom row
-        self.play(*[ApplyMethod(self.svg_people[idx].move_to, pos_dst_people[idx]) for idx in range(0, self.nb_people_x)])
+        self.play(myutil.BatchMoveTo([self.svg_people[idx] for idx in bottom_row_idx], pos_dst_people[bottom_row_idx],
+                                     instance_group=self.svg_people))
         self.wait(self.time_wait)
 
-        # up to 1000 add
-        apply_array = []
-        for iy in range(1, self.nb_people_y):
-            for ix in range(0, self.nb_people_x):
-                src_idx = self.get_person_1d_idx([ix,  0])
-                dst_idx = self.get_person_1d_idx([ix, iy])
-                self.svg_people[dst_idx].move_to(self.svg_people[src_idx].get_center())
-                self.add(self.svg_people[dst_idx])
-                dst_pos = self.get_person_position([ix, iy])
-                apply_array.append(ApplyMethod(self.svg_people[dst_idx].move_to, dst_pos))
-
-        self.play(*apply_array)
+        # up to 1000 add: start from the bottom person of the same column
+        upper_idx = numpy.arange(self.nb_people_x, self.people_grid.get_nb_cell())
+        self.svg_people.move_instances_to(pos_dst_people[self.people_grid.ix_ary[upper_idx]], upper_idx)
+        self.add(*[self.svg_people[idx] for idx in upper_idx])
+
+        self.play(myutil.BatchMoveTo([self.svg_people[idx] for idx in upper_idx], pos_dst_people[upper_idx],
+                                     instance_group=self.svg_people))
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_true_positive(self):
         """Show true positive person and probability
         """
         if (self.is_show_only):
             self.add(self.label_true_positive)
             for pcoord in self.true_positive_pcoords:
-                one_d_idx = self.get_person_1d_idx(pcoord)
+                one_d_idx = self.people_grid.get_1d_idx(pcoord)
                 self.svg_people[one_d_idx].set_color(self.col_positive)
             return
 
-        one_d_idx = self.get_person_1d_idx(self.true_positive_pcoords[0])
+        one_d_idx = self.people_grid.get_1d_idx(self.true_positive_pcoords[0])
 
         # remove and add to show it in the front (otherwise, draw at back)
         self.remove(self.svg_people[one_d_idx])
@@ -397,57 +400,48 @@ class BayesExample03(Scene):
 
 
 
+    @myutil.animate_section
     def animate_false_positive(self):
         if (self.is_show_only):
             for ix, iy in self.false_positive_pcoords:
-                one_d_idx = self.get_person_1d_idx([ix, iy])
+                one_d_idx = self.people_grid.get_1d_idx([ix, iy])
                 self.svg_people[one_d_idx].set_color(self.col_false_positive)
             self.add(*self.label_false_positive)
             return
 
         apply_color = []
-        apply_scale_1 = []
-        apply_scale_2 = []
+        false_positive_people = []
         for ix, iy in self.false_positive_pcoords:
-            one_d_idx = self.get_person_1d_idx([ix, iy])
+            one_d_idx = self.people_grid.get_1d_idx([ix, iy])
             # remove and add to draw in front
             self.remove(self.svg_people[one_d_idx])
             self.add(self.svg_people[one_d_idx])
 
             # keep person the apply list to animate
             apply_color.append(ApplyMethod(self.svg_people[one_d_idx].set_color, self.col_false_positive))
-            apply_scale_1.append(ApplyMethod(self.svg_people[one_d_idx].scale, self.person_scale_factor))
-            apply_scale_2.append(ApplyMethod(self.svg_people[one_d_idx].scale, 1.0 / self.person_scale_factor))
+            false_positive_people.append(self.svg_people[one_d_idx])
 
 
         self.play(*apply_color)
-        self.play(*apply_scale_1)
-        self.play(*apply_scale_2)
+        self.play(myutil.BatchMoveTo(false_positive_people, scale_factor=self.person_scale_factor,
+                                     instance_group=self.svg_people))
+        self.play(myutil.BatchMoveTo(false_positive_people, scale_factor=1.0 / self.person_scale_factor,
+                                     instance_group=self.svg_people))
         self.play(*[FadeIn(mobj) for mobj in self.label_false_positive])
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_positive_only(self):
         """Get positive only
         """
-        people_negative_xy_idx = []
-        for iy in range(0, self.nb_people_y):
-            for ix in range(0, self.nb_people_x):
-                if ([ix, iy] in self.true_positive_pcoords):
-                    # skip true positive
-                    continue
-                if ([ix, iy] in self.false_positive_pcoords):
-                    # skip false positive
-                    continue
-                people_negative_xy_idx.append([ix, iy])
-
-        people_negative = []
-        for pcoord in people_negative_xy_idx:
-            people_negative.append(self.svg_people[self.get_person_1d_idx(pcoord)])
+        # skip true positive and false positive
+        positive_mask   = self.people_grid.get_mask(self.true_positive_pcoords + self.false_positive_pcoords)
+        people_negative = [self.svg_people[idx] for idx in numpy.nonzero(~positive_mask)[0]]
 
         person_size       = 0.9
-        nb_person         = 11
-        nb_true_positive  =  1
+        nb_person         = len(self.true_positive_pcoords) + len(self.false_positive_pcoords)
+        nb_true_positive  = len(self.true_positive_pcoords)
         people_pos_left   = - 5.5 * RIGHT + -2.5 * UP
         people_delta_dist =   1.1 * RIGHT
         label_shift_up    =   1.0
@@ -457,7 +451,7 @@ class BayesExample03(Scene):
             self.remove(*people_negative)
 
             # move true positive
-            tpos_idx = self.get_person_1d_idx(self.true_positive_pcoords[0])
+            tpos_idx = self.people_grid.get_1d_idx(self.true_positive_pcoords[0])
             tpos_dst = people_pos_left
             self.svg_people[tpos_idx].scale(person_size * (1.0 / self.size_person_1000)).move_to(tpos_dst)
 
@@ -466,7 +460,7 @@ class BayesExample03(Scene):
                 shift(person_size * label_shift_up * UP)
 
             for i in range(0, len(self.false_positive_pcoords)):
-                fpos_idx = self.get_person_1d_idx(self.false_positive_pcoords[i])
+                fpos_idx = self.people_grid.get_1d_idx(self.false_positive_pcoords[i])
                 # move false positive
                 fpos_dst = people_pos_left + (i + nb_true_positive) * people_delta_dist
                 self.svg_people[fpos_idx].scale(person_size * (1.0 / self.size_person_1000)).move_to(fpos_dst)
@@ -483,7 +477,7 @@ class BayesExample03(Scene):
         self.play(*[FadeOut(mobj) for mobj in people_negative])
 
         # move true positive
-        tpos_idx = self.get_person_1d_idx(self.true_positive_pcoords[0])
+        tpos_idx = self.people_grid.get_1d_idx(self.true_positive_pcoords[0])
         tpos_dst = people_pos_left
 
         # make true positive front
@@ -505,7 +499,7 @@ class BayesExample03(Scene):
         fpos_trans = []
         label_move = []
         for i in range(0, len(self.false_positive_pcoords)):
-            fpos_idx = self.get_person_1d_idx(self.false_positive_pcoords[i])
+            fpos_idx = self.people_grid.get_1d_idx(self.false_positive_pcoords[i])
             fpos_dst = people_pos_left + (i + nb_true_positive) * people_delta_dist
 
             ptmp = copy.deepcopy(self.svg_people[fpos_idx])
@@ -524,6 +518,7 @@ class BayesExample03(Scene):
 
 
 
+    @myutil.animate_section
     def animate_positive_only_eq(self):
         """P(H|E) 11 out of 1
         """
@@ -537,16 +532,16 @@ class BayesExample03(Scene):
 
         # 1/11 (In Japanese, one says the denominator first)
         positive_people = []
-        tpos_idx = self.get_person_1d_idx(self.true_positive_pcoords[0])
+        tpos_idx = self.people_grid.get_1d_idx(self.true_positive_pcoords[0])
         positive_people.append(self.svg_people[tpos_idx])
         for i in range(0, len(self.false_positive_pcoords)):
-            fpos_idx = self.get_person_1d_idx(self.false_positive_pcoords[i])
+            fpos_idx = self.people_grid.get_1d_idx(self.false_positive_pcoords[i])
             positive_people.append(self.svg_people[fpos_idx])
 
         scale_f = 1.3
         self.play(FadeIn(self.p_h_e_simple[4]),
-                  *[ApplyMethod(mobj.scale, scale_f) for mobj in positive_people]),
-        self.play(*[ApplyMethod(mobj.scale, 1.0 / scale_f) for mobj in positive_people])
+                  myutil.BatchMoveTo(positive_people, scale_factor=scale_f, instance_group=self.svg_people)),
+        self.play(myutil.BatchMoveTo(positive_people, scale_factor=1.0 / scale_f, instance_group=self.svg_people))
         self.wait(self.time_wait)
 
         # 1/
@@ -562,6 +557,7 @@ class BayesExample03(Scene):
 
 
 
+    @myutil.animate_section
     def animate_one_reason(self):
         """Explain this specific case
         """
@@ -579,12 +575,17 @@ class BayesExample03(Scene):
 
 
 
+    def setup(self):
+        """compile the TeX fragments of this scene in parallel before construct(),
+        keep the partial movies of the unchanged animations
+        """
+        myutil.precompile_scene_tex(self)
+        myutil.use_partial_movie_cache(self)
+
+
     def construct(self):
         """More realistic example (example 2)
         """
-        # generate random positions for true positive and false positive
-        # self.gen_false_positive()
-
         self.create_bayes_eq()
         self.show_title()
 
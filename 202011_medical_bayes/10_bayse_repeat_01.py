@@ -21,10 +21,11 @@
 #
 
 from manim import *
-import copy, numpy, random
+import copy, numpy
 import myutil
 
 
+@myutil.time_phases
 class BayesRepeat01(Scene):
 # class BayesRepeat01(LinearTransformationScene):
     """Bayes theorem: repeated test
@@ -106,8 +107,14 @@ class BayesRepeat01(Scene):
 
         #-- people size, pos
         "person_size":       0.9,
-        "nb_true_positive":    1,
-        "nb_false_positive":  10,
+        #  the positive people of the 1000 people example (myutil.simulate_population, exact expected counts)
+        "nb_population":    1000,
+        "p_h":             0.001,
+        "p_e_h":             1.0,
+        "p_e_not_h":        0.01,
+        "population_seed":     0,
+        "nb_true_positive":  None,
+        "nb_false_positive": None,
         "people_pos_left":   -5.5 * RIGHT + -2.5 * UP,
         "people_delta_dist":  1.1 * RIGHT,
         "label_shift_up":     1.0,
@@ -149,27 +156,13 @@ class BayesRepeat01(Scene):
     }
 
 
-    def get_person_position(self, pcoord):
-        """get the position of person of (x, y)"""
-        return self.pos_people_min + pcoord[0] * self.people_dx * RIGHT + pcoord[1] * self.people_dy * UP
-
-    def get_person_1d_idx(self, pcoord):
-        """get the 1D array index of person of index position coordinates
-        pcoord = [ix, iy]
-        """
-        return pcoord[0] + pcoord[1] * self.nb_people_x
-
-    def gen_false_positive(self):
-        """generate:
-        * 1  true positive index coords
-        * 10 false positive index coords
-            [[24, 13],
-             [2, 8], [32, 15], [25, 9], [30, 11], [37, 6],
-             [32, 4], [18, 4], [48, 3], [39, 8], [34, 19], ],
+    def simulate_positive_count(self):
+        """Sample the 1000 people, set the number of the true/false positive people.
         """
-        random.seed(0)
-        for i in range(0, 11):
-            print("[{0}, {1}], ".format(random.randint(0,50), random.randint(0,20)))
+        population = myutil.simulate_population(self.nb_population, self.p_h, self.p_e_h, self.p_e_not_h,
+                                                seed=self.population_seed, is_exact=True)
+        self.nb_true_positive  = len(population.tp_idx)
+        self.nb_false_positive = len(population.fp_idx)
 
 
     def create_bayes_eq(self):
@@ -180,16 +173,16 @@ class BayesRepeat01(Scene):
         myutil.critical_point_move_to(self.txt_title_bayes, LEFT + DOWN, ORIGIN + -6.3 * RIGHT + 3.0 * UP)
 
         # full Bayes form                                  # indices for h,e color (MathTex removes white space))
-        self.mtex_bayes_full = MathTex(r"P(H|E)",          # [0] e [0,4], h [0,2]
-                                       r"={",              # [1]
-                                       r"{P(H)",           # [2]          h [2,2]
-                                       r"P(E|H)}",         # [3] e [3,2], h [3,4]
-                                       r"\over",           # [4]
-                                       r"{P(H)",           # [5]          h [5,2]
-                                       r"P(E|H)}",         # [6] e [6,2], h [6,4]
-                                       r"+",               # [7]
-                                       r"{P(\lnot H)",     # [8]          h [8,3], n [8,2]
-                                       r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5], n [9,4]
+        self.mtex_bayes_full = myutil.cached_tex(MathTex, r"P(H|E)",          # [0] e [0,4], h [0,2]
+                                                          r"={",              # [1]
+                                                          r"{P(H)",           # [2]          h [2,2]
+                                                          r"P(E|H)}",         # [3] e [3,2], h [3,4]
+                                                          r"\over",           # [4]
+                                                          r"{P(H)",           # [5]          h [5,2]
+                                                          r"P(E|H)}",         # [6] e [6,2], h [6,4]
+                                                          r"+",               # [7]
+                                                          r"{P(\lnot H)",     # [8]          h [8,3], n [8,2]
+                                                          r"P(E |\lnot H)}}", # [9] e [9,2], h [9,5], n [9,4]
         ).scale(self.scale_eq_f)
         myutil.critical_point_move_to(self.mtex_bayes_full, LEFT + DOWN, ORIGIN + -5.0 * RIGHT + 1.4 * UP)
 
@@ -233,26 +226,24 @@ class BayesRepeat01(Scene):
 
         # --- Event examples
         # event example H
-        self.mtex_event_h = MathTex(r"H").  scale(self.scale_event_eq_f).set_color(
+        self.mtex_event_h = myutil.cached_tex(MathTex, r"H").  scale(self.scale_event_eq_f).set_color(
             self.col_h).move_to(0.2 * RIGHT + 3.2 * UP)
-        self.txt_event_h = Text(r": 病気").scale(self.scale_event_txt_f).move_to(1.3 * RIGHT + 3.2 * UP)
+        self.txt_event_h = myutil.cached_tex(Text, r": 病気").scale(self.scale_event_txt_f).move_to(1.3 * RIGHT + 3.2 * UP)
 
         # event example E
-        self.mtex_event_e = MathTex(r"E").scale(self.scale_event_eq_f).set_color(
+        self.mtex_event_e = myutil.cached_tex(MathTex, r"E").scale(self.scale_event_eq_f).set_color(
             self.col_e).move_to(2.7 * RIGHT + 3.17 * UP)
-        self.txt_event_e = Text(r": 検査＋", t2c={r"[3:4]": self.col_positive}).scale(
+        self.txt_event_e = myutil.cached_tex(Text, r": 検査＋", t2c={r"[3:4]": self.col_positive}).scale(
             self.scale_event_txt_f).move_to(4.0 * RIGHT + 3.17 * UP)
 
         # 11 people position
+        self.simulate_positive_count()
         self.nb_people = self.nb_true_positive + self.nb_false_positive
 
         # create 11 people
-        self.svg_people = []
-        for i in range(0, self.nb_people):
-            pos = self.people_pos_left + i * self.people_delta_dist
-            person = SVGMobject("svg/person_silhouette", fill_opacity=1.0).scale(self.person_size).\
-                                                                       move_to(pos).set_color(self.col_false_positive)
-            self.svg_people.append(person)
+        pos_people = [self.people_pos_left + i * self.people_delta_dist for i in range(0, self.nb_people)]
+        self.svg_people = myutil.SVGInstanceGroup("svg/person_silhouette", pos_people, scale_factor=self.person_size,
+                                                  fill_opacity=1.0, color=self.col_false_positive)
 
         # true positive color
         self.svg_people[0].set_color(self.col_positive)
@@ -267,20 +258,20 @@ class BayesRepeat01(Scene):
             shift(self.person_size * self.label_shift_up * UP)
 
 
-        self.label_false_positives = []
-        for i in range(0, self.nb_false_positive):
-            fpos_dst   = self.people_pos_left + (i + self.nb_true_positive) * self.people_delta_dist
-            label_fpos = myutil.LabeledRectangle(Text(r"偽＋".format(i), # i is for debug
-                                                      t2c={"[0:1]": BLACK,
-                                                           "[1:2]": RED,
-                                                           "[2:]":  BLACK}).scale(self.scale_label_txt),
-                                                 tip_direction=DOWN, color=WHITE, fill_color=WHITE, fill_opacity=1.0)
-            self.label_false_positives.append(label_fpos)
-            # move false positive label
-            myutil.critical_point_move_to(self.label_false_positives[i], DOWN, fpos_dst).\
-                shift(self.person_size * self.label_shift_up * UP)
-            if (i % 2 == 0):
-                self.label_false_positives[i].shift(self.label_shift_up * UP)
+        # false positive labels: one shared box outline, stamped at each person
+        # (every other label is shifted up to avoid overlapping)
+        label_list = [myutil.cached_tex(Text, r"偽＋",
+                                        t2c={"[0:1]": BLACK,
+                                             "[1:2]": RED,
+                                             "[2:]":  BLACK}).scale(self.scale_label_txt)
+                      for i in range(0, self.nb_false_positive)]
+        fpos_idx_ary = numpy.arange(self.nb_false_positive)
+        pos_ary = (self.people_pos_left + (fpos_idx_ary[:, numpy.newaxis] + self.nb_true_positive) * self.people_delta_dist
+                   + self.person_size * self.label_shift_up * UP
+                   + (fpos_idx_ary[:, numpy.newaxis] % 2 == 0) * self.label_shift_up * UP)
+        self.label_false_positives = myutil.make_labeled_rectangle_list(
+            label_list, pos_ary, DOWN,
+            tip_direction=DOWN, color=WHITE, fill_color=WHITE, fill_opacity=1.0)
 
 
         self.rhs = MathTex(r"\approx", r"0.91").scale(self.scale_eq_f).move_to(-2.4 * RIGHT + 2.0 * UP)
@@ -288,6 +279,7 @@ class BayesRepeat01(Scene):
         self.text_repeat = Text(r"独立した再検査によって精度向上").scale(self.scale_txt_f).move_to(-1.0 * RIGHT + 1.0 * UP)
 
 
+    @myutil.animate_section
     def show_title_people(self):
         """show selected people
         """
@@ -301,6 +293,7 @@ class BayesRepeat01(Scene):
 
         self.wait(self.time_wait)
 
+    @myutil.animate_section
     def animate_retest_reset(self):
         """reset the test"""
 
@@ -323,6 +316,7 @@ class BayesRepeat01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_bayes_retest_full(self):
         """
         """
@@ -358,6 +352,7 @@ class BayesRepeat01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_bayes_retest_substitute(self):
         """substitute all
         """
@@ -501,6 +496,7 @@ class BayesRepeat01(Scene):
         self.wait(self.time_wait)
 
 
+    @myutil.animate_section
     def animate_bayes_retest_rethink(self):
         """re-think the repeat test meaning
         """
@@ -542,12 +538,17 @@ class BayesRepeat01(Scene):
 
 
 
+    def setup(self):
+        """compile the TeX fragments of this scene in parallel before construct(),
+        keep the partial movies of the unchanged animations
+        """
+        myutil.precompile_scene_tex(self)
+        myutil.use_partial_movie_cache(self)
+
+
     def construct(self):
         """More realistic example (example 2)
         """
-        # generate random positions for true positive and false positive
-        # self.gen_false_positive()
-
         self.create_bayes_eq()
         self.show_title_people()
 
@@ -12,6 +12,15 @@
 
 from manim import *
 import copy
+import numpy as np
+import collections, hashlib, json, os, pickle, sys, tempfile, time
+import ast, functools, inspect, multiprocessing
+import importlib.metadata
+import manim
+from manim.utils.tex_file_writing import generate_tex_file, compile_tex, convert_to_svg
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+import manim.mobject.svg.tex_mobject as tex_mobject_module
 
 
 class CrossMobj(Line):
@@ -140,6 +149,54 @@ class LabeledRectangle(RoundedRectangle):
 
 
 
+def make_labeled_rectangle_list(label_list, pos_ary=None, critical_point_dir=DOWN, **kwargs):
+    """Build many LabeledRectangles in one pass.
+
+    The box-plus-tip outline is built once per (width, height) (the same
+    label size shares it), then each instance is stamped from it by a
+    copy-on-write snapshot() and one translation. No RoundedRectangle,
+    tip Polygon, or rotate/shift chain per label.
+
+    Example:
+        label_list = [myutil.cached_tex(Text, r"偽＋", t2c={"[1:2]": RED}).scale(0.5) for i in range(n)]
+        label_rect_list = myutil.make_labeled_rectangle_list(label_list, pos_ary, DOWN, tip_direction=DOWN)
+
+    @param[in] label_list         N label mobjects
+    @param[in] pos_ary            (N, 3) positions of the critical points. None: the box centers at ORIGIN
+    @param[in] critical_point_dir critical point direction of each LabeledRectangle placed at pos_ary
+    @param[in] kwargs             LabeledRectangle parameters (tip_direction, color, width_buff, ...)
+    @return    list of N LabeledRectangle
+    """
+    width_buff  = kwargs.pop("width_buff",  0.1)
+    height_buff = kwargs.pop("height_buff", 0.1)
+    width       = kwargs.pop("width",  None)
+    height      = kwargs.pop("height", None)
+
+    # (width, height) -> (prototype, box center, critical point)
+    proto_dict = {}
+    label_rect_list = []
+    for (i, label) in enumerate(label_list):
+        rect_width  = width  if (width  is not None) else (2 * width_buff  + label.get_width())
+        rect_height = height if (height is not None) else (2 * height_buff + label.get_height())
+        key = (round(rect_width, 6), round(rect_height, 6))
+        if (key not in proto_dict):
+            # the label placeholder gives the box center, then it is removed
+            box_center = VectorizedPoint()
+            proto = LabeledRectangle(box_center, width=rect_width, height=rect_height, **kwargs)
+            proto.remove(box_center)
+            proto_dict[key] = (proto, box_center.get_center(), proto.get_critical_point(critical_point_dir))
+        (proto, box_center, proto_cp) = proto_dict[key]
+
+        delta = ORIGIN if (pos_ary is None) else (np.asarray(pos_ary[i]) - proto_cp)
+        label_rect = snapshot(proto).shift(delta)
+        label.move_to(box_center + delta)
+        label_rect.add(label)
+        label_rect_list.append(label_rect)
+
+    return label_rect_list
+
+
+
 def critical_point_move_to(mobj, critical_point_dir, target_pos):
     """
     Move the critical_point(critical_point_dir) to the target
@@ -166,6 +223,7 @@ def get_tab_cell_critical_pos(tab_ancher_pos, width_ary, height_ary, cell_idx_x,
 
     Get a table cell position.
     A table is defined by tab_ancher_pos,  width_ary, height_ary.
+    (For many cells of a table, use a TableLayout.)
 
     width_ary[k] : variable widths,  e.g., w = [1.0, 1.5, ..,.1.2]
     height_ary[j]: variable heights  e.g., h = [1.0, 2.0, ...,1.1]
@@ -208,33 +266,8 @@ def get_tab_cell_critical_pos(tab_ancher_pos, width_ary, height_ary, cell_idx_x,
     @param[in] show                (option) print out coordinates when True
     @return    critical point manim coordinate (numpy array)
     """
-    # print("x, y: ({0}, {1}), len ({2}, {3})".format(cell_idx_x, cell_idx_y, len(width_ary), len(height_ary)))
-    assert(cell_idx_x < len(width_ary))
-    assert(cell_idx_y < len(height_ary))
-    dx = 0
-    cur_cell_w = 0
-    for i in range(0, cell_idx_x):
-        dx += width_ary[i]
-        # print("   dx: {0}".format(dx))
-    cur_cell_w = width_ary[cell_idx_x]
-    # print("   cur_cell w: {0}".format(width_ary[cell_idx_x]))
-
-    dy = 0
-    cur_cell_h = 0
-    for j in range(0, cell_idx_y):
-        dy += height_ary[j]
-    cur_cell_h = height_ary[cell_idx_y]
-
-
-    # Shift right & down / 2 (relative to the cell anchor point)
-    shifted_critical_point_dir = copy.deepcopy(critical_point_dir)
-    shifted_critical_point_dir += (RIGHT + DOWN)
-    shifted_critical_point_dir *= 0.5
-    # print("shifted_critical_point_dir 2: {0}".format(shifted_critical_point_dir))
-
-    cell_anchor_pos = copy.deepcopy(tab_ancher_pos)
-    cell_anchor_pos[0] += ( dx + shifted_critical_point_dir[0] * cur_cell_w) # RIGHT direction
-    cell_anchor_pos[1] += (-dy + shifted_critical_point_dir[1] * cur_cell_h) # DOWN  direction
+    cell_anchor_pos = TableLayout(tab_ancher_pos, width_ary, height_ary).get_cell_critical_pos(
+        cell_idx_x, cell_idx_y, critical_point_dir)
 
     if (show):
         print("x, y: ({0}, {1}), pos{2}".format(cell_idx_x, cell_idx_y, cell_anchor_pos))
@@ -242,19 +275,510 @@ def get_tab_cell_critical_pos(tab_ancher_pos, width_ary, height_ary, cell_idx_x,
 
 
 
+class TableLayout(object):
+    """Table cell geometry of get_tab_cell_critical_pos() with precomputed offsets.
+
+    The cumulative column/row offsets are computed once, then
+
+      - a cell critical point is O(1),
+      - all the cell critical points are one (nb_row, nb_col, 3) array,
+      - set_width()/set_height() of one column/row updates the offsets in O(nb_col)/O(nb_row).
+
+    x_offset[k] = sum(width_ary[:k]),  (nb_col + 1,), x_offset[-1] is the table width
+    y_offset[j] = sum(height_ary[:j]), (nb_row + 1,), y_offset[-1] is the table height
+
+    The cell index is (cell_idx_x, cell_idx_y) as get_tab_cell_critical_pos().
+    """
+
+    def __init__(self, tab_ancher_pos, width_ary, height_ary):
+        """
+        @param[in] tab_ancher_pos table anchor position (top left)
+        @param[in] width_ary      table width length array (nb_col,)
+        @param[in] height_ary     table height length array (nb_row,)
+        """
+        self.tab_ancher_pos = np.array(tab_ancher_pos, dtype=np.float64)
+        self.width_ary      = np.array(width_ary,      dtype=np.float64)
+        self.height_ary     = np.array(height_ary,     dtype=np.float64)
+        self.x_offset       = np.concatenate(([0.0], np.cumsum(self.width_ary)))
+        self.y_offset       = np.concatenate(([0.0], np.cumsum(self.height_ary)))
+
+
+    def get_nb_col(self):
+        return len(self.width_ary)
+
+
+    def get_nb_row(self):
+        return len(self.height_ary)
+
+
+    def get_total_width(self):
+        """table total width"""
+        return self.x_offset[-1]
+
+
+    def get_total_height(self):
+        """table total height"""
+        return self.y_offset[-1]
+
+
+    def set_width(self, cell_idx_x, width):
+        """Change one column width. Only the following offsets are updated.
+
+        @param[in] cell_idx_x column index
+        @param[in] width      new width
+        """
+        delta = width - self.width_ary[cell_idx_x]
+        self.width_ary[cell_idx_x]     = width
+        self.x_offset[cell_idx_x + 1:] += delta
+
+
+    def set_height(self, cell_idx_y, height):
+        """Change one row height. Only the following offsets are updated.
+
+        @param[in] cell_idx_y row index
+        @param[in] height     new height
+        """
+        delta = height - self.height_ary[cell_idx_y]
+        self.height_ary[cell_idx_y]    = height
+        self.y_offset[cell_idx_y + 1:] += delta
+
+
+    def set_cell_size(self, width_ary, height_ary):
+        """Change all the widths and heights. The offsets are recomputed.
+
+        @param[in] width_ary  (nb_col,) widths
+        @param[in] height_ary (nb_row,) heights
+        """
+        self.width_ary[:]     = width_ary
+        self.height_ary[:]    = height_ary
+        self.x_offset[1:]     = np.cumsum(self.width_ary)
+        self.y_offset[1:]     = np.cumsum(self.height_ary)
+
+
+    def get_cell_critical_pos(self, cell_idx_x, cell_idx_y, critical_point_dir):
+        """Get a table cell critical point. (see get_tab_cell_critical_pos())
+
+        @param[in] cell_idx_x         table cell index x
+        @param[in] cell_idx_y         table cell index y
+        @param[in] critical_point_dir manim style critical point direction
+        @return    critical point manim coordinate (numpy array)
+        """
+        assert(cell_idx_x < self.get_nb_col())
+        assert(cell_idx_y < self.get_nb_row())
+        # critical point relative to the cell anchor (top left) in the cell size unit
+        cp_ratio = 0.5 * (np.asarray(critical_point_dir) + RIGHT + DOWN)
+
+        cell_pos = self.tab_ancher_pos.copy()
+        cell_pos[0] += ( self.x_offset[cell_idx_x] + cp_ratio[0] * self.width_ary[cell_idx_x])  # RIGHT direction
+        cell_pos[1] += (-self.y_offset[cell_idx_y] + cp_ratio[1] * self.height_ary[cell_idx_y]) # DOWN  direction
+        return cell_pos
+
+
+    def get_all_cell_critical_pos(self, critical_point_dir):
+        """Get all the table cell critical points at once.
+
+        @param[in] critical_point_dir manim style critical point direction
+        @return    (nb_row, nb_col, 3) critical points, [cell_idx_y, cell_idx_x]
+        """
+        cp_ratio = 0.5 * (np.asarray(critical_point_dir) + RIGHT + DOWN)
+
+        cell_pos_ary = np.tile(self.tab_ancher_pos, (self.get_nb_row(), self.get_nb_col(), 1))
+        cell_pos_ary[:, :, 0] += ( self.x_offset[:-1] + cp_ratio[0] * self.width_ary)[np.newaxis, :]
+        cell_pos_ary[:, :, 1] += (-self.y_offset[:-1] + cp_ratio[1] * self.height_ary)[:, np.newaxis]
+        return cell_pos_ary
+
+
+
+class TableMobject(VGroup):
+    """A table of TableLayout geometry. All the rules are one VMobject.
+
+    Each rule is a subpath of the rules VMobject (no Line per rule), and
+    the rule end points and the attached cell mobject positions are
+    computed from the layout offsets with one NumPy operation for all of
+    them. Resizing (set_cell_size(), TableResize) moves them all at once.
+
+    hline_list: [(k, x_start, x_end)] horizontal rule at the top of row k
+                (k = nb_row: the bottom) from column x_start to column x_end (exclusive)
+    vline_list: [(k, y_start, y_end)] vertical rule at the left of column k
+                (k = nb_col: the right end) from row y_start to row y_end (exclusive)
+    None: all the full rules.
+
+    The attached cell mobjects (attach_cell_mobject()) are moved with the
+    table, but they are not submobjects: the scene adds (e.g., FadeIn) them.
+
+    Example:
+        table = myutil.TableMobject(pos, [3.0, 2.5], [1.0, 1.0])
+        table.attach_cell_mobject(1, 1, Text("A"))
+        self.play(myutil.TableRuleCreation(table))
+        self.play(myutil.TableResize(table, width_ary=[2.0, 3.5]))
+    """
+
+    def __init__(self, tab_ancher_pos, width_ary, height_ary, hline_list=None, vline_list=None,
+                 color=WHITE, stroke_width=DEFAULT_STROKE_WIDTH, **kwargs):
+        """
+        @param[in] tab_ancher_pos table anchor position (top left)
+        @param[in] width_ary      table width length array (nb_col,)
+        @param[in] height_ary     table height length array (nb_row,)
+        @param[in] hline_list     horizontal rules [(k, x_start, x_end)]. None: all
+        @param[in] vline_list     vertical rules [(k, y_start, y_end)]. None: all
+        @param[in] color          rule color
+        @param[in] stroke_width   rule stroke width
+        """
+        self.layout = TableLayout(tab_ancher_pos, width_ary, height_ary)
+        nb_col = self.layout.get_nb_col()
+        nb_row = self.layout.get_nb_row()
+        if (hline_list is None):
+            hline_list = [(k, 0, nb_col) for k in range(nb_row + 1)]
+        if (vline_list is None):
+            vline_list = [(k, 0, nb_row) for k in range(nb_col + 1)]
+        self.hline_ary = np.array(hline_list, dtype=np.int64).reshape(-1, 3)
+        self.vline_ary = np.array(vline_list, dtype=np.int64).reshape(-1, 3)
+
+        # attached cells: mobject list, (M, 2) cell index, (M, 2) span, (M, 3) critical point ratio, (M, 3) position
+        self.cell_mobj_list = []
+        self.cell_idx_ary   = np.zeros((0, 2), dtype=np.int64)
+        self.cell_span_ary  = np.zeros((0, 2), dtype=np.int64)
+        self.cell_cp_ratio  = np.zeros((0, 3))
+        self.cell_pos_ary   = np.zeros((0, 3))
+
+        self.rules = VMobject(color=color, stroke_width=stroke_width)
+        VGroup.__init__(self, self.rules, **kwargs)
+        self.update_rules()
+
+
+    def get_rule_end_points(self):
+        """
+        @return (nb_hline + nb_vline, 2, 3) start and end points of all the rules
+        """
+        anchor   = self.layout.tab_ancher_pos
+        x_offset = self.layout.x_offset
+        y_offset = self.layout.y_offset
+        hl       = self.hline_ary
+        vl       = self.vline_ary
+
+        end_points = np.tile(anchor, (len(hl) + len(vl), 2, 1))
+        # hlines: y = -y_offset[k], x = x_offset[x_start] -> x_offset[x_end]
+        end_points[:len(hl), :, 0] += x_offset[hl[:, 1:3]]
+        end_points[:len(hl), :, 1] -= y_offset[hl[:, 0]][:, np.newaxis]
+        # vlines: x = x_offset[k], y = -y_offset[y_start] -> -y_offset[y_end]
+        end_points[len(hl):, :, 0] += x_offset[vl[:, 0]][:, np.newaxis]
+        end_points[len(hl):, :, 1] -= y_offset[vl[:, 1:3]]
+        return end_points
+
+
+    def update_rules(self, draw_ratio=1.0):
+        """Set the rules points from the layout.
+
+        @param[in] draw_ratio each rule is drawn from its start to this ratio (for creation)
+        """
+        end_points = self.get_rule_end_points()
+        alpha      = np.linspace(0, draw_ratio, 4)[:, np.newaxis]
+        # (K, 4, 3) one line curve per rule
+        points     = end_points[:, np.newaxis, 0, :] + alpha * (end_points[:, np.newaxis, 1, :] - end_points[:, np.newaxis, 0, :])
+        self.rules.set_points(points.reshape(-1, 3))
+
+
+    def get_cell_pos_ary(self):
+        """
+        @return (M, 3) critical point positions of the attached cells
+        """
+        layout = self.layout
+        x_ary  = self.cell_idx_ary[:, 0]
+        y_ary  = self.cell_idx_ary[:, 1]
+        x0 = layout.x_offset[x_ary]
+        x1 = layout.x_offset[x_ary + self.cell_span_ary[:, 0]]
+        y0 = layout.y_offset[y_ary]
+        y1 = layout.y_offset[y_ary + self.cell_span_ary[:, 1]]
+
+        pos_ary = np.tile(layout.tab_ancher_pos, (len(self.cell_mobj_list), 1))
+        pos_ary[:, 0] += ( x0 + self.cell_cp_ratio[:, 0] * (x1 - x0))
+        pos_ary[:, 1] += (-y0 + self.cell_cp_ratio[:, 1] * (y1 - y0))
+        return pos_ary
+
+
+    def attach_cell_mobject(self, cell_idx_x, cell_idx_y, mobj, critical_point_dir=ORIGIN, nb_span_x=1, nb_span_y=1):
+        """Place mobj's critical point at the cell's critical point, and move it with the table.
+
+        @param[in] cell_idx_x         table cell index x
+        @param[in] cell_idx_y         table cell index y
+        @param[in] mobj               mobject to place
+        @param[in] critical_point_dir manim style critical point direction (of both the cell and mobj)
+        @param[in] nb_span_x          number of merged cells in x (the cell is (x, y) to (x + nb_span_x - 1, y))
+        @param[in] nb_span_y          number of merged cells in y
+        @return    mobj
+        """
+        assert(cell_idx_x + nb_span_x <= self.layout.get_nb_col())
+        assert(cell_idx_y + nb_span_y <= self.layout.get_nb_row())
+        self.cell_mobj_list.append(mobj)
+        self.cell_idx_ary  = np.vstack((self.cell_idx_ary,  [cell_idx_x, cell_idx_y]))
+        self.cell_span_ary = np.vstack((self.cell_span_ary, [nb_span_x, nb_span_y]))
+        self.cell_cp_ratio = np.vstack((self.cell_cp_ratio, 0.5 * (np.asarray(critical_point_dir) + RIGHT + DOWN)))
+
+        self.cell_pos_ary = self.get_cell_pos_ary()
+        critical_point_move_to(mobj, critical_point_dir, self.cell_pos_ary[-1])
+        return mobj
+
+
+    def set_cell_size(self, width_ary, height_ary):
+        """Resize the table: the rules and the attached cells follow.
+
+        @param[in] width_ary  (nb_col,) widths
+        @param[in] height_ary (nb_row,) heights
+        """
+        self.layout.set_cell_size(width_ary, height_ary)
+        self.update_rules()
+
+        new_pos_ary = self.get_cell_pos_ary()
+        delta_ary   = new_pos_ary - self.cell_pos_ary
+        for k in np.nonzero(np.any(delta_ary != 0, axis=1))[0]:
+            self.cell_mobj_list[k].shift(delta_ary[k])
+        self.cell_pos_ary = new_pos_ary
+        return self
+
+
+
+class TableRuleCreation(Animation):
+    """Draw all the rules of a TableMobject at the same time (as ShowCreation of each Line).
+    """
+
+    def __init__(self, table, **kwargs):
+        Animation.__init__(self, table, **kwargs)
+
+
+    def create_starting_mobject(self):
+        return self.mobject
+
+
+    def get_all_mobjects(self):
+        return [self.mobject]
+
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.update_rules(draw_ratio=alpha)
+
+
+
+class TableResize(Animation):
+    """Animate TableMobject widths/heights.
+
+    All the rule end points and the attached cell positions are
+    interpolated by the layout offsets, one NumPy pass per frame.
+
+    The attached cells are the table's submobjects while resizing, thus
+    the renderer redraws them every frame (not cached as static.) Since
+    they are drawn also when they are not yet in the scene, resize after
+    the cells are shown.
+    """
+
+    def __init__(self, table, width_ary=None, height_ary=None, **kwargs):
+        """
+        @param[in] table      TableMobject
+        @param[in] width_ary  (nb_col,) target widths. None: unchanged
+        @param[in] height_ary (nb_row,) target heights. None: unchanged
+        @param[in] kwargs     Animation parameters (e.g., run_time)
+        """
+        self.__target_width_ary  = width_ary
+        self.__target_height_ary = height_ary
+        Animation.__init__(self, table, **kwargs)
+
+
+    def begin(self):
+        layout = self.mobject.layout
+        self.__start_size_ary = np.concatenate((layout.width_ary, layout.height_ary))
+        self.__end_size_ary   = np.concatenate((
+            layout.width_ary  if (self.__target_width_ary  is None) else np.asarray(self.__target_width_ary,  dtype=np.float64),
+            layout.height_ary if (self.__target_height_ary is None) else np.asarray(self.__target_height_ary, dtype=np.float64)))
+        # the cells move with the rules
+        self.mobject.add(*self.mobject.cell_mobj_list)
+        Animation.begin(self)
+
+
+    def clean_up_from_scene(self, scene):
+        self.mobject.remove(*self.mobject.cell_mobj_list)
+        Animation.clean_up_from_scene(self, scene)
+
+
+    def create_starting_mobject(self):
+        # start state is in the size arrays, no copy
+        return self.mobject
+
+
+    def get_all_mobjects(self):
+        return [self.mobject]
+
+
+    def interpolate_mobject(self, alpha):
+        size_ary = self.__start_size_ary + alpha * (self.__end_size_ary - self.__start_size_ary)
+        nb_col   = self.mobject.layout.get_nb_col()
+        self.mobject.set_cell_size(size_ary[:nb_col], size_ary[nb_col:])
+
+
+
+class CowArray(np.ndarray):
+    """Copy-on-write view of an array shared by snapshot() mobjects.
+
+    The view is read only. A write through the owner's attribute
+    (owner.points[i] = ..., owner.points += ..., owner.points[:, 0] *= 2,
+    set_color()'s curr_rgbas[:, :3] = ...) first copies the shared array
+    to the owner (the attribute becomes a plain array), so the other
+    sharers are not changed. An ufunc result is a plain array.
+
+    Note: a write into a slice (owner.points[3:][0] = ...) or an ufunc out=
+    raises ValueError (read only) instead of copying.
+    """
+
+    def __new__(cls, base, owner, attr_name):
+        """
+        @param[in] base      shared array
+        @param[in] owner     object which has this view as the attribute attr_name
+        @param[in] attr_name attribute name
+        """
+        view = np.asarray(base).view(cls)
+        view.flags.writeable = False
+        view.cow_owner       = owner
+        view.cow_attr_name   = attr_name
+        view.cow_own_ary     = None
+        return view
+
+
+    def __array_finalize__(self, obj):
+        # views and copies of a CowArray are not the owner's attribute
+        self.cow_owner     = None
+        self.cow_attr_name = None
+        self.cow_own_ary   = None
+
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple([(x.view(np.ndarray) if isinstance(x, CowArray) else x) for x in inputs])
+        if ("out" in kwargs):
+            kwargs["out"] = tuple([(x.view(np.ndarray) if isinstance(x, CowArray) else x) for x in kwargs["out"]])
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+
+    # copies (Mobject.copy(), pickle of TexCache) are plain arrays
+    def __deepcopy__(self, memo):
+        return np.array(self.view(np.ndarray))
+
+    def __reduce__(self):
+        return self.view(np.ndarray).__reduce__()
+
+
+    def get_own_array(self):
+        """Copy the shared array and set it to the owner's attribute (once).
+
+        @return the owner's own (writable) array
+        """
+        if (self.cow_own_ary is None):
+            self.cow_own_ary = np.array(self.view(np.ndarray))
+            # a stale view (the attribute is already replaced) does not overwrite the attribute
+            if (self.cow_owner.__dict__.get(self.cow_attr_name) is self):
+                setattr(self.cow_owner, self.cow_attr_name, self.cow_own_ary)
+        return self.cow_own_ary
+
+
+    def __setitem__(self, key, value):
+        if (self.cow_owner is None):
+            return np.ndarray.__setitem__(self, key, value)
+        self.get_own_array()[key] = value
+
+
+    # owner.points += v: a new array is assigned to the attribute, the shared array is not changed.
+    # owner.points[:, 0] *= v: the read only slice gives a new array, then owner.points.__setitem__ copies
+    def is_inplace(self):
+        return ((self.cow_owner is None) and self.flags.writeable)
+
+    def __iadd__(self, other):
+        return np.ndarray.__iadd__(self, other) if self.is_inplace() else np.add(self, other)
+
+    def __isub__(self, other):
+        return np.ndarray.__isub__(self, other) if self.is_inplace() else np.subtract(self, other)
+
+    def __imul__(self, other):
+        return np.ndarray.__imul__(self, other) if self.is_inplace() else np.multiply(self, other)
+
+    def __itruediv__(self, other):
+        return np.ndarray.__itruediv__(self, other) if self.is_inplace() else np.true_divide(self, other)
+
+
+
+def snapshot(mobj):
+    """Copy-on-write copy of mobj and its family.
+
+    As Mobject.copy(), but the array attributes (points, fill_rgbas,
+    stroke_rgbas, ...) are not copied: the snapshot and the original share
+    them by CowArray views (each side has its own view), and either side
+    copies an array at its first write. Thus a snapshot of a TeX-heavy
+    VGroup costs about the family size, not the point data, and the
+    in-place writes of manim (scale(), rotate(), set_color(), ...) on
+    either side do not change the other. Other attributes are shared
+    (copy.copy), the submobject and the updater lists are the snapshot's
+    own.
+
+    @param[in] mobj mobject
+    @return    snapshot of mobj
+    """
+    family   = mobj.get_family()
+    snap_map = {}
+    for member in family:
+        snap = copy.copy(member)
+        for (attr_name, value) in list(member.__dict__.items()):
+            if (isinstance(value, np.ndarray)):
+                base = value.view(np.ndarray)
+                member.__dict__[attr_name] = CowArray(base, member, attr_name)
+                snap.__dict__[attr_name]   = CowArray(base, snap,   attr_name)
+        snap.updaters = list(member.updaters)
+        snap_map[id(member)] = snap
+
+    # the family references point to the snapshot family
+    for member in family:
+        snap = snap_map[id(member)]
+        snap.submobjects = [snap_map[id(submob)] for submob in member.submobjects]
+        for (attr_name, value) in list(member.__dict__.items()):
+            if (isinstance(value, Mobject) and (value is not member) and (id(value) in snap_map)):
+                snap.__dict__[attr_name] = snap_map[id(value)]
+    return snap_map[id(mobj)]
+
+
+
+def check_snapshot():
+    """Check that manim's in-place writes on either side do not change the other.
+
+    Example:
+        cd 202011_medical_bayes
+        python3 -c "import myutil; myutil.check_snapshot()"
+    """
+    for is_write_orig in (True, False):
+        orig = VGroup(Square(color=BLUE), Circle(color=GREEN))
+        snap = snapshot(orig)
+        (writer, reader) = (orig, snap) if is_write_orig else (snap, orig)
+        points_list = [np.array(m.points)       for m in reader.get_family()]
+        rgbas_list  = [np.array(m.fill_rgbas)   for m in reader.get_family()]
+        stroke_list = [np.array(m.stroke_rgbas) for m in reader.get_family()]
+
+        writer.scale(2)
+        writer.rotate(PI / 3)
+        writer.set_color(RED)
+
+        assert(all([np.array_equal(m.points, p)       for (m, p) in zip(reader.get_family(), points_list)]))
+        assert(all([np.array_equal(m.fill_rgbas, c)   for (m, c) in zip(reader.get_family(), rgbas_list)]))
+        assert(all([np.array_equal(m.stroke_rgbas, c) for (m, c) in zip(reader.get_family(), stroke_list)]))
+    print("check_snapshot: ok")
+
+
+
 def move_src_list_dst(scene, src_mobj_list, dst_mobj):
     """Only move the src and dst, without sideeffect
 
-    Note: if mobject has no __deepcopy__ implemented, no side effect fails.
+    The work mobjects left at the sources are copy-on-write snapshots.
 
     src_mobj_list is a list of mobj (multiple source, single destination)
 
 
     """
-    # element wise deep copy
+    # element wise copy-on-write snapshot
     move_work_list = []
     for mobj in src_mobj_list:
-        move_work_list.append(copy.deepcopy(mobj))
+        move_work_list.append(snapshot(mobj))
     scene.add(*move_work_list)
 
     # for i in src_mobj_list:
@@ -275,10 +799,1225 @@ def move_src_list_dst(scene, src_mobj_list, dst_mobj):
 def transform_src_dst(scene, src_mobj, dst_mobj):
     """Only move the src and dst, without sideeffect
 
-    Note: if mobject has no __deepcopy__ implemented, no side effect fails.
+    The work mobjects are copy-on-write snapshots: only the written
+    arrays of src_work are copied by the Transform.
     """
-    src_work = copy.deepcopy(src_mobj)
-    dst_work = copy.deepcopy(dst_mobj)
+    src_work = snapshot(src_mobj)
+    dst_work = snapshot(dst_mobj)
     scene.add(src_work)
     scene.play(Transform(src_work, dst_work))
     scene.remove(src_work, dst_work)
+
+
+
+class SVGShape(object):
+    """Parsed SVG geometry shared by SVGInstance objects.
+
+    All the subpaths of the SVG file are concatenated into one point
+    array (read only). The anchor bounding box is kept for the critical
+    point computation.
+    """
+
+    def __init__(self, file_name, **kwargs):
+        """
+        @param[in] file_name SVG file name (the same as SVGMobject)
+        @param[in] kwargs    SVGMobject geometry parameters (e.g., height)
+        """
+        svg = SVGMobject(file_name, **kwargs)
+        self.points = np.concatenate([mobj.points for mobj in svg.family_members_with_points()])
+        self.points.setflags(write=False)
+
+        anchors = np.concatenate((self.points[0::4], self.points[3::4]))
+        self.bb_min = anchors.min(axis=0)
+        self.bb_max = anchors.max(axis=0)
+
+
+_svg_shape_cache = {}
+
+def get_svg_shape(file_name, **kwargs):
+    """Get a SVGShape. Each (file_name, kwargs) is parsed only once.
+
+    @param[in] file_name SVG file name
+    @param[in] kwargs    SVGMobject geometry parameters (hashable values only)
+    @return    SVGShape
+    """
+    key = (file_name, tuple(sorted(kwargs.items())))
+    if (key not in _svg_shape_cache):
+        _svg_shape_cache[key] = SVGShape(file_name, **kwargs)
+    return _svg_shape_cache[key]
+
+
+
+class SVGInstance(VMobject):
+    """An instance of a shared SVGShape: points = shape.points * scale_factor + offset
+
+    shift(), scale() and move_to() only update (scale_factor, offset), the
+    shared points are not copied. A straight interpolation between two
+    shared instances of the same shape (e.g., Transform of set_color())
+    interpolates (scale_factor, offset). Any other point modification
+    makes the instance own its points (copy on write), then it behaves as
+    a usual VMobject.
+
+    Note: in-place element assignment to the points of a shared instance,
+    e.g., mobj.points[0] = ..., is lost (see points.) Assign the points
+    instead, as manim does.
+    """
+
+    def __init__(self, shape, scale_factor=1.0, offset=None, **kwargs):
+        """
+        @param[in] shape        SVGShape
+        @param[in] scale_factor scale factor of the shape, or (1,) array. An array is not
+                                copied, a slice of SVGInstanceGroup's scale array.
+        @param[in] offset       (3,) position of the shape center. Not copied,
+                                a row of SVGInstanceGroup's offset array.
+        @param[in] kwargs       VMobject parameters (e.g., color, fill_opacity)
+        """
+        self.__shape        = shape
+        self.__scale_factor = (scale_factor if isinstance(scale_factor, np.ndarray) else
+                               np.array([scale_factor], dtype=np.float64))
+        self.__offset       = np.zeros(3) if (offset is None) else offset
+        self.__own_points   = None
+        VMobject.__init__(self, **kwargs)
+
+
+    @property
+    def points(self):
+        """(P, 3) points.
+
+        While shared, each access computes a new array from the shape:
+        an in-place element write (mobj.points[0] = ..., mobj.points[:, 0] *= 2)
+        changes only that temporary array and is lost. An augmented
+        assignment to the attribute (mobj.points += v, as manim's
+        apply_points_function does) or an assignment (mobj.points = ...)
+        goes through the setter, then the instance owns its points.
+        """
+        if (self.__own_points is not None):
+            return self.__own_points
+        return self.__shape.points * self.__scale_factor + self.__offset
+
+    @points.setter
+    def points(self, new_points):
+        self.__own_points = new_points
+
+
+    def reset_points(self):
+        """back to the shared shape"""
+        self.__own_points = None
+
+
+    def is_shared(self):
+        """True when the points are still the shared shape"""
+        return ((self.__own_points is None) and (len(self.submobjects) == 0))
+
+
+    def get_offset(self):
+        """shape center position (a view when shared)"""
+        return self.__offset
+
+
+    def get_scale_factor(self):
+        """shape scale factor"""
+        return self.__scale_factor[0]
+
+
+    def bind_offset(self, offset_ref):
+        """Use offset_ref as the offset storage (e.g., a row of a group array)
+
+        @param[in] offset_ref (3,) array, the current offset is copied to it
+        """
+        offset_ref[:]  = self.__offset
+        self.__offset  = offset_ref
+
+
+    def bind_scale_factor(self, scale_ref):
+        """Use scale_ref as the scale factor storage (e.g., a slice of a group array)
+
+        @param[in] scale_ref (1,) array, the current scale factor is copied to it
+        """
+        scale_ref[:]        = self.__scale_factor
+        self.__scale_factor = scale_ref
+
+
+    def shift(self, *vectors):
+        if (not self.is_shared()):
+            return VMobject.shift(self, *vectors)
+        self.__offset += np.sum(vectors, axis=0)
+        return self
+
+
+    def scale(self, scale_factor, **kwargs):
+        if ((not self.is_shared()) or (scale_factor <= 0)):
+            return VMobject.scale(self, scale_factor, **kwargs)
+
+        # the same as apply_points_function_about_point()
+        about_point = kwargs.get("about_point", None)
+        if (about_point is None):
+            about_edge = kwargs.get("about_edge", None)
+            about_point = self.get_critical_point(ORIGIN if (about_edge is None) else about_edge)
+
+        # s (p - c) + c = (s scale_factor) shape + (s offset + (1 - s) c)
+        self.__offset       *= scale_factor
+        self.__offset       += (1 - scale_factor) * about_point
+        self.__scale_factor *= scale_factor
+        return self
+
+
+    def get_critical_point(self, direction):
+        if (not self.is_shared()):
+            return VMobject.get_critical_point(self, direction)
+        bb_min = self.__shape.bb_min * self.__scale_factor + self.__offset
+        bb_max = self.__shape.bb_max * self.__scale_factor + self.__offset
+        direction = np.array(direction)
+        return np.where(direction > 0, bb_max, np.where(direction < 0, bb_min, 0.5 * (bb_min + bb_max)))
+
+
+    def interpolate(self, mobject1, mobject2, alpha, path_func=straight_path):
+        # (1 - a) (s1 shape + o1) + a (s2 shape + o2) = ((1 - a) s1 + a s2) shape + ((1 - a) o1 + a o2)
+        if ((path_func is not straight_path) or (not self.is_shared()) or
+            (not all([(isinstance(mobj, SVGInstance) and mobj.is_shared() and (mobj.__shape is self.__shape))
+                      for mobj in (mobject1, mobject2)]))):
+            return VMobject.interpolate(self, mobject1, mobject2, alpha, path_func)
+        self.__scale_factor[:] = interpolate(mobject1.__scale_factor, mobject2.__scale_factor, alpha)
+        self.__offset[:]       = interpolate(mobject1.__offset,       mobject2.__offset,       alpha)
+        self.interpolate_color(mobject1, mobject2, alpha)
+        return self
+
+
+    def __deepcopy__(self, memo):
+        """deep copy except the shared (read only) shape"""
+        memo[id(self.__shape)] = self.__shape
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        for (key, val) in self.__dict__.items():
+            result.__dict__[key] = copy.deepcopy(val, memo)
+        return result
+
+
+
+class SVGInstanceGroup(VGroup):
+    """A group of SVGInstance of one SVG file.
+
+    The SVG file is parsed once. Each instance's offset and scale factor
+    are views of one (N, 3) offset array and one (N,) scale array, thus
+    the memory is the shared shape plus N transforms and styles, and the
+    instances can be moved and scaled in bulk (e.g., BatchMoveTo).
+
+    Example:
+        svg_people = SVGInstanceGroup("svg/person_silhouette", pos_ary, scale_factor=0.08,
+                                      fill_opacity=1.0, color="#bcbbbd")
+        svg_people[3].set_color(RED)
+    """
+
+    def __init__(self, file_name, pos_ary, scale_factor=1.0, svg_kwargs=None, **kwargs):
+        """
+        @param[in] file_name    SVG file name
+        @param[in] pos_ary      (N, 3) instance center positions
+        @param[in] scale_factor scale factor of the shape (SVGMobject's height is 2)
+        @param[in] svg_kwargs   SVGMobject geometry parameters. None: no parameter
+        @param[in] kwargs       style parameters of each instance (e.g., color, fill_opacity)
+        """
+        if (svg_kwargs is None):
+            svg_kwargs = {}
+        self.__shape      = get_svg_shape(file_name, **svg_kwargs)
+        self.__offset_ary = np.array(pos_ary, dtype=np.float64).reshape(-1, 3)
+        self.__scale_ary  = np.full(self.__offset_ary.shape[0], scale_factor, dtype=np.float64)
+        VGroup.__init__(self, *[SVGInstance(self.__shape, self.__scale_ary[i:i + 1], self.__offset_ary[i], **kwargs)
+                                for i in range(self.__offset_ary.shape[0])])
+
+
+    def get_offset_ary(self):
+        """(N, 3) offset array. Row i is the i-th instance center while it is shared."""
+        return self.__offset_ary
+
+
+    def get_scale_ary(self):
+        """(N,) scale array. Element i is the i-th instance scale factor while it is shared."""
+        return self.__scale_ary
+
+
+    def move_instances_to(self, pos_ary, idx_ary=None):
+        """Move instances (centers) to the positions in bulk.
+
+        Shared instances are moved by one offset array assignment.
+
+        @param[in] pos_ary (K, 3) destination center positions
+        @param[in] idx_ary (K,) instance indices. None: all the instances
+        @return self
+        """
+        if (idx_ary is None):
+            idx_ary = np.arange(len(self.submobjects))
+        idx_ary = np.asarray(idx_ary, dtype=np.int64)
+        pos_ary = np.broadcast_to(np.asarray(pos_ary, dtype=np.float64), (idx_ary.shape[0], 3))
+
+        is_shared = np.array([self.submobjects[i].is_shared() for i in idx_ary], dtype=bool)
+        # shared center == offset
+        self.__offset_ary[idx_ary[is_shared]] = pos_ary[is_shared]
+        for k in np.nonzero(~is_shared)[0]:
+            self.submobjects[idx_ary[k]].move_to(pos_ary[k])
+        return self
+
+
+    def shift(self, *vectors):
+        for mobj in self.submobjects:
+            mobj.shift(*vectors)
+        return self
+
+
+    def scale(self, scale_factor, **kwargs):
+        about_point = kwargs.get("about_point", None)
+        if (about_point is None):
+            about_edge = kwargs.get("about_edge", None)
+            about_point = self.get_critical_point(ORIGIN if (about_edge is None) else about_edge)
+        for mobj in self.submobjects:
+            mobj.scale(scale_factor, about_point=about_point)
+        return self
+
+
+    def __deepcopy__(self, memo):
+        """deep copy and re-bind the instance offsets and scale factors to the copied arrays"""
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        for (key, val) in self.__dict__.items():
+            result.__dict__[key] = copy.deepcopy(val, memo)
+        offset_ary = result.get_offset_ary()
+        scale_ary  = result.get_scale_ary()
+        for (i, mobj) in enumerate(result.submobjects):
+            if (isinstance(mobj, SVGInstance) and (i < offset_ary.shape[0])):
+                mobj.bind_offset(offset_ary[i])
+                mobj.bind_scale_factor(scale_ary[i:i + 1])
+        return result
+
+
+
+class BatchMoveTo(Animation):
+    """Move (and scale) many mobjects to target positions as one animation.
+
+    Instead of one ApplyMethod(mobj.move_to, pos) per mobject, which copies
+    and interpolates every mobject separately, this keeps (N, 3) start and
+    target center arrays and computes all the centers with one NumPy
+    operation per frame. Mobjects are not copied.
+
+    When instance_group (SVGInstanceGroup) is given, its shared instances
+    are moved and scaled by one offset and one scale array assignment per
+    frame. The other mobjects are scaled and moved one by one.
+
+    The animation's mobject is a new Group of the mobjects, which the scene
+    adds while playing. Then the scene has the mobjects instead of the
+    group (clean_up_from_scene()).
+
+    Example:
+        self.play(BatchMoveTo(people, pos_ary, instance_group=svg_people))
+        self.play(BatchMoveTo(people, None, scale_factor=10.0, instance_group=svg_people))  # scale in place
+    """
+
+    def __init__(self, mobj_list, target_pos_ary=None, scale_factor=1.0, instance_group=None, **kwargs):
+        """
+        @param[in] mobj_list      N mobjects
+        @param[in] target_pos_ary (N, 3) or (3,) target center positions. None: stay
+        @param[in] scale_factor   scale factor at the end (about each center)
+        @param[in] instance_group SVGInstanceGroup which has the mobjects (optional)
+        @param[in] kwargs         Animation parameters (e.g., run_time)
+        """
+        self.__mobj_list      = list(mobj_list)
+        self.__target_pos_ary = target_pos_ary
+        self.__scale_factor   = scale_factor
+        self.__instance_group = instance_group
+        Animation.__init__(self, Group(*self.__mobj_list), **kwargs)
+
+
+    def begin(self):
+        nb_mobj = len(self.__mobj_list)
+        self.__start_pos_ary = np.array([mobj.get_center() for mobj in self.__mobj_list]).reshape(nb_mobj, 3)
+        if (self.__target_pos_ary is None):
+            self.__end_pos_ary = self.__start_pos_ary.copy()
+        else:
+            self.__end_pos_ary = np.array(np.broadcast_to(np.asarray(self.__target_pos_ary, dtype=np.float64),
+                                                          (nb_mobj, 3)))
+        self.__cur_scale_ary = np.ones(nb_mobj)
+
+        # fast path: shared instances of instance_group
+        self.__fast_k_ary   = np.zeros(0, dtype=np.int64)
+        self.__fast_idx_ary = np.zeros(0, dtype=np.int64)
+        if (self.__instance_group is not None):
+            group_idx = {id(mobj): i for (i, mobj) in enumerate(self.__instance_group.submobjects)}
+            fast_k    = [k for (k, mobj) in enumerate(self.__mobj_list)
+                         if ((id(mobj) in group_idx) and mobj.is_shared())]
+            self.__fast_k_ary   = np.array(fast_k, dtype=np.int64)
+            self.__fast_idx_ary = np.array([group_idx[id(self.__mobj_list[k])] for k in fast_k], dtype=np.int64)
+            # offset = center + scale * (offset - center) / scale: the last term is the shape's, constant
+            offset_ary = self.__instance_group.get_offset_ary()
+            self.__fast_start_scale_ary = self.__instance_group.get_scale_ary()[self.__fast_idx_ary]
+            self.__fast_unit_offset_ary = ((offset_ary[self.__fast_idx_ary] - self.__start_pos_ary[self.__fast_k_ary]) /
+                                           self.__fast_start_scale_ary[:, np.newaxis])
+
+        is_slow = np.ones(nb_mobj, dtype=bool)
+        is_slow[self.__fast_k_ary] = False
+        self.__slow_k_ary = np.nonzero(is_slow)[0]
+
+        Animation.begin(self)
+
+
+    def create_starting_mobject(self):
+        # start state is in the position arrays, no copy
+        return self.mobject
+
+
+    def get_all_mobjects(self):
+        return [self.mobject]
+
+
+    def interpolate_mobject(self, alpha):
+        pos_ary = self.__start_pos_ary + alpha * (self.__end_pos_ary - self.__start_pos_ary)
+        # the same interpolation as ApplyMethod: scale 1 -> scale_factor about the moving center
+        scale = 1.0 + alpha * (self.__scale_factor - 1.0)
+
+        if (self.__fast_k_ary.shape[0] > 0):
+            scale_ary  = self.__instance_group.get_scale_ary()
+            offset_ary = self.__instance_group.get_offset_ary()
+            scale_ary[self.__fast_idx_ary]  = scale * self.__fast_start_scale_ary
+            offset_ary[self.__fast_idx_ary] = (pos_ary[self.__fast_k_ary] +
+                                               scale_ary[self.__fast_idx_ary][:, np.newaxis] * self.__fast_unit_offset_ary)
+
+        for k in self.__slow_k_ary:
+            mobj = self.__mobj_list[k]
+            if (scale != self.__cur_scale_ary[k]):
+                mobj.scale(scale / self.__cur_scale_ary[k])
+                self.__cur_scale_ary[k] = scale
+            mobj.move_to(pos_ary[k])
+
+
+    def clean_up_from_scene(self, scene):
+        # the scene added the group (and took the mobjects out of their parents): put the mobjects back
+        if (self.mobject in scene.mobjects):
+            scene.remove(self.mobject)
+            scene.add(*self.__mobj_list)
+        Animation.clean_up_from_scene(self, scene)
+
+
+
+class GridLayout(object):
+    """nb_x * nb_y grid layout. All the positions are one NumPy array.
+
+                                 pos_max
+       +----+----+-- ... --+----+
+       |    |    |         |    |  iy = nb_y - 1
+       +----+----+-- ... --+----+
+       ...
+       +----+----+-- ... --+----+
+       |(0,0)    |         |    |  iy = 0
+       +----+----+-- ... --+----+
+     pos_min
+
+    pcoord = [ix, iy]: grid index coordinates
+    1D index = ix + iy * nb_x (the bottom row first)
+    """
+
+    def __init__(self, nb_x, nb_y, pos_min, pos_max):
+        """
+        @param[in] nb_x    number of columns
+        @param[in] nb_y    number of rows
+        @param[in] pos_min position of [0, 0]
+        @param[in] pos_max position of [nb_x - 1, nb_y - 1]
+        """
+        assert((nb_x > 1) and (nb_y > 1))
+        self.nb_x = nb_x
+        self.nb_y = nb_y
+        self.dx   = (pos_max[0] - pos_min[0]) / (nb_x - 1)
+        self.dy   = (pos_max[1] - pos_min[1]) / (nb_y - 1)
+        self.pos_min = np.array(pos_min, dtype=np.float64)
+
+        # (nb_x * nb_y,) index coords of each 1D index
+        self.ix_ary = np.tile(np.arange(nb_x), nb_y)
+        self.iy_ary = np.repeat(np.arange(nb_y), nb_x)
+
+        # (nb_x * nb_y, 3) all the positions
+        self.pos_ary = self.get_position(np.stack((self.ix_ary, self.iy_ary), axis=1))
+
+
+    def get_nb_cell(self):
+        """number of grid cells"""
+        return self.nb_x * self.nb_y
+
+
+    def get_position(self, pcoord):
+        """get the position of pcoord
+
+        @param[in] pcoord [ix, iy] or (K, 2) array of them
+        @return    (3,) position or (K, 3) positions
+        """
+        pcoord = np.asarray(pcoord)
+        return (self.pos_min + pcoord[..., 0, np.newaxis] * self.dx * RIGHT
+                             + pcoord[..., 1, np.newaxis] * self.dy * UP)
+
+
+    def get_1d_idx(self, pcoord):
+        """get the 1D index of pcoord
+
+        @param[in] pcoord [ix, iy] or (K, 2) array of them
+        @return    1D index or (K,) 1D indices
+        """
+        pcoord = np.asarray(pcoord)
+        return pcoord[..., 0] + pcoord[..., 1] * self.nb_x
+
+
+    def get_pcoord(self, idx_1d):
+        """get pcoord of 1D indices
+
+        @param[in] idx_1d 1D index or (K,) 1D indices
+        @return    [ix, iy] or (K, 2) pcoords
+        """
+        idx_1d = np.asarray(idx_1d)
+        return np.stack((idx_1d % self.nb_x, idx_1d // self.nb_x), axis=-1)
+
+
+    def get_row_1d_idx(self, iy):
+        """get the 1D indices of row iy"""
+        return np.arange(self.nb_x) + iy * self.nb_x
+
+
+    def get_mask(self, pcoord_list):
+        """get (nb_x * nb_y,) bool mask, True at pcoord_list
+
+        @param[in] pcoord_list (K, 2) pcoords
+        """
+        mask = np.zeros(self.get_nb_cell(), dtype=bool)
+        if (len(pcoord_list) > 0):
+            mask[self.get_1d_idx(pcoord_list)] = True
+        return mask
+
+
+    def move_to_grid(self, group, idx_ary=None):
+        """Move group's submobjects to the grid positions in bulk
+
+        @param[in] group   SVGInstanceGroup (fast) or any group, submobject i goes to 1D index i
+        @param[in] idx_ary 1D indices to move. None: all
+        @return    group
+        """
+        if (idx_ary is None):
+            idx_ary = np.arange(self.get_nb_cell())
+        if (isinstance(group, SVGInstanceGroup)):
+            return group.move_instances_to(self.pos_ary[idx_ary], idx_ary)
+        for idx in idx_ary:
+            group[idx].move_to(self.pos_ary[idx])
+        return group
+
+
+
+class PopulationSample(object):
+    """A sampled population of a disease test (see simulate_population()).
+
+    H: the person has the disease, E: the test is positive.
+    The confusion matrix classes are person index arrays (sorted):
+
+                    H           not H
+      E (+)       tp_idx      fp_idx
+      not E (-)   fn_idx      tn_idx
+    """
+
+    def __init__(self, is_h, is_e):
+        """
+        @param[in] is_h (N,) bool, person has the disease
+        @param[in] is_e (N,) bool, person's test is positive
+        """
+        self.nb_person = len(is_h)
+        self.is_h      = is_h
+        self.is_e      = is_e
+        self.tp_idx    = np.flatnonzero( is_h &  is_e)
+        self.fn_idx    = np.flatnonzero( is_h & ~is_e)
+        self.fp_idx    = np.flatnonzero(~is_h &  is_e)
+        self.tn_idx    = np.flatnonzero(~is_h & ~is_e)
+
+
+    def get_positive_idx(self):
+        """all the test positive person indices (true and false positive)"""
+        return np.flatnonzero(self.is_e)
+
+
+    def get_p_h_e(self):
+        """sampled P(H|E) = tp / (tp + fp), None when no positive"""
+        nb_positive = len(self.tp_idx) + len(self.fp_idx)
+        if (nb_positive == 0):
+            return None
+        return len(self.tp_idx) / nb_positive
+
+
+
+def simulate_population(nb_person, p_h, p_e_h, p_e_not_h, seed=None, is_exact=False):
+    """Monte Carlo population of a disease test, vectorized by NumPy.
+
+    Each person has the disease (H) with probability p_h, and the test is
+    positive (E) with probability p_e_h (sensitivity) when H, p_e_not_h
+    (false positive rate) when not H.
+
+    is_exact: instead of independent trials, exactly round(N P(H)) people
+    have H, and exactly round(n_H P(E|H)) / round(n_notH P(E|not H)) of
+    them are positive, at random indices. The counts then match the
+    expected values (e.g., the numbers in an equation of a scene.)
+
+    Millions of people are fine: the memory is a few bytes per person.
+
+    @param[in] nb_person number of people N
+    @param[in] p_h       prevalence P(H)
+    @param[in] p_e_h     sensitivity P(E|H)
+    @param[in] p_e_not_h false positive rate P(E|not H)
+    @param[in] seed      random seed (None: unpredictable)
+    @param[in] is_exact  sample the exact expected counts when True
+    @return    PopulationSample
+    """
+    rng = np.random.default_rng(seed)
+    if (not is_exact):
+        is_h   = rng.random(nb_person, dtype=np.float32) < p_h
+        p_e    = np.where(is_h, np.float32(p_e_h), np.float32(p_e_not_h))
+        is_e   = rng.random(nb_person, dtype=np.float32) < p_e
+        return PopulationSample(is_h, is_e)
+
+    def choose_mask(candidate_idx, nb_choose):
+        mask = np.zeros(nb_person, dtype=bool)
+        mask[rng.choice(candidate_idx, size=nb_choose, replace=False)] = True
+        return mask
+
+    is_h      = choose_mask(np.arange(nb_person), int(round(nb_person * p_h)))
+    h_idx     = np.flatnonzero(is_h)
+    not_h_idx = np.flatnonzero(~is_h)
+    is_e      = (choose_mask(h_idx,     int(round(len(h_idx)     * p_e_h))) |
+                 choose_mask(not_h_idx, int(round(len(not_h_idx) * p_e_not_h))))
+    return PopulationSample(is_h, is_e)
+
+
+
+class TexCache(object):
+    """Memoized MathTex / Tex / Text mobjects (memory and disk).
+
+    A mobject is keyed by the sha256 of its class, strings, TeX template,
+    keyword parameters and scale. The first request builds it (LaTeX or
+    Text rendering + SVG parse), then it is kept
+
+    * in memory: LRU, at most max_memory_items mobjects
+    * on disk:   pickled under cache_dir, at most max_disk_bytes in total.
+                 The least recently used files are removed first.
+
+    A request always returns a copy, thus the caller can color and move it.
+
+    Note: manim already keeps the compiled SVG files in tex_dir/text_dir.
+    This cache additionally skips the SVG parse and mobject construction
+    across the scenes of this series.
+    """
+
+    def __init__(self, cache_dir=None, max_memory_items=256, max_disk_bytes=64 * 1024 * 1024):
+        """
+        @param[in] cache_dir        disk cache directory. None: media_dir/mobject_cache
+        @param[in] max_memory_items memory cache size (number of mobjects)
+        @param[in] max_disk_bytes   disk cache size (bytes), 0: no disk cache
+        """
+        if (cache_dir is None):
+            cache_dir = os.path.join(config["media_dir"], "mobject_cache")
+        self.__cache_dir        = cache_dir
+        self.__max_memory_items = max_memory_items
+        self.__max_disk_bytes   = max_disk_bytes
+        self.__memory_cache     = collections.OrderedDict()
+        self.__version_key      = (self.get_manim_version(), tuple(sys.version_info[:2]))
+
+
+    @staticmethod
+    def get_manim_version():
+        """manim version string. manim 0.1.1 has no __version__, use the package metadata.
+
+        @return version string, "unknown" when not found
+        """
+        version = getattr(manim, "__version__", None)
+        if (version is not None):
+            return version
+        for dist_name in ("manim", "manimce"):
+            try:
+                return importlib.metadata.version(dist_name)
+            except importlib.metadata.PackageNotFoundError:
+                pass
+        return "unknown"
+
+
+    def get_key(self, mobj_class, strings, scale, kwargs):
+        """content hash of a mobject request
+
+        The manim and Python versions are a part of the key since the
+        pickled mobjects are not portable across them.
+        """
+        key_kwargs = dict(kwargs)
+        if (issubclass(mobj_class, SingleStringMathTex)):
+            tex_template = key_kwargs.pop("tex_template", None) or config["tex_template"]
+            key_kwargs["tex_template_body"] = tex_template.body
+        key_src = repr((self.__version_key, mobj_class.__module__, mobj_class.__name__, strings, scale, sorted(key_kwargs.items())))
+        return hashlib.sha256(key_src.encode("utf-8")).hexdigest()
+
+
+    def get(self, mobj_class, *strings, scale=None, **kwargs):
+        """get a copy of mobj_class(*strings, **kwargs).scale(scale)
+
+        @param[in] mobj_class MathTex, Tex, Text, ...
+        @param[in] strings    constructor strings
+        @param[in] scale      scale factor (None: no scaling)
+        @param[in] kwargs     constructor keyword parameters
+        @return    a new mobject (copy)
+        """
+        key = self.get_key(mobj_class, strings, scale, kwargs)
+
+        mobj = self.__memory_cache.get(key)
+        if (mobj is not None):
+            self.__memory_cache.move_to_end(key)
+            return mobj.copy()
+
+        mobj = self.load(key)
+        if (mobj is None):
+            mobj = mobj_class(*strings, **kwargs)
+            if (scale is not None):
+                mobj.scale(scale)
+            self.store(key, mobj)
+
+        self.__memory_cache[key] = mobj
+        if (len(self.__memory_cache) > self.__max_memory_items):
+            self.__memory_cache.popitem(last=False)
+        return mobj.copy()
+
+
+    def get_path(self, key):
+        return os.path.join(self.__cache_dir, key + ".pickle")
+
+
+    def load(self, key):
+        """load a mobject from the disk cache, None when not cached
+
+        The other manim processes (render_all.py) share the cache
+        directory, thus a file may be removed at any time: it is a miss.
+        """
+        if (self.__max_disk_bytes <= 0):
+            return None
+        path = self.get_path(key)
+        try:
+            with open(path, "rb") as f:
+                mobj = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # broken or stale (e.g., other manim version) entry
+            remove_file(path)
+            return None
+        # mark as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return mobj
+
+
+    def store(self, key, mobj):
+        """store a mobject to the disk cache and evict old entries
+
+        The pickle is written to a unique temporary file, then renamed,
+        thus concurrent processes never see or write a partial entry.
+        """
+        if (self.__max_disk_bytes <= 0):
+            return
+        os.makedirs(self.__cache_dir, exist_ok=True)
+        (fd, tmp_path) = tempfile.mkstemp(suffix=".tmp", dir=self.__cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(mobj, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.get_path(key))
+        except Exception as e:
+            logger.warning("TexCache: cannot store {0}: {1}".format(mobj_repr(mobj), e))
+            remove_file(tmp_path)
+            return
+        self.evict()
+
+
+    def evict(self):
+        """remove the least recently used files until the total size is in the limit
+
+        Files removed meanwhile by the other processes are skipped.
+        """
+        entry_list = []
+        for file_name in os.listdir(self.__cache_dir):
+            if (file_name.endswith(".pickle")):
+                try:
+                    st = os.stat(os.path.join(self.__cache_dir, file_name))
+                except FileNotFoundError:
+                    continue
+                entry_list.append((st.st_mtime, st.st_size, file_name))
+        total_bytes = sum([entry[1] for entry in entry_list])
+        for (mtime, size, file_name) in sorted(entry_list):
+            if (total_bytes <= self.__max_disk_bytes):
+                break
+            remove_file(os.path.join(self.__cache_dir, file_name))
+            total_bytes -= size
+
+
+def remove_file(path):
+    """remove a file, no error when it is already removed (e.g., by another process)"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def mobj_repr(mobj):
+    """short mobject description for messages"""
+    return "{0}({1})".format(mobj.__class__.__name__, getattr(mobj, "tex_string", getattr(mobj, "text", "")))
+
+
+_tex_cache = None
+
+def cached_tex(mobj_class, *strings, **kwargs):
+    """MathTex/Tex/Text through the shared TexCache
+
+    Example:
+        mtex = myutil.cached_tex(MathTex, r"P(H|E)", r"={", ...).scale(0.8)
+        text = myutil.cached_tex(Text, r": 病気", scale=0.6)
+
+    @param[in] mobj_class MathTex, Tex, Text, ...
+    @param[in] strings    constructor strings
+    @param[in] kwargs     constructor keyword parameters and scale
+    @return    a new mobject
+    """
+    global _tex_cache
+    if (_tex_cache is None):
+        _tex_cache = TexCache()
+    return _tex_cache.get(mobj_class, *strings, **kwargs)
+
+
+
+# TeX pre-compilation: (class name) -> (tex_environment, arg_separator)
+_TEX_CLASS_SETTING = {
+    "MathTex": ("align*", " "),
+    "Tex":     ("center", ""),
+}
+
+def collect_tex_call_list(scene_class):
+    """collect the constant MathTex/Tex requests in the source of a scene class
+
+    Both MathTex(r"a", r"b") and myutil.cached_tex(MathTex, r"a", r"b")
+    are collected. Calls with a non constant string or with keyword
+    parameters (except scale) are skipped, they are compiled as usual
+    when the scene runs.
+
+    @param[in] scene_class scene class
+    @return    list of (class name, tex string tuple)
+    """
+    tree = ast.parse(inspect.getsource(scene_class).strip())
+    call_list = []
+    for node in ast.walk(tree):
+        if (not isinstance(node, ast.Call)):
+            continue
+        func_name = node.func.attr if isinstance(node.func, ast.Attribute) else getattr(node.func, "id", None)
+        arg_list  = node.args
+        if ((func_name == "cached_tex") and (len(arg_list) > 0) and isinstance(arg_list[0], ast.Name)):
+            func_name = arg_list[0].id
+            arg_list  = arg_list[1:]
+        if (func_name not in _TEX_CLASS_SETTING):
+            continue
+        if ([kw for kw in node.keywords if kw.arg != "scale"]):
+            continue
+        if ((len(arg_list) == 0) or (not all([isinstance(arg, ast.Constant) and isinstance(arg.value, str) for arg in arg_list]))):
+            continue
+        call_list.append((func_name, tuple([arg.value for arg in arg_list])))
+    return call_list
+
+
+def get_tex_expression_list(call_list):
+    """LaTeX expressions compiled by the given MathTex/Tex calls
+
+    A MathTex(*tex_strings) compiles the joined string and each of the
+    tex_strings (to find the submobject structure.)
+
+    @param[in] call_list list of (class name, tex string tuple)
+    @return    list of unique (expression, environment)
+    """
+    modifier = SingleStringMathTex.__new__(SingleStringMathTex)
+    expression_set = set()
+    for (class_name, tex_strings) in call_list:
+        (environment, arg_separator) = _TEX_CLASS_SETTING[class_name]
+        if (arg_separator == " "):
+            tex_strings = [s.strip() for s in tex_strings]
+        tex_strings = [s for s in tex_strings if s != ""]
+        for tex in [arg_separator.join(tex_strings)] + tex_strings:
+            expression_set.add((modifier.get_modified_expression(tex), environment))
+    return sorted(expression_set)
+
+
+def _compile_tex_file(tex_file):
+    """pool worker: tex file -> svg file"""
+    tex_template = config["tex_template"]
+    dvi_file = compile_tex(tex_file, tex_template.tex_compiler, tex_template.output_format)
+    return convert_to_svg(dvi_file, tex_template.output_format)
+
+
+def precompile_scene_tex(scene, nb_process=None):
+    """compile all the constant TeX fragments of a scene in parallel
+
+    Call this in Scene.setup(). The fragments found in the scene source
+    are compiled by worker processes (one latex + dvisvgm per fragment),
+    then construct() finds all the svg files in the tex_dir.
+
+    Example:
+        def setup(self):
+            myutil.precompile_scene_tex(self)
+
+    @param[in] scene      scene (or scene class)
+    @param[in] nb_process number of worker processes. None: cpu count
+    @return    number of compiled fragments
+    """
+    scene_class = scene if inspect.isclass(scene) else scene.__class__
+    try:
+        call_list = collect_tex_call_list(scene_class)
+    except (OSError, TypeError, SyntaxError) as e:
+        logger.warning("precompile_scene_tex: no source of {0}: {1}".format(scene_class.__name__, e))
+        return 0
+
+    tex_template = config["tex_template"]
+    tex_file_list = []
+    for (expression, environment) in get_tex_expression_list(call_list):
+        tex_file = generate_tex_file(expression, environment, tex_template)
+        if (not os.path.exists(os.path.splitext(str(tex_file))[0] + ".svg")):
+            tex_file_list.append(tex_file)
+    if (len(tex_file_list) == 0):
+        return 0
+
+    if (nb_process is None):
+        nb_process = multiprocessing.cpu_count()
+    nb_process = max(1, min(nb_process, len(tex_file_list)))
+    logger.info("precompile_scene_tex: {0}: {1} fragments, {2} processes".
+                format(scene_class.__name__, len(tex_file_list), nb_process))
+    if (nb_process == 1):
+        for tex_file in tex_file_list:
+            _compile_tex_file(tex_file)
+    else:
+        with multiprocessing.Pool(nb_process) as pool:
+            pool.map(_compile_tex_file, tex_file_list)
+    return len(tex_file_list)
+
+
+class PartialMovieCache(object):
+    """Size bounded LRU of the partial movie files of a scene.
+
+    manim names each partial movie (one play()/wait() segment) by the
+    hash of its animations, the mobjects on the scene and the camera,
+    and reuses it when the hash is found. Thus only the edited segments
+    are rendered again. However, the cache is cleaned by the number of
+    files (max_files_cached, default 100) with the access time, which
+    is often not updated (noatime/relatime.) A long scene then loses
+    its own segments.
+
+    This replaces the cleaning:
+    * no file count limit, the total size is limited by max_bytes
+    * a reused segment is marked as recently used (mtime)
+    * the least recently used segments are removed first
+    """
+
+    def __init__(self, max_bytes=2 * 1024 * 1024 * 1024):
+        """
+        @param[in] max_bytes partial movie cache size of a scene (bytes)
+        """
+        self.__max_bytes = max_bytes
+
+
+    def install(self, scene):
+        """replace the partial movie cache handling of the scene's file writer
+
+        @param[in] scene scene (call in setup())
+        """
+        file_writer = scene.renderer.file_writer
+        if (not hasattr(file_writer, "partial_movie_directory")):
+            # not writing a movie
+            return
+        config["max_files_cached"] = -1
+
+        is_already_cached = file_writer.is_already_cached
+        def is_already_cached_touch(hash_invocation):
+            if (not is_already_cached(hash_invocation)):
+                return False
+            os.utime(self.get_path(file_writer, hash_invocation))
+            return True
+
+        file_writer.is_already_cached = is_already_cached_touch
+        file_writer.clean_cache       = lambda: self.evict(file_writer.partial_movie_directory)
+
+
+    def get_path(self, file_writer, hash_invocation):
+        return os.path.join(file_writer.partial_movie_directory,
+                            "{0}{1}".format(hash_invocation, config["movie_file_extension"]))
+
+
+    def evict(self, partial_movie_directory):
+        """remove the least recently used partial movies until the total size is in the limit
+
+        @param[in] partial_movie_directory partial movie directory of the scene
+        @return    number of removed files
+        """
+        entry_list = []
+        for file_name in os.listdir(partial_movie_directory):
+            if (file_name == "partial_movie_file_list.txt"):
+                continue
+            st = os.stat(os.path.join(partial_movie_directory, file_name))
+            entry_list.append((st.st_mtime, st.st_size, file_name))
+        total_bytes  = sum([entry[1] for entry in entry_list])
+        nb_removed   = 0
+        for (mtime, size, file_name) in sorted(entry_list):
+            if (total_bytes <= self.__max_bytes):
+                break
+            os.remove(os.path.join(partial_movie_directory, file_name))
+            total_bytes -= size
+            nb_removed  += 1
+        if (nb_removed > 0):
+            logger.info("PartialMovieCache: removed {0} partial movie(s) used the longest ago ({1} bytes kept)".
+                        format(nb_removed, total_bytes))
+        return nb_removed
+
+
+def use_partial_movie_cache(scene, max_bytes=2 * 1024 * 1024 * 1024):
+    """size bounded LRU partial movie cache for the scene
+
+    Example:
+        def setup(self):
+            myutil.use_partial_movie_cache(self)
+
+    @param[in] scene     scene
+    @param[in] max_bytes partial movie cache size of the scene (bytes)
+    """
+    PartialMovieCache(max_bytes).install(scene)
+
+
+def get_start_section(scene):
+    """name of the section where the rendering starts
+
+    The environment variable MANIM_START_SECTION overrides the scene's
+    start_section attribute. None: render all.
+
+    @param[in] scene scene
+    @return    section (animate_* method) name or None
+    """
+    return os.environ.get("MANIM_START_SECTION") or getattr(scene, "start_section", None)
+
+
+def set_skip_animations(scene, is_skip):
+    """set the renderer's skipping status
+
+    The renderer resets skip_animations to original_skipping_status at
+    each play()/wait(), thus both are set.
+    """
+    scene.renderer.skip_animations          = is_skip
+    scene.renderer.original_skipping_status = is_skip
+
+
+def animate_section(method):
+    """Decorator of an animate_* method: a section that can be fast-forwarded.
+
+    When a start section is given (see get_start_section()), the sections
+    called before it run with skip_animations: each play() jumps to the
+    end state of its animations without interpolating or rendering frames,
+    and wait() does nothing. Rendering starts at the start section.
+
+    Example:
+        @myutil.animate_section
+        def animate_check(self):
+            ...
+
+        MANIM_START_SECTION=animate_check python3 -m manim 07_bayse_example_01.py BayesExample01 -p -ql
+    """
+    @functools.wraps(method)
+    def wrapper(scene, *args, **kwargs):
+        start_section = get_start_section(scene)
+        if ((start_section is None) or getattr(scene, "is_start_section_reached", False)):
+            return method(scene, *args, **kwargs)
+
+        if (not hasattr(scene, "section_skipping_status")):
+            if (not getattr(getattr(scene.__class__, start_section, None), "is_animate_section", False)):
+                raise AttributeError("No section {0} in {1} (an @animate_section method)".format(
+                    start_section, scene.__class__.__name__))
+            scene.section_skipping_status = scene.renderer.original_skipping_status
+
+        if (method.__name__ == start_section):
+            scene.is_start_section_reached = True
+            set_skip_animations(scene, scene.section_skipping_status)
+        else:
+            set_skip_animations(scene, True)
+        return method(scene, *args, **kwargs)
+
+    # a start section must be a decorated method
+    wrapper.is_animate_section = True
+    return wrapper
+
+
+class Phase_timer(object):
+    """Break a scene's wall time into phases per animate_* (or @animate_section) section.
+
+    The phase functions (see get_phase_target_list()) are wrapped while
+    installed. The time is charged to the innermost running phase
+    (e.g., TeX compilation inside a create_* method is "tex_svg"), the
+    time outside of any phase is "other". The section is the running
+    animate_* method, "(setup)" or "(construct)" otherwise.
+
+    Usage: see time_phases().
+    """
+    PHASE_LIST = ["create", "tex_svg", "updater", "rasterize", "encode", "other"]
+
+    def __init__(self, target_list):
+        """
+        @param[in] target_list [(owner (class or module), attribute name, phase name)]. A phase name
+                               "section" makes the function a section.
+        """
+        self.__target_list   = target_list
+        self.__backup_list   = []
+        self.__phase_stack   = []
+        self.__section       = "(setup)"
+        self.__section_dict  = collections.OrderedDict()    # section -> {phase: seconds}
+        self.__last_time     = None
+
+
+    def charge(self):
+        """Charge the time since the last event to the current (section, phase).
+        """
+        cur_time = time.perf_counter()
+        if (self.__last_time is not None):
+            phase      = self.__phase_stack[-1] if (len(self.__phase_stack) > 0) else "other"
+            phase_dict = self.__section_dict.setdefault(self.__section, dict.fromkeys(self.PHASE_LIST, 0.0))
+            phase_dict[phase] += cur_time - self.__last_time
+        self.__last_time = cur_time
+
+
+    def set_section(self, section):
+        self.charge()
+        self.__section = section
+
+
+    def wrap(self, func, phase):
+        """Timed function of func as the phase.
+        """
+        timer = self
+
+        @functools.wraps(func)
+        def phase_wrapper(*args, **kwargs):
+            if (phase == "section"):
+                last_section = timer.__section
+                timer.set_section(func.__name__)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    timer.set_section(last_section)
+
+            timer.charge()
+            timer.__phase_stack.append(phase)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.charge()
+                timer.__phase_stack.pop()
+
+        return phase_wrapper
+
+
+    def install(self):
+        """Start timing: wrap the target functions.
+        """
+        for (owner, name, phase) in self.__target_list:
+            func = owner.__dict__[name] if (name in owner.__dict__) else getattr(owner, name)
+            self.__backup_list.append((owner, name, owner.__dict__.get(name)))
+            setattr(owner, name, self.wrap(func, phase))
+        self.__last_time = time.perf_counter()
+
+
+    def uninstall(self):
+        """Stop timing: restore the target functions.
+        """
+        self.charge()
+        for (owner, name, func) in reversed(self.__backup_list):
+            if (func is None):
+                delattr(owner, name)
+            else:
+                setattr(owner, name, func)
+        self.__backup_list = []
+
+
+    def get_report_dict(self):
+        """
+        @return {"sections": [{"section": name, "total": sec, "phase": {phase: sec}}], "phase": {phase: sec}, "total": sec}
+        """
+        total_phase  = dict.fromkeys(self.PHASE_LIST, 0.0)
+        section_list = []
+        for (section, phase_dict) in self.__section_dict.items():
+            section_list.append({"section": section, "total": sum(phase_dict.values()), "phase": dict(phase_dict)})
+            for (phase, sec) in phase_dict.items():
+                total_phase[phase] += sec
+        return {"sections": section_list, "phase": total_phase, "total": sum(total_phase.values())}
+
+
+def time_phases(scene_class):
+    """Scene class decorator: opt-in per phase timing report.
+
+    When the environment variable MANIM_PHASE_TIMING is set (or the
+    scene's phase_timing attribute), the scene's wall time is broken into
+    the phases of Phase_timer per animate_* section. The breakdown is
+    printed at the end of the render and written as JSON to the variable's
+    value as a file name ("1": <scene name>_phase_timing.json.)
+
+    Example:
+        @myutil.time_phases
+        class SomeScene(Scene):
+            ...
+
+        MANIM_PHASE_TIMING=timing.json python3 -m manim some_scene.py SomeScene
+    """
+    orig_setup     = scene_class.setup
+    orig_tear_down = scene_class.tear_down
+
+    @functools.wraps(orig_setup)
+    def setup(scene):
+        output_file = os.environ.get("MANIM_PHASE_TIMING") or getattr(scene, "phase_timing", None)
+        if (output_file):
+            if (output_file == "1"):
+                output_file = "{0}_phase_timing.json".format(scene.__class__.__name__)
+            scene.phase_timing_file = output_file
+            scene.phase_timer       = Phase_timer(get_phase_target_list(scene.__class__))
+            scene.phase_timer.install()
+        orig_setup(scene)
+        if (hasattr(scene, "phase_timer")):
+            scene.phase_timer.set_section("(construct)")
+
+    @functools.wraps(orig_tear_down)
+    def tear_down(scene):
+        orig_tear_down(scene)
+        timer = getattr(scene, "phase_timer", None)
+        if (timer is None):
+            return
+        timer.uninstall()
+        report = timer.get_report_dict()
+        report["scene"] = scene.__class__.__name__
+        with open(scene.phase_timing_file, "w") as f:
+            json.dump(report, f, indent=2)
+
+        print("phase timing of {0} [sec] (written to {1})".format(report["scene"], scene.phase_timing_file))
+        print("{0:<40}".format("section") + "".join(["{0:>10}".format(p) for p in Phase_timer.PHASE_LIST]))
+        for section in report["sections"] + [{"section": "total", "phase": report["phase"]}]:
+            print("{0:<40}".format(section["section"]) +
+                  "".join(["{0:>10.3f}".format(section["phase"][p]) for p in Phase_timer.PHASE_LIST]))
+
+    scene_class.setup     = setup
+    scene_class.tear_down = tear_down
+    return scene_class
+
+
+def get_phase_target_list(scene_class):
+    """Phase_timer's targets: the scene's create_* (create) and animate_* or
+    @animate_section (section) methods, and manim's functions of each phase.
+
+    @param[in] scene_class Scene subclass
+    @return    [(owner, attribute name, phase name)]
+    """
+    target_list = [(scene_class, name, ("create" if name.startswith("create_") else "section"))
+                   for name in dir(scene_class)
+                   if ((name.startswith(("create_", "animate_")) and callable(getattr(scene_class, name))) or
+                       getattr(getattr(scene_class, name), "is_animate_section", False))]
+    return target_list + [
+        (tex_mobject_module, "tex_to_svg_file", "tex_svg"),
+        (SVGMobject,         "__init__",        "tex_svg"),
+        (Mobject,            "update",          "updater"),
+        (CairoRenderer,      "update_frame",    "rasterize"),
+        (SceneFileWriter,    "write_frame",     "encode"),
+    ]
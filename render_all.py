@@ -0,0 +1,492 @@
+# -*- coding: utf-8; -*-
+#
+# Render all the example scenes in parallel
+#
+#    (C) 2020 Hitoshi Yamauchi
+#
+# New BSD License
+#
+# The scene modules use two manim flavors:
+#   * manimlib (3b1b manim 2019):   "from manimlib.imports import *"
+#   * community manim:              "from manim import *"
+# Each flavor usually lives in its own venv, give the python of each venv.
+#
+# Examples
+# Render all the scenes (preview quality) with 8 worker processes
+#   python3 render_all.py -j 8 --quality l \
+#     --manimlib_python ~/data/gitdata/manim/manim-venv/bin/python3 \
+#     --community_python ~/data/gitdata/manim/community/manim/.venv/bin/python3
+# Only the corner cube series, render even when nothing changed
+#   python3 render_all.py --force 202008_corner_cube_mirror
+# List the scenes
+#   python3 render_all.py --list
+# Render one long scene in 8 chunks (animation index ranges), then concatenate them
+#   python3 render_all.py --scene CornerReflection01 --chunk 8 -j 8
+#
+
+import os, sys
+import argparse, hashlib, json, time
+import ast, pyclbr, re, subprocess
+import concurrent.futures
+
+
+# directories that have scene modules (relative to this file)
+SCENE_DIR_LIST = [
+    "geometry",
+    "graph_2d",
+    "transform",
+    "202008_corner_cube_mirror",
+    "202011_medical_bayes",
+]
+
+# command line quality option of each flavor
+QUALITY_ARG = {
+    "manimlib":  {"l": ["-l"],  "m": ["-m"],  "h": ["--high_quality"]},
+    "community": {"l": ["-ql"], "m": ["-qm"], "h": ["-qh"]},
+}
+
+# arguments to run a scene with all the animations skipped (to count the animations)
+#   manimlib:  -s (save the last frame) skips the animations
+#   community: -s only stops writing the movie, -n skips the animations
+COUNT_PLAY_ARG = {
+    "manimlib":  ["-s"],
+    "community": ["-s", "-n", "999999"],
+}
+
+# default stamp file (hash of the rendered scene inputs)
+STAMP_FILE_NAME = ".render_all_stamp.json"
+
+
+class Scene_entry(object):
+    """A scene to render
+    """
+    def __init__(self, module_path, scene_name, flavor):
+        """
+        @param[in] module_path scene module file path
+        @param[in] scene_name  scene class name
+        @param[in] flavor      "manimlib" or "community"
+        """
+        self.module_path = module_path
+        self.scene_name  = scene_name
+        self.flavor      = flavor
+
+
+    def get_key(self):
+        """stamp key: module path (relative to the root) :: scene name"""
+        return "{0}::{1}".format(os.path.relpath(self.module_path, get_root_dir()), self.scene_name)
+
+
+def get_root_dir():
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def get_module_flavor(module_path):
+    """manim flavor of a module from its import line
+
+    @param[in] module_path module file path
+    @return    "manimlib", "community", or None (not a manim module)
+    """
+    tree = ast.parse(open(module_path, encoding="utf-8").read())
+    for node in tree.body:
+        if (isinstance(node, ast.ImportFrom)):
+            if (node.module == "manimlib.imports"):
+                return "manimlib"
+            if (node.module == "manim"):
+                return "community"
+    return None
+
+
+def find_scene_list(module_path):
+    """find the Scene subclasses in a module without importing it
+
+    A class is a scene when one of its base classes is named *Scene, or
+    is a scene class of the same module.
+
+    @param[in] module_path module file path
+    @return    list of scene class names (in the source order)
+    """
+    module_dir  = os.path.dirname(module_path)
+    module_name = os.path.splitext(os.path.basename(module_path))[0]
+    class_dict  = pyclbr.readmodule(module_name, path=[module_dir])
+    # readmodule also reports the classes of other modules in the path
+    class_list  = sorted([cls for cls in class_dict.values() if os.path.abspath(cls.file) == os.path.abspath(module_path)],
+                         key=lambda cls: cls.lineno)
+
+    def is_scene(cls):
+        for base in cls.super:
+            if (isinstance(base, str)):
+                if (base.endswith("Scene")):
+                    return True
+            elif (is_scene(base)):
+                return True
+        return False
+
+    return [cls.name for cls in class_list if is_scene(cls)]
+
+
+def find_scene_entry_list(dir_list):
+    """
+    @param[in] dir_list directories (relative to the root) to search
+    @return    list of Scene_entry
+    """
+    entry_list = []
+    for dir_name in dir_list:
+        scene_dir = os.path.join(get_root_dir(), dir_name)
+        for file_name in sorted(os.listdir(scene_dir)):
+            if ((not file_name.endswith(".py")) or (file_name == "myutil.py")):
+                continue
+            module_path = os.path.join(scene_dir, file_name)
+            flavor = get_module_flavor(module_path)
+            if (flavor is None):
+                continue
+            for scene_name in find_scene_list(module_path):
+                entry_list.append(Scene_entry(module_path, scene_name, flavor))
+    return entry_list
+
+
+def get_input_hash(entry, render_arg_list):
+    """hash of everything a scene rendering depends on
+
+    The module source, the local modules it imports (e.g., myutil.py),
+    the files under the svg directory, and the render arguments.
+
+    @param[in] entry           Scene_entry
+    @param[in] render_arg_list manim command line arguments
+    @return    hex digest
+    """
+    module_dir = os.path.dirname(entry.module_path)
+    path_list  = [entry.module_path]
+    tree = ast.parse(open(entry.module_path, encoding="utf-8").read())
+    for node in ast.walk(tree):
+        name_list = []
+        if (isinstance(node, ast.Import)):
+            name_list = [alias.name for alias in node.names]
+        elif (isinstance(node, ast.ImportFrom) and (node.module is not None)):
+            name_list = [node.module]
+        for name in name_list:
+            local_path = os.path.join(module_dir, name.replace(".", os.sep) + ".py")
+            if (os.path.exists(local_path)):
+                path_list.append(local_path)
+
+    svg_dir = os.path.join(module_dir, "svg")
+    if (os.path.isdir(svg_dir)):
+        for (dir_path, dir_names, file_names) in os.walk(svg_dir):
+            dir_names.sort()
+            path_list.extend([os.path.join(dir_path, file_name) for file_name in sorted(file_names)])
+
+    hasher = hashlib.sha256()
+    hasher.update(repr((entry.scene_name, render_arg_list)).encode("utf-8"))
+    for path in path_list:
+        hasher.update(os.path.relpath(path, module_dir).encode("utf-8"))
+        with open(path, "rb") as f:
+            hasher.update(f.read())
+    return hasher.hexdigest()
+
+
+def load_stamp(stamp_path):
+    if (not os.path.exists(stamp_path)):
+        return {}
+    try:
+        with open(stamp_path, encoding="utf-8") as f:
+            return json.load(f)
+    except ValueError:
+        print("Warning: broken stamp file {0}, ignored".format(stamp_path))
+        return {}
+
+
+def save_stamp(stamp_path, stamp_dict):
+    with open(stamp_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(stamp_dict, f, indent=1, sort_keys=True)
+    os.replace(stamp_path + ".tmp", stamp_path)
+
+
+def get_render_command(entry, python_dict, render_arg_list):
+    """
+    @param[in] entry           Scene_entry
+    @param[in] python_dict     flavor -> python interpreter
+    @param[in] render_arg_list manim command line arguments
+    @return    command argument list
+    """
+    return [python_dict[entry.flavor], "-m", "manim", os.path.basename(entry.module_path), entry.scene_name] + render_arg_list
+
+
+def render_scene(entry, command, log_path):
+    """render a scene in a subprocess (run in the module directory, for 'import myutil')
+
+    @param[in] entry    Scene_entry
+    @param[in] command  command argument list
+    @param[in] log_path stdout/stderr log file
+    @return    (return code, wall time [s])
+    """
+    start_time = time.time()
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        log_file.write(" ".join(command) + "\n")
+        log_file.flush()
+        ret = subprocess.call(command, cwd=os.path.dirname(entry.module_path),
+                              stdin=subprocess.DEVNULL, stdout=log_file, stderr=subprocess.STDOUT)
+    return (ret, time.time() - start_time)
+
+
+def count_scene_play(entry, command, log_path):
+    """count the play() (and wait()) calls of a scene
+
+    The scene runs with all the animations skipped, then manim reports
+    'Played N animations'.
+
+    @param[in] entry    Scene_entry
+    @param[in] command  render command without quality arguments
+    @param[in] log_path log file
+    @return    number of animations
+    """
+    (ret, wall_time) = render_scene(entry, command + COUNT_PLAY_ARG[entry.flavor], log_path)
+    if (ret != 0):
+        raise RuntimeError("cannot run {0} (see {1})".format(entry.get_key(), log_path))
+    match_list = re.findall(r"Played\s+(\d+)\s+animations", open(log_path, encoding="utf-8").read())
+    if (len(match_list) == 0):
+        raise RuntimeError("no animation count of {0} (see {1})".format(entry.get_key(), log_path))
+    return int(match_list[-1])
+
+
+def get_chunk_range_list(nb_play, nb_chunk):
+    """split the animation indices [0, nb_play) into chunks
+
+    Each chunk has at least two animations: community manim treats an
+    upper animation number 0 as 'no limit'.
+
+    @param[in] nb_play  number of animations
+    @param[in] nb_chunk number of chunks
+    @return    list of [start, end) animation index ranges
+    """
+    nb_chunk = max(1, min(nb_chunk, nb_play // 2))
+    bound_list = [(nb_play * i) // nb_chunk for i in range(nb_chunk + 1)]
+    return [(bound_list[i], bound_list[i + 1]) for i in range(nb_chunk)]
+
+
+def get_chunk_arg(flavor, start, end, is_last):
+    """-n argument of an animation range [start, end)
+
+    manimlib renders [start, end), community manim renders [start, end].
+    The last chunk has no end, it also renders the trailing frames.
+
+    @param[in] flavor  "manimlib" or "community"
+    @param[in] start   first animation index
+    @param[in] end     last animation index + 1
+    @param[in] is_last last chunk?
+    @return    argument list
+    """
+    if (is_last):
+        return ["-n", str(start)]
+    if (flavor == "community"):
+        end = end - 1
+    return ["-n", "{0},{1}".format(start, end)]
+
+
+def find_movie_file(entry, file_name):
+    """find a rendered movie (-o file_name) under the media directory of a scene
+
+    @param[in] entry     Scene_entry
+    @param[in] file_name movie file name without extension
+    @return    the newest movie file path, None if not found
+    """
+    found_list = []
+    media_dir  = os.path.join(os.path.dirname(entry.module_path), "media")
+    for (dir_path, dir_names, file_names) in os.walk(media_dir):
+        if ("partial_movie_files" in dir_path.split(os.sep)):
+            continue
+        for movie_name in file_names:
+            if (os.path.splitext(movie_name)[0] == file_name):
+                movie_path = os.path.join(dir_path, movie_name)
+                found_list.append((os.path.getmtime(movie_path), movie_path))
+    return max(found_list)[1] if found_list else None
+
+
+def concat_movie(movie_path_list, output_path, log_path):
+    """concatenate movies (same codec) without re-encoding
+
+    @param[in] movie_path_list movie files in the order
+    @param[in] output_path     output movie file
+    @param[in] log_path        ffmpeg log file
+    @return    ffmpeg return code
+    """
+    list_path = os.path.splitext(output_path)[0] + "_concat.txt"
+    with open(list_path, "w", encoding="utf-8") as f:
+        for movie_path in movie_path_list:
+            f.write("file '{0}'\n".format(os.path.abspath(movie_path).replace("'", "'\\''")))
+    command = ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+               "-i", list_path, "-c", "copy", output_path]
+    with open(log_path, "w", encoding="utf-8") as log_file:
+        log_file.write(" ".join(command) + "\n")
+        log_file.flush()
+        ret = subprocess.call(command, stdin=subprocess.DEVNULL, stdout=log_file, stderr=subprocess.STDOUT)
+    os.remove(list_path)
+    return ret
+
+
+def render_chunked(entry, python_dict, render_arg_list, nb_chunk, nb_job, log_dir):
+    """render a scene in animation index chunks in parallel, then concatenate them
+
+    Each chunk process runs the whole construct(), but skips (does not
+    render) the animations before its chunk and stops after it.
+
+    @param[in] entry           Scene_entry
+    @param[in] python_dict     flavor -> python interpreter
+    @param[in] render_arg_list manim command line arguments (quality, ...)
+    @param[in] nb_chunk        number of chunks
+    @param[in] nb_job          number of parallel processes
+    @param[in] log_dir         log directory
+    @return    0 when succeeded
+    """
+    log_base = os.path.join(log_dir, entry.get_key().replace(os.sep, "_").replace("::", "__"))
+    start_time = time.time()
+    nb_play = count_scene_play(entry, get_render_command(entry, python_dict, []), log_base + "_count.log")
+    chunk_range_list = get_chunk_range_list(nb_play, nb_chunk)
+    print("{0}: {1} animations, {2} chunks, {3} jobs ({4:.1f} [s] to count)".format(
+        entry.get_key(), nb_play, len(chunk_range_list), nb_job, time.time() - start_time))
+
+    result_list = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, nb_job)) as executor:
+        future_list = []
+        for (chunk_idx, (start, end)) in enumerate(chunk_range_list):
+            file_name = "{0}_chunk_{1:03d}".format(entry.scene_name, chunk_idx)
+            chunk_arg_list = get_chunk_arg(entry.flavor, start, end, chunk_idx == len(chunk_range_list) - 1)
+            command = get_render_command(entry, python_dict, render_arg_list + chunk_arg_list + ["-o", file_name])
+            log_path = "{0}_chunk_{1:03d}.log".format(log_base, chunk_idx)
+            future_list.append((executor.submit(render_scene, entry, command, log_path), file_name, log_path))
+
+        movie_path_list = []
+        for (future, file_name, log_path) in future_list:
+            (ret, wall_time) = future.result()
+            movie_path = find_movie_file(entry, file_name) if (ret == 0) else None
+            status = "ok" if (movie_path is not None) else "failed"
+            result_list.append((file_name, status, wall_time))
+            if (status == "failed"):
+                print("failed: {0} (see {1})".format(file_name, log_path))
+            movie_path_list.append(movie_path)
+
+    ret = 1
+    if (None not in movie_path_list):
+        output_path = os.path.join(os.path.dirname(movie_path_list[0]),
+                                   entry.scene_name + os.path.splitext(movie_path_list[0])[1])
+        ret = concat_movie(movie_path_list, output_path, log_base + "_concat.log")
+        if (ret == 0):
+            print("File ready at {0}".format(output_path))
+        else:
+            print("failed: concatenation (see {0}_concat.log)".format(log_base))
+
+    print_summary(result_list, time.time() - start_time)
+    return 0 if (ret == 0) else 1
+
+
+def print_summary(result_list, elapsed_time):
+    """print the per-scene wall time summary
+
+    @param[in] result_list  list of (key, status, wall time)
+    @param[in] elapsed_time total elapsed time
+    """
+    key_width = max([len(result[0]) for result in result_list] + [5])
+    print()
+    print("{0:<{1}}  {2:<7}  {3:>9}".format("scene", key_width, "status", "time [s]"))
+    for (key, status, wall_time) in sorted(result_list, key=lambda result: -result[2]):
+        print("{0:<{1}}  {2:<7}  {3:9.1f}".format(key, key_width, status, wall_time))
+
+    render_time = sum([result[2] for result in result_list])
+    print("rendered: {0}, skipped: {1}, failed: {2}".format(
+        len([result for result in result_list if result[1] == "ok"]),
+        len([result for result in result_list if result[1] == "skip"]),
+        len([result for result in result_list if result[1] == "failed"])))
+    print("sum of the scene time: {0:.1f} [s], elapsed: {1:.1f} [s], speedup: {2:.2f}".format(
+        render_time, elapsed_time, render_time / elapsed_time if elapsed_time > 0 else 0.0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="render all the example scenes in parallel")
+    parser.add_argument("dir", nargs="*", default=SCENE_DIR_LIST,
+                        help="scene directories (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of parallel renderings (default: cpu count)")
+    parser.add_argument("--quality", choices=["l", "m", "h"], default="l",
+                        help="render quality (default: l)")
+    parser.add_argument("--resolution", default=None,
+                        help="e.g., 360,640 (default: the quality default)")
+    parser.add_argument("--scene", action="append", default=None,
+                        help="render only this scene (repeatable)")
+    parser.add_argument("--chunk", type=int, default=None,
+                        help="render one scene (see --scene) in this number of chunks in parallel")
+    parser.add_argument("--force", action="store_true",
+                        help="render even when the inputs are not changed")
+    parser.add_argument("--list", action="store_true",
+                        help="list the scenes and exit")
+    parser.add_argument("--manimlib_python", default=sys.executable,
+                        help="python of the manimlib (3b1b) venv")
+    parser.add_argument("--community_python", default=sys.executable,
+                        help="python of the community manim venv")
+    parser.add_argument("--stamp", default=os.path.join(get_root_dir(), STAMP_FILE_NAME),
+                        help="stamp file of the rendered scenes")
+    parser.add_argument("--log_dir", default=os.path.join(get_root_dir(), "render_log"),
+                        help="directory of the rendering logs")
+    args = parser.parse_args()
+
+    entry_list = find_scene_entry_list(args.dir)
+    if (args.scene is not None):
+        entry_list = [entry for entry in entry_list if entry.scene_name in args.scene]
+    if (args.list):
+        for entry in entry_list:
+            print("{0:<10} {1}".format(entry.flavor, entry.get_key()))
+        return 0
+
+    python_dict = {"manimlib": args.manimlib_python, "community": args.community_python}
+    os.makedirs(args.log_dir, exist_ok=True)
+
+    if (args.chunk is not None):
+        if (len(entry_list) != 1):
+            parser.error("--chunk needs exactly one scene, found {0} (use --scene)".format(len(entry_list)))
+        entry = entry_list[0]
+        render_arg_list = list(QUALITY_ARG[entry.flavor][args.quality])
+        if (args.resolution is not None):
+            render_arg_list += ["--resolution", args.resolution]
+        return render_chunked(entry, python_dict, render_arg_list, args.chunk, args.jobs, args.log_dir)
+
+    stamp_dict  = load_stamp(args.stamp)
+
+    result_list = []
+    job_list    = []
+    for entry in entry_list:
+        render_arg_list = list(QUALITY_ARG[entry.flavor][args.quality])
+        if (args.resolution is not None):
+            render_arg_list += ["--resolution", args.resolution]
+        input_hash = get_input_hash(entry, render_arg_list)
+        if ((not args.force) and (stamp_dict.get(entry.get_key()) == input_hash)):
+            result_list.append((entry.get_key(), "skip", 0.0))
+            continue
+        job_list.append((entry, get_render_command(entry, python_dict, render_arg_list), input_hash))
+
+    print("{0} scenes, {1} to render, {2} jobs".format(len(entry_list), len(job_list), args.jobs))
+    start_time = time.time()
+    # The rendering runs in the subprocesses, the threads only wait.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        future_dict = {}
+        for (entry, command, input_hash) in job_list:
+            log_path = os.path.join(args.log_dir, entry.get_key().replace(os.sep, "_").replace("::", "__") + ".log")
+            future = executor.submit(render_scene, entry, command, log_path)
+            future_dict[future] = (entry, input_hash, log_path)
+
+        for future in concurrent.futures.as_completed(future_dict):
+            (entry, input_hash, log_path) = future_dict[future]
+            (ret, wall_time) = future.result()
+            if (ret == 0):
+                stamp_dict[entry.get_key()] = input_hash
+                save_stamp(args.stamp, stamp_dict)
+                result_list.append((entry.get_key(), "ok", wall_time))
+            else:
+                stamp_dict.pop(entry.get_key(), None)
+                result_list.append((entry.get_key(), "failed", wall_time))
+                print("failed: {0} (see {1})".format(entry.get_key(), log_path))
+            print("[{0}/{1}] {2} {3:.1f} [s]".format(
+                len([result for result in result_list if result[1] != "skip"]), len(job_list), entry.get_key(), wall_time))
+
+    print_summary(result_list, time.time() - start_time)
+    return 1 if [result for result in result_list if result[1] == "failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())